@@ -19,8 +19,7 @@ class Accelerometer(Phidget):
 		self._onAccelerationChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -45,8 +44,7 @@ class Accelerometer(Phidget):
 			self._onAccelerationChange = self._AccelerationChangeFactory(self._localAccelerationChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_setOnAccelerationChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_setOnAccelerationChangeHandler
 			res = __func(self.handle, self._onAccelerationChange, None)
 		except RuntimeError:
 			self._AccelerationChange = None
@@ -56,8 +54,7 @@ class Accelerometer(Phidget):
 		_Acceleration = (ctypes.c_double * 3)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getAcceleration
 			result = __func(self.handle, ctypes.byref(_Acceleration))
 		except RuntimeError:
 			raise
@@ -71,8 +68,7 @@ class Accelerometer(Phidget):
 		_MinAcceleration = (ctypes.c_double * 3)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getMinAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getMinAcceleration
 			result = __func(self.handle, ctypes.byref(_MinAcceleration))
 		except RuntimeError:
 			raise
@@ -86,8 +82,7 @@ class Accelerometer(Phidget):
 		_MaxAcceleration = (ctypes.c_double * 3)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getMaxAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getMaxAcceleration
 			result = __func(self.handle, ctypes.byref(_MaxAcceleration))
 		except RuntimeError:
 			raise
@@ -101,8 +96,7 @@ class Accelerometer(Phidget):
 		_AccelerationChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getAccelerationChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getAccelerationChangeTrigger
 			result = __func(self.handle, ctypes.byref(_AccelerationChangeTrigger))
 		except RuntimeError:
 			raise
@@ -116,8 +110,7 @@ class Accelerometer(Phidget):
 		_AccelerationChangeTrigger = ctypes.c_double(AccelerationChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_setAccelerationChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_setAccelerationChangeTrigger
 			result = __func(self.handle, _AccelerationChangeTrigger)
 		except RuntimeError:
 			raise
@@ -130,8 +123,7 @@ class Accelerometer(Phidget):
 		_MinAccelerationChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getMinAccelerationChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getMinAccelerationChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinAccelerationChangeTrigger))
 		except RuntimeError:
 			raise
@@ -145,8 +137,7 @@ class Accelerometer(Phidget):
 		_MaxAccelerationChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getMaxAccelerationChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getMaxAccelerationChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxAccelerationChangeTrigger))
 		except RuntimeError:
 			raise
@@ -160,8 +151,7 @@ class Accelerometer(Phidget):
 		_AxisCount = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getAxisCount
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getAxisCount
 			result = __func(self.handle, ctypes.byref(_AxisCount))
 		except RuntimeError:
 			raise
@@ -175,8 +165,7 @@ class Accelerometer(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -190,8 +179,7 @@ class Accelerometer(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -204,8 +192,7 @@ class Accelerometer(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -219,8 +206,7 @@ class Accelerometer(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -234,8 +220,7 @@ class Accelerometer(Phidget):
 		_Timestamp = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetAccelerometer_getTimestamp
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetAccelerometer_getTimestamp
 			result = __func(self.handle, ctypes.byref(_Timestamp))
 		except RuntimeError:
 			raise
@@ -33,8 +33,7 @@ class BLDCMotor(Phidget):
 		self._onVelocityUpdate = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -59,8 +58,7 @@ class BLDCMotor(Phidget):
 			self._onBrakingStrengthChange = self._BrakingStrengthChangeFactory(self._localBrakingStrengthChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_setOnBrakingStrengthChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_setOnBrakingStrengthChangeHandler
 			res = __func(self.handle, self._onBrakingStrengthChange, None)
 		except RuntimeError:
 			self._BrakingStrengthChange = None
@@ -80,8 +78,7 @@ class BLDCMotor(Phidget):
 			self._onPositionChange = self._PositionChangeFactory(self._localPositionChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_setOnPositionChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_setOnPositionChangeHandler
 			res = __func(self.handle, self._onPositionChange, None)
 		except RuntimeError:
 			self._PositionChange = None
@@ -101,8 +98,7 @@ class BLDCMotor(Phidget):
 			self._onVelocityUpdate = self._VelocityUpdateFactory(self._localVelocityUpdateEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_setOnVelocityUpdateHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_setOnVelocityUpdateHandler
 			res = __func(self.handle, self._onVelocityUpdate, None)
 		except RuntimeError:
 			self._VelocityUpdate = None
@@ -112,8 +108,7 @@ class BLDCMotor(Phidget):
 		_Acceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getAcceleration
 			result = __func(self.handle, ctypes.byref(_Acceleration))
 		except RuntimeError:
 			raise
@@ -127,8 +122,7 @@ class BLDCMotor(Phidget):
 		_Acceleration = ctypes.c_double(Acceleration)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_setAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_setAcceleration
 			result = __func(self.handle, _Acceleration)
 		except RuntimeError:
 			raise
@@ -141,8 +135,7 @@ class BLDCMotor(Phidget):
 		_MinAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMinAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMinAcceleration
 			result = __func(self.handle, ctypes.byref(_MinAcceleration))
 		except RuntimeError:
 			raise
@@ -156,8 +149,7 @@ class BLDCMotor(Phidget):
 		_MaxAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMaxAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMaxAcceleration
 			result = __func(self.handle, ctypes.byref(_MaxAcceleration))
 		except RuntimeError:
 			raise
@@ -171,8 +163,7 @@ class BLDCMotor(Phidget):
 		_BrakingStrength = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getBrakingStrength
 			result = __func(self.handle, ctypes.byref(_BrakingStrength))
 		except RuntimeError:
 			raise
@@ -186,8 +177,7 @@ class BLDCMotor(Phidget):
 		_MinBrakingStrength = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMinBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMinBrakingStrength
 			result = __func(self.handle, ctypes.byref(_MinBrakingStrength))
 		except RuntimeError:
 			raise
@@ -201,8 +191,7 @@ class BLDCMotor(Phidget):
 		_MaxBrakingStrength = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMaxBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMaxBrakingStrength
 			result = __func(self.handle, ctypes.byref(_MaxBrakingStrength))
 		except RuntimeError:
 			raise
@@ -216,8 +205,7 @@ class BLDCMotor(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -231,8 +219,7 @@ class BLDCMotor(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -245,8 +232,7 @@ class BLDCMotor(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -260,8 +246,7 @@ class BLDCMotor(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -275,8 +260,7 @@ class BLDCMotor(Phidget):
 		_Position = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getPosition
 			result = __func(self.handle, ctypes.byref(_Position))
 		except RuntimeError:
 			raise
@@ -290,8 +274,7 @@ class BLDCMotor(Phidget):
 		_MinPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMinPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMinPosition
 			result = __func(self.handle, ctypes.byref(_MinPosition))
 		except RuntimeError:
 			raise
@@ -305,8 +288,7 @@ class BLDCMotor(Phidget):
 		_MaxPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMaxPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMaxPosition
 			result = __func(self.handle, ctypes.byref(_MaxPosition))
 		except RuntimeError:
 			raise
@@ -320,8 +302,7 @@ class BLDCMotor(Phidget):
 		_positionOffset = ctypes.c_double(positionOffset)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_addPositionOffset
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_addPositionOffset
 			result = __func(self.handle, _positionOffset)
 		except RuntimeError:
 			raise
@@ -334,8 +315,7 @@ class BLDCMotor(Phidget):
 		_RescaleFactor = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getRescaleFactor
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getRescaleFactor
 			result = __func(self.handle, ctypes.byref(_RescaleFactor))
 		except RuntimeError:
 			raise
@@ -349,8 +329,7 @@ class BLDCMotor(Phidget):
 		_RescaleFactor = ctypes.c_double(RescaleFactor)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_setRescaleFactor
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_setRescaleFactor
 			result = __func(self.handle, _RescaleFactor)
 		except RuntimeError:
 			raise
@@ -363,8 +342,7 @@ class BLDCMotor(Phidget):
 		_StallVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getStallVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getStallVelocity
 			result = __func(self.handle, ctypes.byref(_StallVelocity))
 		except RuntimeError:
 			raise
@@ -378,8 +356,7 @@ class BLDCMotor(Phidget):
 		_StallVelocity = ctypes.c_double(StallVelocity)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_setStallVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_setStallVelocity
 			result = __func(self.handle, _StallVelocity)
 		except RuntimeError:
 			raise
@@ -392,8 +369,7 @@ class BLDCMotor(Phidget):
 		_MinStallVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMinStallVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMinStallVelocity
 			result = __func(self.handle, ctypes.byref(_MinStallVelocity))
 		except RuntimeError:
 			raise
@@ -407,8 +383,7 @@ class BLDCMotor(Phidget):
 		_MaxStallVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMaxStallVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMaxStallVelocity
 			result = __func(self.handle, ctypes.byref(_MaxStallVelocity))
 		except RuntimeError:
 			raise
@@ -422,8 +397,7 @@ class BLDCMotor(Phidget):
 		_TargetBrakingStrength = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getTargetBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getTargetBrakingStrength
 			result = __func(self.handle, ctypes.byref(_TargetBrakingStrength))
 		except RuntimeError:
 			raise
@@ -437,8 +411,7 @@ class BLDCMotor(Phidget):
 		_TargetBrakingStrength = ctypes.c_double(TargetBrakingStrength)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_setTargetBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_setTargetBrakingStrength
 			result = __func(self.handle, _TargetBrakingStrength)
 		except RuntimeError:
 			raise
@@ -451,8 +424,7 @@ class BLDCMotor(Phidget):
 		_TargetVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getTargetVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getTargetVelocity
 			result = __func(self.handle, ctypes.byref(_TargetVelocity))
 		except RuntimeError:
 			raise
@@ -466,8 +438,7 @@ class BLDCMotor(Phidget):
 		_TargetVelocity = ctypes.c_double(TargetVelocity)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_setTargetVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_setTargetVelocity
 			result = __func(self.handle, _TargetVelocity)
 		except RuntimeError:
 			raise
@@ -480,8 +451,7 @@ class BLDCMotor(Phidget):
 		_Velocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getVelocity
 			result = __func(self.handle, ctypes.byref(_Velocity))
 		except RuntimeError:
 			raise
@@ -495,8 +465,7 @@ class BLDCMotor(Phidget):
 		_MinVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMinVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMinVelocity
 			result = __func(self.handle, ctypes.byref(_MinVelocity))
 		except RuntimeError:
 			raise
@@ -510,8 +479,7 @@ class BLDCMotor(Phidget):
 		_MaxVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetBLDCMotor_getMaxVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetBLDCMotor_getMaxVelocity
 			result = __func(self.handle, ctypes.byref(_MaxVelocity))
 		except RuntimeError:
 			raise
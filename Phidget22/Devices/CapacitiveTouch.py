@@ -26,8 +26,7 @@ class CapacitiveTouch(Phidget):
 		self._onTouchEnd = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -52,8 +51,7 @@ class CapacitiveTouch(Phidget):
 			self._onTouch = self._TouchFactory(self._localTouchEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_setOnTouchHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_setOnTouchHandler
 			res = __func(self.handle, self._onTouch, None)
 		except RuntimeError:
 			self._Touch = None
@@ -73,8 +71,7 @@ class CapacitiveTouch(Phidget):
 			self._onTouchEnd = self._TouchEndFactory(self._localTouchEndEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_setOnTouchEndHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_setOnTouchEndHandler
 			res = __func(self.handle, self._onTouchEnd, None)
 		except RuntimeError:
 			self._TouchEnd = None
@@ -84,8 +81,7 @@ class CapacitiveTouch(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -99,8 +95,7 @@ class CapacitiveTouch(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -113,8 +108,7 @@ class CapacitiveTouch(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -128,8 +122,7 @@ class CapacitiveTouch(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -143,8 +136,7 @@ class CapacitiveTouch(Phidget):
 		_IsTouched = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getIsTouched
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getIsTouched
 			result = __func(self.handle, ctypes.byref(_IsTouched))
 		except RuntimeError:
 			raise
@@ -158,8 +150,7 @@ class CapacitiveTouch(Phidget):
 		_Sensitivity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getSensitivity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getSensitivity
 			result = __func(self.handle, ctypes.byref(_Sensitivity))
 		except RuntimeError:
 			raise
@@ -173,8 +164,7 @@ class CapacitiveTouch(Phidget):
 		_Sensitivity = ctypes.c_double(Sensitivity)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_setSensitivity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_setSensitivity
 			result = __func(self.handle, _Sensitivity)
 		except RuntimeError:
 			raise
@@ -187,8 +177,7 @@ class CapacitiveTouch(Phidget):
 		_MinSensitivity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getMinSensitivity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getMinSensitivity
 			result = __func(self.handle, ctypes.byref(_MinSensitivity))
 		except RuntimeError:
 			raise
@@ -202,8 +191,7 @@ class CapacitiveTouch(Phidget):
 		_MaxSensitivity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getMaxSensitivity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getMaxSensitivity
 			result = __func(self.handle, ctypes.byref(_MaxSensitivity))
 		except RuntimeError:
 			raise
@@ -217,8 +205,7 @@ class CapacitiveTouch(Phidget):
 		_TouchValue = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getTouchValue
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getTouchValue
 			result = __func(self.handle, ctypes.byref(_TouchValue))
 		except RuntimeError:
 			raise
@@ -232,8 +219,7 @@ class CapacitiveTouch(Phidget):
 		_MinTouchValue = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getMinTouchValue
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getMinTouchValue
 			result = __func(self.handle, ctypes.byref(_MinTouchValue))
 		except RuntimeError:
 			raise
@@ -247,8 +233,7 @@ class CapacitiveTouch(Phidget):
 		_MaxTouchValue = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getMaxTouchValue
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getMaxTouchValue
 			result = __func(self.handle, ctypes.byref(_MaxTouchValue))
 		except RuntimeError:
 			raise
@@ -262,8 +247,7 @@ class CapacitiveTouch(Phidget):
 		_TouchValueChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getTouchValueChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getTouchValueChangeTrigger
 			result = __func(self.handle, ctypes.byref(_TouchValueChangeTrigger))
 		except RuntimeError:
 			raise
@@ -277,8 +261,7 @@ class CapacitiveTouch(Phidget):
 		_TouchValueChangeTrigger = ctypes.c_double(TouchValueChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_setTouchValueChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_setTouchValueChangeTrigger
 			result = __func(self.handle, _TouchValueChangeTrigger)
 		except RuntimeError:
 			raise
@@ -291,8 +274,7 @@ class CapacitiveTouch(Phidget):
 		_MinTouchValueChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getMinTouchValueChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getMinTouchValueChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinTouchValueChangeTrigger))
 		except RuntimeError:
 			raise
@@ -306,8 +288,7 @@ class CapacitiveTouch(Phidget):
 		_MaxTouchValueChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCapacitiveTouch_getMaxTouchValueChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCapacitiveTouch_getMaxTouchValueChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxTouchValueChangeTrigger))
 		except RuntimeError:
 			raise
@@ -20,8 +20,7 @@ class CurrentInput(Phidget):
 		self._onCurrentChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -46,8 +45,7 @@ class CurrentInput(Phidget):
 			self._onCurrentChange = self._CurrentChangeFactory(self._localCurrentChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_setOnCurrentChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_setOnCurrentChangeHandler
 			res = __func(self.handle, self._onCurrentChange, None)
 		except RuntimeError:
 			self._CurrentChange = None
@@ -57,8 +55,7 @@ class CurrentInput(Phidget):
 		_Current = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getCurrent
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getCurrent
 			result = __func(self.handle, ctypes.byref(_Current))
 		except RuntimeError:
 			raise
@@ -72,8 +69,7 @@ class CurrentInput(Phidget):
 		_MinCurrent = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getMinCurrent
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getMinCurrent
 			result = __func(self.handle, ctypes.byref(_MinCurrent))
 		except RuntimeError:
 			raise
@@ -87,8 +83,7 @@ class CurrentInput(Phidget):
 		_MaxCurrent = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getMaxCurrent
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getMaxCurrent
 			result = __func(self.handle, ctypes.byref(_MaxCurrent))
 		except RuntimeError:
 			raise
@@ -102,8 +97,7 @@ class CurrentInput(Phidget):
 		_CurrentChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getCurrentChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getCurrentChangeTrigger
 			result = __func(self.handle, ctypes.byref(_CurrentChangeTrigger))
 		except RuntimeError:
 			raise
@@ -117,8 +111,7 @@ class CurrentInput(Phidget):
 		_CurrentChangeTrigger = ctypes.c_double(CurrentChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_setCurrentChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_setCurrentChangeTrigger
 			result = __func(self.handle, _CurrentChangeTrigger)
 		except RuntimeError:
 			raise
@@ -131,8 +124,7 @@ class CurrentInput(Phidget):
 		_MinCurrentChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getMinCurrentChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getMinCurrentChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinCurrentChangeTrigger))
 		except RuntimeError:
 			raise
@@ -146,8 +138,7 @@ class CurrentInput(Phidget):
 		_MaxCurrentChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getMaxCurrentChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getMaxCurrentChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxCurrentChangeTrigger))
 		except RuntimeError:
 			raise
@@ -161,8 +152,7 @@ class CurrentInput(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -176,8 +166,7 @@ class CurrentInput(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -190,8 +179,7 @@ class CurrentInput(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -205,8 +193,7 @@ class CurrentInput(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -220,8 +207,7 @@ class CurrentInput(Phidget):
 		_PowerSupply = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_getPowerSupply
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_getPowerSupply
 			result = __func(self.handle, ctypes.byref(_PowerSupply))
 		except RuntimeError:
 			raise
@@ -235,8 +221,7 @@ class CurrentInput(Phidget):
 		_PowerSupply = ctypes.c_int(PowerSupply)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetCurrentInput_setPowerSupply
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetCurrentInput_setPowerSupply
 			result = __func(self.handle, _PowerSupply)
 		except RuntimeError:
 			raise
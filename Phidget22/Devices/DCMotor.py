@@ -34,8 +34,7 @@ class DCMotor(Phidget):
 		self._onVelocityUpdate = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -60,8 +59,7 @@ class DCMotor(Phidget):
 			self._onBackEMFChange = self._BackEMFChangeFactory(self._localBackEMFChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setOnBackEMFChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setOnBackEMFChangeHandler
 			res = __func(self.handle, self._onBackEMFChange, None)
 		except RuntimeError:
 			self._BackEMFChange = None
@@ -81,8 +79,7 @@ class DCMotor(Phidget):
 			self._onBrakingStrengthChange = self._BrakingStrengthChangeFactory(self._localBrakingStrengthChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setOnBrakingStrengthChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setOnBrakingStrengthChangeHandler
 			res = __func(self.handle, self._onBrakingStrengthChange, None)
 		except RuntimeError:
 			self._BrakingStrengthChange = None
@@ -102,8 +99,7 @@ class DCMotor(Phidget):
 			self._onVelocityUpdate = self._VelocityUpdateFactory(self._localVelocityUpdateEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setOnVelocityUpdateHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setOnVelocityUpdateHandler
 			res = __func(self.handle, self._onVelocityUpdate, None)
 		except RuntimeError:
 			self._VelocityUpdate = None
@@ -113,8 +109,7 @@ class DCMotor(Phidget):
 		_Acceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getAcceleration
 			result = __func(self.handle, ctypes.byref(_Acceleration))
 		except RuntimeError:
 			raise
@@ -128,8 +123,7 @@ class DCMotor(Phidget):
 		_Acceleration = ctypes.c_double(Acceleration)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setAcceleration
 			result = __func(self.handle, _Acceleration)
 		except RuntimeError:
 			raise
@@ -142,8 +136,7 @@ class DCMotor(Phidget):
 		_MinAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMinAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMinAcceleration
 			result = __func(self.handle, ctypes.byref(_MinAcceleration))
 		except RuntimeError:
 			raise
@@ -157,8 +150,7 @@ class DCMotor(Phidget):
 		_MaxAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMaxAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMaxAcceleration
 			result = __func(self.handle, ctypes.byref(_MaxAcceleration))
 		except RuntimeError:
 			raise
@@ -172,8 +164,7 @@ class DCMotor(Phidget):
 		_BackEMF = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getBackEMF
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getBackEMF
 			result = __func(self.handle, ctypes.byref(_BackEMF))
 		except RuntimeError:
 			raise
@@ -187,8 +178,7 @@ class DCMotor(Phidget):
 		_BackEMFSensingState = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getBackEMFSensingState
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getBackEMFSensingState
 			result = __func(self.handle, ctypes.byref(_BackEMFSensingState))
 		except RuntimeError:
 			raise
@@ -202,8 +192,7 @@ class DCMotor(Phidget):
 		_BackEMFSensingState = ctypes.c_int(BackEMFSensingState)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setBackEMFSensingState
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setBackEMFSensingState
 			result = __func(self.handle, _BackEMFSensingState)
 		except RuntimeError:
 			raise
@@ -216,8 +205,7 @@ class DCMotor(Phidget):
 		_BrakingStrength = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getBrakingStrength
 			result = __func(self.handle, ctypes.byref(_BrakingStrength))
 		except RuntimeError:
 			raise
@@ -231,8 +219,7 @@ class DCMotor(Phidget):
 		_MinBrakingStrength = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMinBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMinBrakingStrength
 			result = __func(self.handle, ctypes.byref(_MinBrakingStrength))
 		except RuntimeError:
 			raise
@@ -246,8 +233,7 @@ class DCMotor(Phidget):
 		_MaxBrakingStrength = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMaxBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMaxBrakingStrength
 			result = __func(self.handle, ctypes.byref(_MaxBrakingStrength))
 		except RuntimeError:
 			raise
@@ -261,8 +247,7 @@ class DCMotor(Phidget):
 		_CurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getCurrentLimit
 			result = __func(self.handle, ctypes.byref(_CurrentLimit))
 		except RuntimeError:
 			raise
@@ -276,8 +261,7 @@ class DCMotor(Phidget):
 		_CurrentLimit = ctypes.c_double(CurrentLimit)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setCurrentLimit
 			result = __func(self.handle, _CurrentLimit)
 		except RuntimeError:
 			raise
@@ -290,8 +274,7 @@ class DCMotor(Phidget):
 		_MinCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMinCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMinCurrentLimit
 			result = __func(self.handle, ctypes.byref(_MinCurrentLimit))
 		except RuntimeError:
 			raise
@@ -305,8 +288,7 @@ class DCMotor(Phidget):
 		_MaxCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMaxCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMaxCurrentLimit
 			result = __func(self.handle, ctypes.byref(_MaxCurrentLimit))
 		except RuntimeError:
 			raise
@@ -320,8 +302,7 @@ class DCMotor(Phidget):
 		_CurrentRegulatorGain = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getCurrentRegulatorGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getCurrentRegulatorGain
 			result = __func(self.handle, ctypes.byref(_CurrentRegulatorGain))
 		except RuntimeError:
 			raise
@@ -335,8 +316,7 @@ class DCMotor(Phidget):
 		_CurrentRegulatorGain = ctypes.c_double(CurrentRegulatorGain)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setCurrentRegulatorGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setCurrentRegulatorGain
 			result = __func(self.handle, _CurrentRegulatorGain)
 		except RuntimeError:
 			raise
@@ -349,8 +329,7 @@ class DCMotor(Phidget):
 		_MinCurrentRegulatorGain = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMinCurrentRegulatorGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMinCurrentRegulatorGain
 			result = __func(self.handle, ctypes.byref(_MinCurrentRegulatorGain))
 		except RuntimeError:
 			raise
@@ -364,8 +343,7 @@ class DCMotor(Phidget):
 		_MaxCurrentRegulatorGain = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMaxCurrentRegulatorGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMaxCurrentRegulatorGain
 			result = __func(self.handle, ctypes.byref(_MaxCurrentRegulatorGain))
 		except RuntimeError:
 			raise
@@ -379,8 +357,7 @@ class DCMotor(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -394,8 +371,7 @@ class DCMotor(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -408,8 +384,7 @@ class DCMotor(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -423,8 +398,7 @@ class DCMotor(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -438,8 +412,7 @@ class DCMotor(Phidget):
 		_FanMode = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getFanMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getFanMode
 			result = __func(self.handle, ctypes.byref(_FanMode))
 		except RuntimeError:
 			raise
@@ -453,8 +426,7 @@ class DCMotor(Phidget):
 		_FanMode = ctypes.c_int(FanMode)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setFanMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setFanMode
 			result = __func(self.handle, _FanMode)
 		except RuntimeError:
 			raise
@@ -467,8 +439,7 @@ class DCMotor(Phidget):
 		_TargetBrakingStrength = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getTargetBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getTargetBrakingStrength
 			result = __func(self.handle, ctypes.byref(_TargetBrakingStrength))
 		except RuntimeError:
 			raise
@@ -482,8 +453,7 @@ class DCMotor(Phidget):
 		_TargetBrakingStrength = ctypes.c_double(TargetBrakingStrength)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setTargetBrakingStrength
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setTargetBrakingStrength
 			result = __func(self.handle, _TargetBrakingStrength)
 		except RuntimeError:
 			raise
@@ -496,8 +466,7 @@ class DCMotor(Phidget):
 		_TargetVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getTargetVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getTargetVelocity
 			result = __func(self.handle, ctypes.byref(_TargetVelocity))
 		except RuntimeError:
 			raise
@@ -511,8 +480,7 @@ class DCMotor(Phidget):
 		_TargetVelocity = ctypes.c_double(TargetVelocity)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_setTargetVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_setTargetVelocity
 			result = __func(self.handle, _TargetVelocity)
 		except RuntimeError:
 			raise
@@ -525,8 +493,7 @@ class DCMotor(Phidget):
 		_Velocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getVelocity
 			result = __func(self.handle, ctypes.byref(_Velocity))
 		except RuntimeError:
 			raise
@@ -540,8 +507,7 @@ class DCMotor(Phidget):
 		_MinVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMinVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMinVelocity
 			result = __func(self.handle, ctypes.byref(_MinVelocity))
 		except RuntimeError:
 			raise
@@ -555,8 +521,7 @@ class DCMotor(Phidget):
 		_MaxVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDCMotor_getMaxVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDCMotor_getMaxVelocity
 			result = __func(self.handle, ctypes.byref(_MaxVelocity))
 		except RuntimeError:
 			raise
@@ -33,8 +33,7 @@ class Dictionary(Phidget):
 		self._onUpdate = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -61,8 +60,7 @@ class Dictionary(Phidget):
 			self._onAdd = self._AddFactory(self._localAddEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_setOnAddHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_setOnAddHandler
 			res = __func(self.handle, self._onAdd, None)
 		except RuntimeError:
 			self._Add = None
@@ -83,8 +81,7 @@ class Dictionary(Phidget):
 			self._onRemove = self._RemoveFactory(self._localRemoveEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_setOnRemoveHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_setOnRemoveHandler
 			res = __func(self.handle, self._onRemove, None)
 		except RuntimeError:
 			self._Remove = None
@@ -106,8 +103,7 @@ class Dictionary(Phidget):
 			self._onUpdate = self._UpdateFactory(self._localUpdateEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_setOnUpdateHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_setOnUpdateHandler
 			res = __func(self.handle, self._onUpdate, None)
 		except RuntimeError:
 			self._Update = None
@@ -118,8 +114,7 @@ class Dictionary(Phidget):
 		_value = ctypes.create_string_buffer(value.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_add
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_add
 			result = __func(self.handle, ctypes.byref(_key), ctypes.byref(_value))
 		except RuntimeError:
 			raise
@@ -130,8 +125,7 @@ class Dictionary(Phidget):
 
 	def removeAll(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_removeAll
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_removeAll
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -146,8 +140,7 @@ class Dictionary(Phidget):
 		_valueLen = ctypes.c_int32(65536)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_get
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_get
 			result = __func(self.handle, ctypes.byref(_key), ctypes.byref(_value), _valueLen)
 		except RuntimeError:
 			raise
@@ -161,8 +154,7 @@ class Dictionary(Phidget):
 		_key = ctypes.create_string_buffer(key.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_remove
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_remove
 			result = __func(self.handle, ctypes.byref(_key))
 		except RuntimeError:
 			raise
@@ -177,8 +169,7 @@ class Dictionary(Phidget):
 		_keyListLen = ctypes.c_int32(65536)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_scan
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_scan
 			result = __func(self.handle, ctypes.byref(_start), ctypes.byref(_keyList), _keyListLen)
 		except RuntimeError:
 			raise
@@ -193,8 +184,7 @@ class Dictionary(Phidget):
 		_value = ctypes.create_string_buffer(value.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_set
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_set
 			result = __func(self.handle, ctypes.byref(_key), ctypes.byref(_value))
 		except RuntimeError:
 			raise
@@ -208,8 +198,7 @@ class Dictionary(Phidget):
 		_value = ctypes.create_string_buffer(value.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDictionary_update
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDictionary_update
 			result = __func(self.handle, ctypes.byref(_key), ctypes.byref(_value))
 		except RuntimeError:
 			raise
@@ -21,8 +21,7 @@ class DigitalInput(Phidget):
 		self._onStateChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalInput_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalInput_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -47,8 +46,7 @@ class DigitalInput(Phidget):
 			self._onStateChange = self._StateChangeFactory(self._localStateChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalInput_setOnStateChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalInput_setOnStateChangeHandler
 			res = __func(self.handle, self._onStateChange, None)
 		except RuntimeError:
 			self._StateChange = None
@@ -58,8 +56,7 @@ class DigitalInput(Phidget):
 		_InputMode = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalInput_getInputMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalInput_getInputMode
 			result = __func(self.handle, ctypes.byref(_InputMode))
 		except RuntimeError:
 			raise
@@ -73,8 +70,7 @@ class DigitalInput(Phidget):
 		_InputMode = ctypes.c_int(InputMode)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalInput_setInputMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalInput_setInputMode
 			result = __func(self.handle, _InputMode)
 		except RuntimeError:
 			raise
@@ -87,8 +83,7 @@ class DigitalInput(Phidget):
 		_PowerSupply = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalInput_getPowerSupply
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalInput_getPowerSupply
 			result = __func(self.handle, ctypes.byref(_PowerSupply))
 		except RuntimeError:
 			raise
@@ -102,8 +97,7 @@ class DigitalInput(Phidget):
 		_PowerSupply = ctypes.c_int(PowerSupply)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalInput_setPowerSupply
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalInput_setPowerSupply
 			result = __func(self.handle, _PowerSupply)
 		except RuntimeError:
 			raise
@@ -116,8 +110,7 @@ class DigitalInput(Phidget):
 		_State = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalInput_getState
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalInput_getState
 			result = __func(self.handle, ctypes.byref(_State))
 		except RuntimeError:
 			raise
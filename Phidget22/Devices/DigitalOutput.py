@@ -25,8 +25,7 @@ class DigitalOutput(Phidget):
 		self._onsetState_async = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -41,8 +40,7 @@ class DigitalOutput(Phidget):
 		_DutyCycle = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_getDutyCycle
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_getDutyCycle
 			result = __func(self.handle, ctypes.byref(_DutyCycle))
 		except RuntimeError:
 			raise
@@ -56,8 +54,7 @@ class DigitalOutput(Phidget):
 		_DutyCycle = ctypes.c_double(DutyCycle)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_setDutyCycle
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_setDutyCycle
 			result = __func(self.handle, _DutyCycle)
 		except RuntimeError:
 			raise
@@ -70,8 +67,7 @@ class DigitalOutput(Phidget):
 		_MinDutyCycle = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_getMinDutyCycle
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_getMinDutyCycle
 			result = __func(self.handle, ctypes.byref(_MinDutyCycle))
 		except RuntimeError:
 			raise
@@ -85,8 +81,7 @@ class DigitalOutput(Phidget):
 		_MaxDutyCycle = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_getMaxDutyCycle
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_getMaxDutyCycle
 			result = __func(self.handle, ctypes.byref(_MaxDutyCycle))
 		except RuntimeError:
 			raise
@@ -103,7 +98,7 @@ class DigitalOutput(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -121,8 +116,7 @@ class DigitalOutput(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setDutyCycle_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setDutyCycle_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsetDutyCycle_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -136,8 +130,7 @@ class DigitalOutput(Phidget):
 		_LEDCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_getLEDCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_getLEDCurrentLimit
 			result = __func(self.handle, ctypes.byref(_LEDCurrentLimit))
 		except RuntimeError:
 			raise
@@ -151,8 +144,7 @@ class DigitalOutput(Phidget):
 		_LEDCurrentLimit = ctypes.c_double(LEDCurrentLimit)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_setLEDCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_setLEDCurrentLimit
 			result = __func(self.handle, _LEDCurrentLimit)
 		except RuntimeError:
 			raise
@@ -165,8 +157,7 @@ class DigitalOutput(Phidget):
 		_MinLEDCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_getMinLEDCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_getMinLEDCurrentLimit
 			result = __func(self.handle, ctypes.byref(_MinLEDCurrentLimit))
 		except RuntimeError:
 			raise
@@ -180,8 +171,7 @@ class DigitalOutput(Phidget):
 		_MaxLEDCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_getMaxLEDCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_getMaxLEDCurrentLimit
 			result = __func(self.handle, ctypes.byref(_MaxLEDCurrentLimit))
 		except RuntimeError:
 			raise
@@ -198,7 +188,7 @@ class DigitalOutput(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -216,8 +206,7 @@ class DigitalOutput(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setLEDCurrentLimit_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setLEDCurrentLimit_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsetLEDCurrentLimit_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -231,8 +220,7 @@ class DigitalOutput(Phidget):
 		_LEDForwardVoltage = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_getLEDForwardVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_getLEDForwardVoltage
 			result = __func(self.handle, ctypes.byref(_LEDForwardVoltage))
 		except RuntimeError:
 			raise
@@ -246,8 +234,7 @@ class DigitalOutput(Phidget):
 		_LEDForwardVoltage = ctypes.c_int(LEDForwardVoltage)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_setLEDForwardVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_setLEDForwardVoltage
 			result = __func(self.handle, _LEDForwardVoltage)
 		except RuntimeError:
 			raise
@@ -260,8 +247,7 @@ class DigitalOutput(Phidget):
 		_State = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_getState
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_getState
 			result = __func(self.handle, ctypes.byref(_State))
 		except RuntimeError:
 			raise
@@ -275,8 +261,7 @@ class DigitalOutput(Phidget):
 		_State = ctypes.c_int(State)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDigitalOutput_setState
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDigitalOutput_setState
 			result = __func(self.handle, _State)
 		except RuntimeError:
 			raise
@@ -292,7 +277,7 @@ class DigitalOutput(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -310,8 +295,7 @@ class DigitalOutput(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setState_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setState_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsetState_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -26,8 +26,7 @@ class DistanceSensor(Phidget):
 		self._onSonarReflectionsUpdate = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -52,8 +51,7 @@ class DistanceSensor(Phidget):
 			self._onDistanceChange = self._DistanceChangeFactory(self._localDistanceChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_setOnDistanceChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_setOnDistanceChangeHandler
 			res = __func(self.handle, self._onDistanceChange, None)
 		except RuntimeError:
 			self._DistanceChange = None
@@ -73,8 +71,7 @@ class DistanceSensor(Phidget):
 			self._onSonarReflectionsUpdate = self._SonarReflectionsUpdateFactory(self._localSonarReflectionsUpdateEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_setOnSonarReflectionsUpdateHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_setOnSonarReflectionsUpdateHandler
 			res = __func(self.handle, self._onSonarReflectionsUpdate, None)
 		except RuntimeError:
 			self._SonarReflectionsUpdate = None
@@ -84,8 +81,7 @@ class DistanceSensor(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -99,8 +95,7 @@ class DistanceSensor(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -113,8 +108,7 @@ class DistanceSensor(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -128,8 +122,7 @@ class DistanceSensor(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -143,8 +136,7 @@ class DistanceSensor(Phidget):
 		_Distance = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getDistance
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getDistance
 			result = __func(self.handle, ctypes.byref(_Distance))
 		except RuntimeError:
 			raise
@@ -158,8 +150,7 @@ class DistanceSensor(Phidget):
 		_MinDistance = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getMinDistance
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getMinDistance
 			result = __func(self.handle, ctypes.byref(_MinDistance))
 		except RuntimeError:
 			raise
@@ -173,8 +164,7 @@ class DistanceSensor(Phidget):
 		_MaxDistance = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getMaxDistance
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getMaxDistance
 			result = __func(self.handle, ctypes.byref(_MaxDistance))
 		except RuntimeError:
 			raise
@@ -188,8 +178,7 @@ class DistanceSensor(Phidget):
 		_DistanceChangeTrigger = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getDistanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getDistanceChangeTrigger
 			result = __func(self.handle, ctypes.byref(_DistanceChangeTrigger))
 		except RuntimeError:
 			raise
@@ -203,8 +192,7 @@ class DistanceSensor(Phidget):
 		_DistanceChangeTrigger = ctypes.c_uint32(DistanceChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_setDistanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_setDistanceChangeTrigger
 			result = __func(self.handle, _DistanceChangeTrigger)
 		except RuntimeError:
 			raise
@@ -217,8 +205,7 @@ class DistanceSensor(Phidget):
 		_MinDistanceChangeTrigger = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getMinDistanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getMinDistanceChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinDistanceChangeTrigger))
 		except RuntimeError:
 			raise
@@ -232,8 +219,7 @@ class DistanceSensor(Phidget):
 		_MaxDistanceChangeTrigger = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getMaxDistanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getMaxDistanceChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxDistanceChangeTrigger))
 		except RuntimeError:
 			raise
@@ -247,8 +233,7 @@ class DistanceSensor(Phidget):
 		_SonarQuietMode = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getSonarQuietMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getSonarQuietMode
 			result = __func(self.handle, ctypes.byref(_SonarQuietMode))
 		except RuntimeError:
 			raise
@@ -262,8 +247,7 @@ class DistanceSensor(Phidget):
 		_SonarQuietMode = ctypes.c_int(SonarQuietMode)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_setSonarQuietMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_setSonarQuietMode
 			result = __func(self.handle, _SonarQuietMode)
 		except RuntimeError:
 			raise
@@ -278,8 +262,7 @@ class DistanceSensor(Phidget):
 		_count = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetDistanceSensor_getSonarReflections
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetDistanceSensor_getSonarReflections
 			result = __func(self.handle, ctypes.byref(_distances), ctypes.byref(_amplitudes), ctypes.byref(_count))
 		except RuntimeError:
 			raise
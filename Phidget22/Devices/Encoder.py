@@ -20,8 +20,7 @@ class Encoder(Phidget):
 		self._onPositionChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -46,8 +45,7 @@ class Encoder(Phidget):
 			self._onPositionChange = self._PositionChangeFactory(self._localPositionChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_setOnPositionChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_setOnPositionChangeHandler
 			res = __func(self.handle, self._onPositionChange, None)
 		except RuntimeError:
 			self._PositionChange = None
@@ -57,8 +55,7 @@ class Encoder(Phidget):
 		_Enabled = ctypes.c_int(Enabled)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_setEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_setEnabled
 			result = __func(self.handle, _Enabled)
 		except RuntimeError:
 			raise
@@ -71,8 +68,7 @@ class Encoder(Phidget):
 		_Enabled = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getEnabled
 			result = __func(self.handle, ctypes.byref(_Enabled))
 		except RuntimeError:
 			raise
@@ -86,8 +82,7 @@ class Encoder(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -101,8 +96,7 @@ class Encoder(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -115,8 +109,7 @@ class Encoder(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -130,8 +123,7 @@ class Encoder(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -145,8 +137,7 @@ class Encoder(Phidget):
 		_IndexPosition = ctypes.c_int64()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getIndexPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getIndexPosition
 			result = __func(self.handle, ctypes.byref(_IndexPosition))
 		except RuntimeError:
 			raise
@@ -160,8 +151,7 @@ class Encoder(Phidget):
 		_IOMode = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getIOMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getIOMode
 			result = __func(self.handle, ctypes.byref(_IOMode))
 		except RuntimeError:
 			raise
@@ -175,8 +165,7 @@ class Encoder(Phidget):
 		_IOMode = ctypes.c_int(IOMode)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_setIOMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_setIOMode
 			result = __func(self.handle, _IOMode)
 		except RuntimeError:
 			raise
@@ -189,8 +178,7 @@ class Encoder(Phidget):
 		_Position = ctypes.c_int64()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getPosition
 			result = __func(self.handle, ctypes.byref(_Position))
 		except RuntimeError:
 			raise
@@ -204,8 +192,7 @@ class Encoder(Phidget):
 		_Position = ctypes.c_int64(Position)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_setPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_setPosition
 			result = __func(self.handle, _Position)
 		except RuntimeError:
 			raise
@@ -218,8 +205,7 @@ class Encoder(Phidget):
 		_PositionChangeTrigger = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getPositionChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getPositionChangeTrigger
 			result = __func(self.handle, ctypes.byref(_PositionChangeTrigger))
 		except RuntimeError:
 			raise
@@ -233,8 +219,7 @@ class Encoder(Phidget):
 		_PositionChangeTrigger = ctypes.c_uint32(PositionChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_setPositionChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_setPositionChangeTrigger
 			result = __func(self.handle, _PositionChangeTrigger)
 		except RuntimeError:
 			raise
@@ -247,8 +232,7 @@ class Encoder(Phidget):
 		_MinPositionChangeTrigger = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getMinPositionChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getMinPositionChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinPositionChangeTrigger))
 		except RuntimeError:
 			raise
@@ -262,8 +246,7 @@ class Encoder(Phidget):
 		_MaxPositionChangeTrigger = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetEncoder_getMaxPositionChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetEncoder_getMaxPositionChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxPositionChangeTrigger))
 		except RuntimeError:
 			raise
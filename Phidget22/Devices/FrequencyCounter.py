@@ -29,8 +29,7 @@ class FrequencyCounter(Phidget):
 		self._onFrequencyChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -55,8 +54,7 @@ class FrequencyCounter(Phidget):
 			self._onCountChange = self._CountChangeFactory(self._localCountChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_setOnCountChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_setOnCountChangeHandler
 			res = __func(self.handle, self._onCountChange, None)
 		except RuntimeError:
 			self._CountChange = None
@@ -76,8 +74,7 @@ class FrequencyCounter(Phidget):
 			self._onFrequencyChange = self._FrequencyChangeFactory(self._localFrequencyChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_setOnFrequencyChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_setOnFrequencyChangeHandler
 			res = __func(self.handle, self._onFrequencyChange, None)
 		except RuntimeError:
 			self._FrequencyChange = None
@@ -87,8 +84,7 @@ class FrequencyCounter(Phidget):
 		_Count = ctypes.c_uint64()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getCount
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getCount
 			result = __func(self.handle, ctypes.byref(_Count))
 		except RuntimeError:
 			raise
@@ -102,8 +98,7 @@ class FrequencyCounter(Phidget):
 		_Enabled = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getEnabled
 			result = __func(self.handle, ctypes.byref(_Enabled))
 		except RuntimeError:
 			raise
@@ -117,8 +112,7 @@ class FrequencyCounter(Phidget):
 		_Enabled = ctypes.c_int(Enabled)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_setEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_setEnabled
 			result = __func(self.handle, _Enabled)
 		except RuntimeError:
 			raise
@@ -131,8 +125,7 @@ class FrequencyCounter(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -146,8 +139,7 @@ class FrequencyCounter(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -160,8 +152,7 @@ class FrequencyCounter(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -175,8 +166,7 @@ class FrequencyCounter(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -190,8 +180,7 @@ class FrequencyCounter(Phidget):
 		_FilterType = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getFilterType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getFilterType
 			result = __func(self.handle, ctypes.byref(_FilterType))
 		except RuntimeError:
 			raise
@@ -205,8 +194,7 @@ class FrequencyCounter(Phidget):
 		_FilterType = ctypes.c_int(FilterType)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_setFilterType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_setFilterType
 			result = __func(self.handle, _FilterType)
 		except RuntimeError:
 			raise
@@ -219,8 +207,7 @@ class FrequencyCounter(Phidget):
 		_Frequency = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getFrequency
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getFrequency
 			result = __func(self.handle, ctypes.byref(_Frequency))
 		except RuntimeError:
 			raise
@@ -234,8 +221,7 @@ class FrequencyCounter(Phidget):
 		_MaxFrequency = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getMaxFrequency
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getMaxFrequency
 			result = __func(self.handle, ctypes.byref(_MaxFrequency))
 		except RuntimeError:
 			raise
@@ -249,8 +235,7 @@ class FrequencyCounter(Phidget):
 		_FrequencyCutoff = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getFrequencyCutoff
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getFrequencyCutoff
 			result = __func(self.handle, ctypes.byref(_FrequencyCutoff))
 		except RuntimeError:
 			raise
@@ -264,8 +249,7 @@ class FrequencyCounter(Phidget):
 		_FrequencyCutoff = ctypes.c_double(FrequencyCutoff)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_setFrequencyCutoff
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_setFrequencyCutoff
 			result = __func(self.handle, _FrequencyCutoff)
 		except RuntimeError:
 			raise
@@ -278,8 +262,7 @@ class FrequencyCounter(Phidget):
 		_MinFrequencyCutoff = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getMinFrequencyCutoff
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getMinFrequencyCutoff
 			result = __func(self.handle, ctypes.byref(_MinFrequencyCutoff))
 		except RuntimeError:
 			raise
@@ -293,8 +276,7 @@ class FrequencyCounter(Phidget):
 		_MaxFrequencyCutoff = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getMaxFrequencyCutoff
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getMaxFrequencyCutoff
 			result = __func(self.handle, ctypes.byref(_MaxFrequencyCutoff))
 		except RuntimeError:
 			raise
@@ -308,8 +290,7 @@ class FrequencyCounter(Phidget):
 		_InputMode = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getInputMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getInputMode
 			result = __func(self.handle, ctypes.byref(_InputMode))
 		except RuntimeError:
 			raise
@@ -323,8 +304,7 @@ class FrequencyCounter(Phidget):
 		_InputMode = ctypes.c_int(InputMode)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_setInputMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_setInputMode
 			result = __func(self.handle, _InputMode)
 		except RuntimeError:
 			raise
@@ -337,8 +317,7 @@ class FrequencyCounter(Phidget):
 		_PowerSupply = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getPowerSupply
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getPowerSupply
 			result = __func(self.handle, ctypes.byref(_PowerSupply))
 		except RuntimeError:
 			raise
@@ -352,8 +331,7 @@ class FrequencyCounter(Phidget):
 		_PowerSupply = ctypes.c_int(PowerSupply)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_setPowerSupply
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_setPowerSupply
 			result = __func(self.handle, _PowerSupply)
 		except RuntimeError:
 			raise
@@ -364,8 +342,7 @@ class FrequencyCounter(Phidget):
 
 	def reset(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_reset
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_reset
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -378,8 +355,7 @@ class FrequencyCounter(Phidget):
 		_TimeElapsed = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetFrequencyCounter_getTimeElapsed
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetFrequencyCounter_getTimeElapsed
 			result = __func(self.handle, ctypes.byref(_TimeElapsed))
 		except RuntimeError:
 			raise
@@ -35,8 +35,7 @@ class GPS(Phidget):
 		self._onPositionFixStateChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -61,8 +60,7 @@ class GPS(Phidget):
 			self._onHeadingChange = self._HeadingChangeFactory(self._localHeadingChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_setOnHeadingChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_setOnHeadingChangeHandler
 			res = __func(self.handle, self._onHeadingChange, None)
 		except RuntimeError:
 			self._HeadingChange = None
@@ -82,8 +80,7 @@ class GPS(Phidget):
 			self._onPositionChange = self._PositionChangeFactory(self._localPositionChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_setOnPositionChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_setOnPositionChangeHandler
 			res = __func(self.handle, self._onPositionChange, None)
 		except RuntimeError:
 			self._PositionChange = None
@@ -103,8 +100,7 @@ class GPS(Phidget):
 			self._onPositionFixStateChange = self._PositionFixStateChangeFactory(self._localPositionFixStateChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_setOnPositionFixStateChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_setOnPositionFixStateChangeHandler
 			res = __func(self.handle, self._onPositionFixStateChange, None)
 		except RuntimeError:
 			self._PositionFixStateChange = None
@@ -114,8 +110,7 @@ class GPS(Phidget):
 		_Altitude = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_getAltitude
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_getAltitude
 			result = __func(self.handle, ctypes.byref(_Altitude))
 		except RuntimeError:
 			raise
@@ -129,8 +124,7 @@ class GPS(Phidget):
 		_Date = GPSDate()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_getDate
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_getDate
 			result = __func(self.handle, ctypes.byref(_Date))
 		except RuntimeError:
 			raise
@@ -144,8 +138,7 @@ class GPS(Phidget):
 		_Heading = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_getHeading
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_getHeading
 			result = __func(self.handle, ctypes.byref(_Heading))
 		except RuntimeError:
 			raise
@@ -159,8 +152,7 @@ class GPS(Phidget):
 		_Latitude = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_getLatitude
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_getLatitude
 			result = __func(self.handle, ctypes.byref(_Latitude))
 		except RuntimeError:
 			raise
@@ -174,8 +166,7 @@ class GPS(Phidget):
 		_Longitude = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_getLongitude
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_getLongitude
 			result = __func(self.handle, ctypes.byref(_Longitude))
 		except RuntimeError:
 			raise
@@ -189,8 +180,7 @@ class GPS(Phidget):
 		_PositionFixState = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_getPositionFixState
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_getPositionFixState
 			result = __func(self.handle, ctypes.byref(_PositionFixState))
 		except RuntimeError:
 			raise
@@ -204,8 +194,7 @@ class GPS(Phidget):
 		_Time = GPSTime()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_getTime
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_getTime
 			result = __func(self.handle, ctypes.byref(_Time))
 		except RuntimeError:
 			raise
@@ -219,8 +208,7 @@ class GPS(Phidget):
 		_Velocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGPS_getVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGPS_getVelocity
 			result = __func(self.handle, ctypes.byref(_Velocity))
 		except RuntimeError:
 			raise
@@ -19,8 +19,7 @@ class Gyroscope(Phidget):
 		self._onAngularRateUpdate = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -45,8 +44,7 @@ class Gyroscope(Phidget):
 			self._onAngularRateUpdate = self._AngularRateUpdateFactory(self._localAngularRateUpdateEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_setOnAngularRateUpdateHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_setOnAngularRateUpdateHandler
 			res = __func(self.handle, self._onAngularRateUpdate, None)
 		except RuntimeError:
 			self._AngularRateUpdate = None
@@ -56,8 +54,7 @@ class Gyroscope(Phidget):
 		_AngularRate = (ctypes.c_double * 3)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_getAngularRate
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_getAngularRate
 			result = __func(self.handle, ctypes.byref(_AngularRate))
 		except RuntimeError:
 			raise
@@ -71,8 +68,7 @@ class Gyroscope(Phidget):
 		_MinAngularRate = (ctypes.c_double * 3)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_getMinAngularRate
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_getMinAngularRate
 			result = __func(self.handle, ctypes.byref(_MinAngularRate))
 		except RuntimeError:
 			raise
@@ -86,8 +82,7 @@ class Gyroscope(Phidget):
 		_MaxAngularRate = (ctypes.c_double * 3)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_getMaxAngularRate
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_getMaxAngularRate
 			result = __func(self.handle, ctypes.byref(_MaxAngularRate))
 		except RuntimeError:
 			raise
@@ -101,8 +96,7 @@ class Gyroscope(Phidget):
 		_AxisCount = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_getAxisCount
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_getAxisCount
 			result = __func(self.handle, ctypes.byref(_AxisCount))
 		except RuntimeError:
 			raise
@@ -116,8 +110,7 @@ class Gyroscope(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -131,8 +124,7 @@ class Gyroscope(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -145,8 +137,7 @@ class Gyroscope(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -160,8 +151,7 @@ class Gyroscope(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -175,8 +165,7 @@ class Gyroscope(Phidget):
 		_Timestamp = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_getTimestamp
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_getTimestamp
 			result = __func(self.handle, ctypes.byref(_Timestamp))
 		except RuntimeError:
 			raise
@@ -188,8 +177,7 @@ class Gyroscope(Phidget):
 
 	def zero(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetGyroscope_zero
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetGyroscope_zero
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -12,8 +12,7 @@ class Hub(Phidget):
 		self.handle = ctypes.c_void_p()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHub_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHub_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -29,8 +28,7 @@ class Hub(Phidget):
 		_state = ctypes.c_int(state)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHub_setPortPower
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHub_setPortPower
 			result = __func(self.handle, _port, _state)
 		except RuntimeError:
 			raise
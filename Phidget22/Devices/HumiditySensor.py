@@ -19,8 +19,7 @@ class HumiditySensor(Phidget):
 		self._onHumidityChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -45,8 +44,7 @@ class HumiditySensor(Phidget):
 			self._onHumidityChange = self._HumidityChangeFactory(self._localHumidityChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_setOnHumidityChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_setOnHumidityChangeHandler
 			res = __func(self.handle, self._onHumidityChange, None)
 		except RuntimeError:
 			self._HumidityChange = None
@@ -56,8 +54,7 @@ class HumiditySensor(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -71,8 +68,7 @@ class HumiditySensor(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -85,8 +81,7 @@ class HumiditySensor(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -100,8 +95,7 @@ class HumiditySensor(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -115,8 +109,7 @@ class HumiditySensor(Phidget):
 		_Humidity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_getHumidity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_getHumidity
 			result = __func(self.handle, ctypes.byref(_Humidity))
 		except RuntimeError:
 			raise
@@ -130,8 +123,7 @@ class HumiditySensor(Phidget):
 		_MinHumidity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_getMinHumidity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_getMinHumidity
 			result = __func(self.handle, ctypes.byref(_MinHumidity))
 		except RuntimeError:
 			raise
@@ -145,8 +137,7 @@ class HumiditySensor(Phidget):
 		_MaxHumidity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_getMaxHumidity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_getMaxHumidity
 			result = __func(self.handle, ctypes.byref(_MaxHumidity))
 		except RuntimeError:
 			raise
@@ -160,8 +151,7 @@ class HumiditySensor(Phidget):
 		_HumidityChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_getHumidityChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_getHumidityChangeTrigger
 			result = __func(self.handle, ctypes.byref(_HumidityChangeTrigger))
 		except RuntimeError:
 			raise
@@ -175,8 +165,7 @@ class HumiditySensor(Phidget):
 		_HumidityChangeTrigger = ctypes.c_double(HumidityChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_setHumidityChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_setHumidityChangeTrigger
 			result = __func(self.handle, _HumidityChangeTrigger)
 		except RuntimeError:
 			raise
@@ -189,8 +178,7 @@ class HumiditySensor(Phidget):
 		_MinHumidityChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_getMinHumidityChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_getMinHumidityChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinHumidityChangeTrigger))
 		except RuntimeError:
 			raise
@@ -204,8 +192,7 @@ class HumiditySensor(Phidget):
 		_MaxHumidityChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetHumiditySensor_getMaxHumidityChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetHumiditySensor_getMaxHumidityChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxHumidityChangeTrigger))
 		except RuntimeError:
 			raise
@@ -36,8 +36,7 @@ class IR(Phidget):
 		self._onRawData = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetIR_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetIR_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -63,8 +62,7 @@ class IR(Phidget):
 			self._onCode = self._CodeFactory(self._localCodeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetIR_setOnCodeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetIR_setOnCodeHandler
 			res = __func(self.handle, self._onCode, None)
 		except RuntimeError:
 			self._Code = None
@@ -88,8 +86,7 @@ class IR(Phidget):
 			self._onLearn = self._LearnFactory(self._localLearnEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetIR_setOnLearnHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetIR_setOnLearnHandler
 			res = __func(self.handle, self._onLearn, None)
 		except RuntimeError:
 			self._Learn = None
@@ -109,8 +106,7 @@ class IR(Phidget):
 			self._onRawData = self._RawDataFactory(self._localRawDataEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetIR_setOnRawDataHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetIR_setOnRawDataHandler
 			res = __func(self.handle, self._onRawData, None)
 		except RuntimeError:
 			self._RawData = None
@@ -122,8 +118,7 @@ class IR(Phidget):
 		_bitCount = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetIR_getLastCode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetIR_getLastCode
 			result = __func(self.handle, ctypes.byref(_code), _codeLen, ctypes.byref(_bitCount))
 		except RuntimeError:
 			raise
@@ -139,8 +134,7 @@ class IR(Phidget):
 		_codeInfo = CodeInfo()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetIR_getLastLearnedCode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetIR_getLastLearnedCode
 			result = __func(self.handle, ctypes.byref(_code), _codeLen, ctypes.byref(_codeInfo))
 		except RuntimeError:
 			raise
@@ -155,8 +149,7 @@ class IR(Phidget):
 		_codeInfo = codeInfo.fromPython()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetIR_transmit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetIR_transmit
 			result = __func(self.handle, ctypes.byref(_code), ctypes.byref(_codeInfo))
 		except RuntimeError:
 			raise
@@ -173,8 +166,7 @@ class IR(Phidget):
 		_gap = ctypes.c_uint32(gap)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetIR_transmitRaw
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetIR_transmitRaw
 			result = __func(self.handle, ctypes.byref(_data), _dataLen, _carrierFrequency, _dutyCycle, _gap)
 		except RuntimeError:
 			raise
@@ -185,8 +177,7 @@ class IR(Phidget):
 
 	def transmitRepeat(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetIR_transmitRepeat
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetIR_transmitRepeat
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
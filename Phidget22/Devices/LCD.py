@@ -43,8 +43,7 @@ class LCD(Phidget):
 		self._onwriteText_async = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -59,8 +58,7 @@ class LCD(Phidget):
 		_Backlight = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getBacklight
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getBacklight
 			result = __func(self.handle, ctypes.byref(_Backlight))
 		except RuntimeError:
 			raise
@@ -74,8 +72,7 @@ class LCD(Phidget):
 		_Backlight = ctypes.c_double(Backlight)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setBacklight
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setBacklight
 			result = __func(self.handle, _Backlight)
 		except RuntimeError:
 			raise
@@ -88,8 +85,7 @@ class LCD(Phidget):
 		_MinBacklight = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getMinBacklight
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getMinBacklight
 			result = __func(self.handle, ctypes.byref(_MinBacklight))
 		except RuntimeError:
 			raise
@@ -103,8 +99,7 @@ class LCD(Phidget):
 		_MaxBacklight = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getMaxBacklight
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getMaxBacklight
 			result = __func(self.handle, ctypes.byref(_MaxBacklight))
 		except RuntimeError:
 			raise
@@ -120,8 +115,7 @@ class LCD(Phidget):
 		_bitmap = (ctypes.c_uint8 * len(bitmap))(*bitmap)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setCharacterBitmap
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setCharacterBitmap
 			result = __func(self.handle, _font, ctypes.byref(_character), ctypes.byref(_bitmap))
 		except RuntimeError:
 			raise
@@ -137,7 +131,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -157,8 +151,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setCharacterBitmap_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setCharacterBitmap_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsetCharacterBitmap_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -173,8 +166,7 @@ class LCD(Phidget):
 		_maxCharacters = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getMaxCharacters
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getMaxCharacters
 			result = __func(self.handle, _font, ctypes.byref(_maxCharacters))
 		except RuntimeError:
 			raise
@@ -186,8 +178,7 @@ class LCD(Phidget):
 
 	def clear(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_clear
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_clear
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -203,7 +194,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -220,8 +211,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_clear_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_clear_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onclear_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -235,8 +225,7 @@ class LCD(Phidget):
 		_Contrast = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getContrast
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getContrast
 			result = __func(self.handle, ctypes.byref(_Contrast))
 		except RuntimeError:
 			raise
@@ -250,8 +239,7 @@ class LCD(Phidget):
 		_Contrast = ctypes.c_double(Contrast)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setContrast
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setContrast
 			result = __func(self.handle, _Contrast)
 		except RuntimeError:
 			raise
@@ -264,8 +252,7 @@ class LCD(Phidget):
 		_MinContrast = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getMinContrast
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getMinContrast
 			result = __func(self.handle, ctypes.byref(_MinContrast))
 		except RuntimeError:
 			raise
@@ -279,8 +266,7 @@ class LCD(Phidget):
 		_MaxContrast = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getMaxContrast
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getMaxContrast
 			result = __func(self.handle, ctypes.byref(_MaxContrast))
 		except RuntimeError:
 			raise
@@ -302,8 +288,7 @@ class LCD(Phidget):
 		_inverted = ctypes.c_int(inverted)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_copy
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_copy
 			result = __func(self.handle, _sourceFramebuffer, _destFramebuffer, _sourceX1, _sourceY1, _sourceX2, _sourceY2, _destX, _destY, _inverted)
 		except RuntimeError:
 			raise
@@ -319,7 +304,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -345,8 +330,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_copy_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_copy_async
 			res = __func(self.handle, _font, _character, _bitmap, self._oncopy_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -360,8 +344,7 @@ class LCD(Phidget):
 		_CursorBlink = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getCursorBlink
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getCursorBlink
 			result = __func(self.handle, ctypes.byref(_CursorBlink))
 		except RuntimeError:
 			raise
@@ -375,8 +358,7 @@ class LCD(Phidget):
 		_CursorBlink = ctypes.c_int(CursorBlink)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setCursorBlink
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setCursorBlink
 			result = __func(self.handle, _CursorBlink)
 		except RuntimeError:
 			raise
@@ -389,8 +371,7 @@ class LCD(Phidget):
 		_CursorOn = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getCursorOn
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getCursorOn
 			result = __func(self.handle, ctypes.byref(_CursorOn))
 		except RuntimeError:
 			raise
@@ -404,8 +385,7 @@ class LCD(Phidget):
 		_CursorOn = ctypes.c_int(CursorOn)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setCursorOn
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setCursorOn
 			result = __func(self.handle, _CursorOn)
 		except RuntimeError:
 			raise
@@ -421,8 +401,7 @@ class LCD(Phidget):
 		_y2 = ctypes.c_int(y2)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_drawLine
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_drawLine
 			result = __func(self.handle, _x1, _y1, _x2, _y2)
 		except RuntimeError:
 			raise
@@ -438,7 +417,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -459,8 +438,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_drawLine_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_drawLine_async
 			res = __func(self.handle, _font, _character, _bitmap, self._ondrawLine_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -476,8 +454,7 @@ class LCD(Phidget):
 		_pixelState = ctypes.c_int(pixelState)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_drawPixel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_drawPixel
 			result = __func(self.handle, _x, _y, _pixelState)
 		except RuntimeError:
 			raise
@@ -493,7 +470,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -513,8 +490,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_drawPixel_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_drawPixel_async
 			res = __func(self.handle, _font, _character, _bitmap, self._ondrawPixel_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -533,8 +509,7 @@ class LCD(Phidget):
 		_inverted = ctypes.c_int(inverted)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_drawRect
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_drawRect
 			result = __func(self.handle, _x1, _y1, _x2, _y2, _filled, _inverted)
 		except RuntimeError:
 			raise
@@ -550,7 +525,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -573,8 +548,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_drawRect_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_drawRect_async
 			res = __func(self.handle, _font, _character, _bitmap, self._ondrawRect_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -586,8 +560,7 @@ class LCD(Phidget):
 
 	def flush(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_flush
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_flush
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -603,7 +576,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -620,8 +593,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_flush_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_flush_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onflush_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -637,8 +609,7 @@ class LCD(Phidget):
 		_height = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getFontSize
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getFontSize
 			result = __func(self.handle, _font, ctypes.byref(_width), ctypes.byref(_height))
 		except RuntimeError:
 			raise
@@ -654,8 +625,7 @@ class LCD(Phidget):
 		_height = ctypes.c_int(height)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setFontSize
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setFontSize
 			result = __func(self.handle, _font, _width, _height)
 		except RuntimeError:
 			raise
@@ -668,8 +638,7 @@ class LCD(Phidget):
 		_FrameBuffer = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getFrameBuffer
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getFrameBuffer
 			result = __func(self.handle, ctypes.byref(_FrameBuffer))
 		except RuntimeError:
 			raise
@@ -683,8 +652,7 @@ class LCD(Phidget):
 		_FrameBuffer = ctypes.c_int(FrameBuffer)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setFrameBuffer
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setFrameBuffer
 			result = __func(self.handle, _FrameBuffer)
 		except RuntimeError:
 			raise
@@ -700,7 +668,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -718,8 +686,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setFrameBuffer_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setFrameBuffer_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsetFrameBuffer_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -733,8 +700,7 @@ class LCD(Phidget):
 		_Height = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getHeight
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getHeight
 			result = __func(self.handle, ctypes.byref(_Height))
 		except RuntimeError:
 			raise
@@ -746,8 +712,7 @@ class LCD(Phidget):
 
 	def initialize(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_initialize
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_initialize
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -760,8 +725,7 @@ class LCD(Phidget):
 		_frameBuffer = ctypes.c_int(frameBuffer)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_saveFrameBuffer
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_saveFrameBuffer
 			result = __func(self.handle, _frameBuffer)
 		except RuntimeError:
 			raise
@@ -777,7 +741,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -795,8 +759,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_saveFrameBuffer_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_saveFrameBuffer_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsaveFrameBuffer_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -810,8 +773,7 @@ class LCD(Phidget):
 		_ScreenSize = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getScreenSize
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getScreenSize
 			result = __func(self.handle, ctypes.byref(_ScreenSize))
 		except RuntimeError:
 			raise
@@ -825,8 +787,7 @@ class LCD(Phidget):
 		_ScreenSize = ctypes.c_int(ScreenSize)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setScreenSize
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setScreenSize
 			result = __func(self.handle, _ScreenSize)
 		except RuntimeError:
 			raise
@@ -839,8 +800,7 @@ class LCD(Phidget):
 		_Sleeping = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getSleeping
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getSleeping
 			result = __func(self.handle, ctypes.byref(_Sleeping))
 		except RuntimeError:
 			raise
@@ -854,8 +814,7 @@ class LCD(Phidget):
 		_Sleeping = ctypes.c_int(Sleeping)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setSleeping
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setSleeping
 			result = __func(self.handle, _Sleeping)
 		except RuntimeError:
 			raise
@@ -868,8 +827,7 @@ class LCD(Phidget):
 		_Width = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_getWidth
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_getWidth
 			result = __func(self.handle, ctypes.byref(_Width))
 		except RuntimeError:
 			raise
@@ -887,8 +845,7 @@ class LCD(Phidget):
 		_bitmap = (ctypes.c_uint8 * len(bitmap))(*bitmap)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_writeBitmap
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_writeBitmap
 			result = __func(self.handle, _xPosition, _yPosition, _xSize, _ySize, ctypes.byref(_bitmap))
 		except RuntimeError:
 			raise
@@ -904,7 +861,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -926,8 +883,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_writeBitmap_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_writeBitmap_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onwriteBitmap_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -944,8 +900,7 @@ class LCD(Phidget):
 		_text = ctypes.create_string_buffer(text.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_writeText
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_writeText
 			result = __func(self.handle, _font, _xPosition, _yPosition, ctypes.byref(_text))
 		except RuntimeError:
 			raise
@@ -961,7 +916,7 @@ class LCD(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -982,8 +937,7 @@ class LCD(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_writeText_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_writeText_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onwriteText_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -19,8 +19,7 @@ class LightSensor(Phidget):
 		self._onIlluminanceChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -45,8 +44,7 @@ class LightSensor(Phidget):
 			self._onIlluminanceChange = self._IlluminanceChangeFactory(self._localIlluminanceChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_setOnIlluminanceChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_setOnIlluminanceChangeHandler
 			res = __func(self.handle, self._onIlluminanceChange, None)
 		except RuntimeError:
 			self._IlluminanceChange = None
@@ -56,8 +54,7 @@ class LightSensor(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -71,8 +68,7 @@ class LightSensor(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -85,8 +81,7 @@ class LightSensor(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -100,8 +95,7 @@ class LightSensor(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -115,8 +109,7 @@ class LightSensor(Phidget):
 		_Illuminance = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_getIlluminance
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_getIlluminance
 			result = __func(self.handle, ctypes.byref(_Illuminance))
 		except RuntimeError:
 			raise
@@ -130,8 +123,7 @@ class LightSensor(Phidget):
 		_MinIlluminance = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_getMinIlluminance
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_getMinIlluminance
 			result = __func(self.handle, ctypes.byref(_MinIlluminance))
 		except RuntimeError:
 			raise
@@ -145,8 +137,7 @@ class LightSensor(Phidget):
 		_MaxIlluminance = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_getMaxIlluminance
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_getMaxIlluminance
 			result = __func(self.handle, ctypes.byref(_MaxIlluminance))
 		except RuntimeError:
 			raise
@@ -160,8 +151,7 @@ class LightSensor(Phidget):
 		_IlluminanceChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_getIlluminanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_getIlluminanceChangeTrigger
 			result = __func(self.handle, ctypes.byref(_IlluminanceChangeTrigger))
 		except RuntimeError:
 			raise
@@ -175,8 +165,7 @@ class LightSensor(Phidget):
 		_IlluminanceChangeTrigger = ctypes.c_double(IlluminanceChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_setIlluminanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_setIlluminanceChangeTrigger
 			result = __func(self.handle, _IlluminanceChangeTrigger)
 		except RuntimeError:
 			raise
@@ -189,8 +178,7 @@ class LightSensor(Phidget):
 		_MinIlluminanceChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_getMinIlluminanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_getMinIlluminanceChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinIlluminanceChangeTrigger))
 		except RuntimeError:
 			raise
@@ -204,8 +192,7 @@ class LightSensor(Phidget):
 		_MaxIlluminanceChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLightSensor_getMaxIlluminanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLightSensor_getMaxIlluminanceChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxIlluminanceChangeTrigger))
 		except RuntimeError:
 			raise
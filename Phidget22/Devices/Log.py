@@ -16,8 +16,7 @@ class Log:
 	@staticmethod
 	def disable():
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_disable
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_disable
 			result = __func()
 		except RuntimeError:
 			raise
@@ -32,8 +31,7 @@ class Log:
 		_destination = ctypes.create_string_buffer(destination.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_enable
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_enable
 			result = __func(_level, ctypes.byref(_destination))
 		except RuntimeError:
 			raise
@@ -47,8 +45,7 @@ class Log:
 		_level = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_getLevel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_getLevel
 			result = __func(ctypes.byref(_level))
 		except RuntimeError:
 			raise
@@ -63,8 +60,7 @@ class Log:
 		_level = ctypes.c_int(level)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_setLevel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_setLevel
 			result = __func(_level)
 		except RuntimeError:
 			raise
@@ -79,8 +75,7 @@ class Log:
 		_message = ctypes.create_string_buffer(message.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_log
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_log
 			result = __func(_level, ctypes.byref(_message))
 		except RuntimeError:
 			raise
@@ -92,8 +87,7 @@ class Log:
 	@staticmethod
 	def rotate():
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_rotate
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_rotate
 			result = __func()
 		except RuntimeError:
 			raise
@@ -107,8 +101,7 @@ class Log:
 		_isrotating = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_isRotating
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_isRotating
 			result = __func(ctypes.byref(_isrotating))
 		except RuntimeError:
 			raise
@@ -124,8 +117,7 @@ class Log:
 		_keepCount = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_getRotating
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_getRotating
 			result = __func(ctypes.byref(_size), ctypes.byref(_keepCount))
 		except RuntimeError:
 			raise
@@ -141,8 +133,7 @@ class Log:
 		_keepCount = ctypes.c_int(keepCount)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_setRotating
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_setRotating
 			result = __func(_size, _keepCount)
 		except RuntimeError:
 			raise
@@ -154,8 +145,7 @@ class Log:
 	@staticmethod
 	def enableRotating():
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_enableRotating
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_enableRotating
 			result = __func()
 		except RuntimeError:
 			raise
@@ -167,8 +157,7 @@ class Log:
 	@staticmethod
 	def disableRotating():
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_disableRotating
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_disableRotating
 			result = __func()
 		except RuntimeError:
 			raise
@@ -183,8 +172,7 @@ class Log:
 		_level = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_getSourceLevel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_getSourceLevel
 			result = __func(ctypes.byref(_source), ctypes.byref(_level))
 		except RuntimeError:
 			raise
@@ -200,8 +188,7 @@ class Log:
 		_level = ctypes.c_int(level)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLog_setSourceLevel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLog_setSourceLevel
 			result = __func(ctypes.byref(_source), _level)
 		except RuntimeError:
 			raise
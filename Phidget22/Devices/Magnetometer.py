@@ -19,8 +19,7 @@ class Magnetometer(Phidget):
 		self._onMagneticFieldChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -45,8 +44,7 @@ class Magnetometer(Phidget):
 			self._onMagneticFieldChange = self._MagneticFieldChangeFactory(self._localMagneticFieldChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_setOnMagneticFieldChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_setOnMagneticFieldChangeHandler
 			res = __func(self.handle, self._onMagneticFieldChange, None)
 		except RuntimeError:
 			self._MagneticFieldChange = None
@@ -56,8 +54,7 @@ class Magnetometer(Phidget):
 		_AxisCount = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getAxisCount
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getAxisCount
 			result = __func(self.handle, ctypes.byref(_AxisCount))
 		except RuntimeError:
 			raise
@@ -83,8 +80,7 @@ class Magnetometer(Phidget):
 		_T5 = ctypes.c_double(T5)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_setCorrectionParameters
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_setCorrectionParameters
 			result = __func(self.handle, _magneticField, _offset0, _offset1, _offset2, _gain0, _gain1, _gain2, _T0, _T1, _T2, _T3, _T4, _T5)
 		except RuntimeError:
 			raise
@@ -97,8 +93,7 @@ class Magnetometer(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -112,8 +107,7 @@ class Magnetometer(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -126,8 +120,7 @@ class Magnetometer(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -141,8 +134,7 @@ class Magnetometer(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -156,8 +148,7 @@ class Magnetometer(Phidget):
 		_MagneticField = (ctypes.c_double * 3)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getMagneticField
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getMagneticField
 			result = __func(self.handle, ctypes.byref(_MagneticField))
 		except RuntimeError:
 			raise
@@ -171,8 +162,7 @@ class Magnetometer(Phidget):
 		_MinMagneticField = (ctypes.c_double * 3)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getMinMagneticField
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getMinMagneticField
 			result = __func(self.handle, ctypes.byref(_MinMagneticField))
 		except RuntimeError:
 			raise
@@ -186,8 +176,7 @@ class Magnetometer(Phidget):
 		_MaxMagneticField = (ctypes.c_double * 3)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getMaxMagneticField
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getMaxMagneticField
 			result = __func(self.handle, ctypes.byref(_MaxMagneticField))
 		except RuntimeError:
 			raise
@@ -201,8 +190,7 @@ class Magnetometer(Phidget):
 		_MagneticFieldChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getMagneticFieldChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getMagneticFieldChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MagneticFieldChangeTrigger))
 		except RuntimeError:
 			raise
@@ -216,8 +204,7 @@ class Magnetometer(Phidget):
 		_MagneticFieldChangeTrigger = ctypes.c_double(MagneticFieldChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_setMagneticFieldChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_setMagneticFieldChangeTrigger
 			result = __func(self.handle, _MagneticFieldChangeTrigger)
 		except RuntimeError:
 			raise
@@ -230,8 +217,7 @@ class Magnetometer(Phidget):
 		_MinMagneticFieldChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getMinMagneticFieldChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getMinMagneticFieldChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinMagneticFieldChangeTrigger))
 		except RuntimeError:
 			raise
@@ -245,8 +231,7 @@ class Magnetometer(Phidget):
 		_MaxMagneticFieldChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getMaxMagneticFieldChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getMaxMagneticFieldChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxMagneticFieldChangeTrigger))
 		except RuntimeError:
 			raise
@@ -258,8 +243,7 @@ class Magnetometer(Phidget):
 
 	def resetCorrectionParameters(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_resetCorrectionParameters
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_resetCorrectionParameters
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -270,8 +254,7 @@ class Magnetometer(Phidget):
 
 	def saveCorrectionParameters(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_saveCorrectionParameters
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_saveCorrectionParameters
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -284,8 +267,7 @@ class Magnetometer(Phidget):
 		_Timestamp = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMagnetometer_getTimestamp
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMagnetometer_getTimestamp
 			result = __func(self.handle, ctypes.byref(_Timestamp))
 		except RuntimeError:
 			raise
@@ -25,8 +25,7 @@ class Manager:
 		self._onDetach = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetManager_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetManager_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -36,8 +35,7 @@ class Manager:
 
 	def __del__(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetManager_delete
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetManager_delete
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -49,8 +47,7 @@ class Manager:
 		if self._Attach == None:
 			return
 		try:
-			__func = PhidgetSupport.getDll().Phidget_retain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_retain
 			result = __func(ctypes.c_void_p(Channel))
 		except RuntimeError:
 			raise
@@ -69,8 +66,7 @@ class Manager:
 			self._onAttach = self._AttachFactory(self._localAttachEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetManager_setOnAttachHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetManager_setOnAttachHandler
 			res = __func(self.handle, self._onAttach, None)
 		except RuntimeError:
 			self._Attach = None
@@ -80,8 +76,7 @@ class Manager:
 		if self._Detach == None:
 			return
 		try:
-			__func = PhidgetSupport.getDll().Phidget_retain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_retain
 			result = __func(ctypes.c_void_p(Channel))
 		except RuntimeError:
 			raise
@@ -100,8 +95,7 @@ class Manager:
 			self._onDetach = self._DetachFactory(self._localDetachEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetManager_setOnDetachHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetManager_setOnDetachHandler
 			res = __func(self.handle, self._onDetach, None)
 		except RuntimeError:
 			self._Detach = None
@@ -109,8 +103,7 @@ class Manager:
 
 	def close(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetManager_close
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetManager_close
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -121,8 +114,7 @@ class Manager:
 
 	def open(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetManager_open
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetManager_open
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -36,8 +36,7 @@ class MotorPositionController(Phidget):
 		self._onPositionChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -62,8 +61,7 @@ class MotorPositionController(Phidget):
 			self._onDutyCycleUpdate = self._DutyCycleUpdateFactory(self._localDutyCycleUpdateEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setOnDutyCycleUpdateHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setOnDutyCycleUpdateHandler
 			res = __func(self.handle, self._onDutyCycleUpdate, None)
 		except RuntimeError:
 			self._DutyCycleUpdate = None
@@ -83,8 +81,7 @@ class MotorPositionController(Phidget):
 			self._onPositionChange = self._PositionChangeFactory(self._localPositionChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setOnPositionChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setOnPositionChangeHandler
 			res = __func(self.handle, self._onPositionChange, None)
 		except RuntimeError:
 			self._PositionChange = None
@@ -94,8 +91,7 @@ class MotorPositionController(Phidget):
 		_Acceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getAcceleration
 			result = __func(self.handle, ctypes.byref(_Acceleration))
 		except RuntimeError:
 			raise
@@ -109,8 +105,7 @@ class MotorPositionController(Phidget):
 		_Acceleration = ctypes.c_double(Acceleration)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setAcceleration
 			result = __func(self.handle, _Acceleration)
 		except RuntimeError:
 			raise
@@ -123,8 +118,7 @@ class MotorPositionController(Phidget):
 		_MinAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMinAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMinAcceleration
 			result = __func(self.handle, ctypes.byref(_MinAcceleration))
 		except RuntimeError:
 			raise
@@ -138,8 +132,7 @@ class MotorPositionController(Phidget):
 		_MaxAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMaxAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMaxAcceleration
 			result = __func(self.handle, ctypes.byref(_MaxAcceleration))
 		except RuntimeError:
 			raise
@@ -153,8 +146,7 @@ class MotorPositionController(Phidget):
 		_CurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getCurrentLimit
 			result = __func(self.handle, ctypes.byref(_CurrentLimit))
 		except RuntimeError:
 			raise
@@ -168,8 +160,7 @@ class MotorPositionController(Phidget):
 		_CurrentLimit = ctypes.c_double(CurrentLimit)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setCurrentLimit
 			result = __func(self.handle, _CurrentLimit)
 		except RuntimeError:
 			raise
@@ -182,8 +173,7 @@ class MotorPositionController(Phidget):
 		_MinCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMinCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMinCurrentLimit
 			result = __func(self.handle, ctypes.byref(_MinCurrentLimit))
 		except RuntimeError:
 			raise
@@ -197,8 +187,7 @@ class MotorPositionController(Phidget):
 		_MaxCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMaxCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMaxCurrentLimit
 			result = __func(self.handle, ctypes.byref(_MaxCurrentLimit))
 		except RuntimeError:
 			raise
@@ -212,8 +201,7 @@ class MotorPositionController(Phidget):
 		_CurrentRegulatorGain = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getCurrentRegulatorGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getCurrentRegulatorGain
 			result = __func(self.handle, ctypes.byref(_CurrentRegulatorGain))
 		except RuntimeError:
 			raise
@@ -227,8 +215,7 @@ class MotorPositionController(Phidget):
 		_CurrentRegulatorGain = ctypes.c_double(CurrentRegulatorGain)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setCurrentRegulatorGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setCurrentRegulatorGain
 			result = __func(self.handle, _CurrentRegulatorGain)
 		except RuntimeError:
 			raise
@@ -241,8 +228,7 @@ class MotorPositionController(Phidget):
 		_MinCurrentRegulatorGain = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMinCurrentRegulatorGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMinCurrentRegulatorGain
 			result = __func(self.handle, ctypes.byref(_MinCurrentRegulatorGain))
 		except RuntimeError:
 			raise
@@ -256,8 +242,7 @@ class MotorPositionController(Phidget):
 		_MaxCurrentRegulatorGain = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMaxCurrentRegulatorGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMaxCurrentRegulatorGain
 			result = __func(self.handle, ctypes.byref(_MaxCurrentRegulatorGain))
 		except RuntimeError:
 			raise
@@ -271,8 +256,7 @@ class MotorPositionController(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -286,8 +270,7 @@ class MotorPositionController(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -300,8 +283,7 @@ class MotorPositionController(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -315,8 +297,7 @@ class MotorPositionController(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -330,8 +311,7 @@ class MotorPositionController(Phidget):
 		_DeadBand = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getDeadBand
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getDeadBand
 			result = __func(self.handle, ctypes.byref(_DeadBand))
 		except RuntimeError:
 			raise
@@ -345,8 +325,7 @@ class MotorPositionController(Phidget):
 		_DeadBand = ctypes.c_double(DeadBand)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setDeadBand
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setDeadBand
 			result = __func(self.handle, _DeadBand)
 		except RuntimeError:
 			raise
@@ -359,8 +338,7 @@ class MotorPositionController(Phidget):
 		_DutyCycle = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getDutyCycle
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getDutyCycle
 			result = __func(self.handle, ctypes.byref(_DutyCycle))
 		except RuntimeError:
 			raise
@@ -374,8 +352,7 @@ class MotorPositionController(Phidget):
 		_Engaged = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getEngaged
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getEngaged
 			result = __func(self.handle, ctypes.byref(_Engaged))
 		except RuntimeError:
 			raise
@@ -389,8 +366,7 @@ class MotorPositionController(Phidget):
 		_Engaged = ctypes.c_int(Engaged)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setEngaged
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setEngaged
 			result = __func(self.handle, _Engaged)
 		except RuntimeError:
 			raise
@@ -403,8 +379,7 @@ class MotorPositionController(Phidget):
 		_FanMode = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getFanMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getFanMode
 			result = __func(self.handle, ctypes.byref(_FanMode))
 		except RuntimeError:
 			raise
@@ -418,8 +393,7 @@ class MotorPositionController(Phidget):
 		_FanMode = ctypes.c_int(FanMode)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setFanMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setFanMode
 			result = __func(self.handle, _FanMode)
 		except RuntimeError:
 			raise
@@ -432,8 +406,7 @@ class MotorPositionController(Phidget):
 		_IOMode = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getIOMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getIOMode
 			result = __func(self.handle, ctypes.byref(_IOMode))
 		except RuntimeError:
 			raise
@@ -447,8 +420,7 @@ class MotorPositionController(Phidget):
 		_IOMode = ctypes.c_int(IOMode)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setIOMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setIOMode
 			result = __func(self.handle, _IOMode)
 		except RuntimeError:
 			raise
@@ -461,8 +433,7 @@ class MotorPositionController(Phidget):
 		_Kd = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getKd
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getKd
 			result = __func(self.handle, ctypes.byref(_Kd))
 		except RuntimeError:
 			raise
@@ -476,8 +447,7 @@ class MotorPositionController(Phidget):
 		_Kd = ctypes.c_double(Kd)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setKd
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setKd
 			result = __func(self.handle, _Kd)
 		except RuntimeError:
 			raise
@@ -490,8 +460,7 @@ class MotorPositionController(Phidget):
 		_Ki = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getKi
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getKi
 			result = __func(self.handle, ctypes.byref(_Ki))
 		except RuntimeError:
 			raise
@@ -505,8 +474,7 @@ class MotorPositionController(Phidget):
 		_Ki = ctypes.c_double(Ki)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setKi
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setKi
 			result = __func(self.handle, _Ki)
 		except RuntimeError:
 			raise
@@ -519,8 +487,7 @@ class MotorPositionController(Phidget):
 		_Kp = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getKp
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getKp
 			result = __func(self.handle, ctypes.byref(_Kp))
 		except RuntimeError:
 			raise
@@ -534,8 +501,7 @@ class MotorPositionController(Phidget):
 		_Kp = ctypes.c_double(Kp)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setKp
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setKp
 			result = __func(self.handle, _Kp)
 		except RuntimeError:
 			raise
@@ -548,8 +514,7 @@ class MotorPositionController(Phidget):
 		_Position = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getPosition
 			result = __func(self.handle, ctypes.byref(_Position))
 		except RuntimeError:
 			raise
@@ -563,8 +528,7 @@ class MotorPositionController(Phidget):
 		_MinPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMinPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMinPosition
 			result = __func(self.handle, ctypes.byref(_MinPosition))
 		except RuntimeError:
 			raise
@@ -578,8 +542,7 @@ class MotorPositionController(Phidget):
 		_MaxPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMaxPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMaxPosition
 			result = __func(self.handle, ctypes.byref(_MaxPosition))
 		except RuntimeError:
 			raise
@@ -593,8 +556,7 @@ class MotorPositionController(Phidget):
 		_positionOffset = ctypes.c_double(positionOffset)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_addPositionOffset
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_addPositionOffset
 			result = __func(self.handle, _positionOffset)
 		except RuntimeError:
 			raise
@@ -607,8 +569,7 @@ class MotorPositionController(Phidget):
 		_RescaleFactor = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getRescaleFactor
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getRescaleFactor
 			result = __func(self.handle, ctypes.byref(_RescaleFactor))
 		except RuntimeError:
 			raise
@@ -622,8 +583,7 @@ class MotorPositionController(Phidget):
 		_RescaleFactor = ctypes.c_double(RescaleFactor)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setRescaleFactor
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setRescaleFactor
 			result = __func(self.handle, _RescaleFactor)
 		except RuntimeError:
 			raise
@@ -636,8 +596,7 @@ class MotorPositionController(Phidget):
 		_StallVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getStallVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getStallVelocity
 			result = __func(self.handle, ctypes.byref(_StallVelocity))
 		except RuntimeError:
 			raise
@@ -651,8 +610,7 @@ class MotorPositionController(Phidget):
 		_StallVelocity = ctypes.c_double(StallVelocity)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setStallVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setStallVelocity
 			result = __func(self.handle, _StallVelocity)
 		except RuntimeError:
 			raise
@@ -665,8 +623,7 @@ class MotorPositionController(Phidget):
 		_MinStallVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMinStallVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMinStallVelocity
 			result = __func(self.handle, ctypes.byref(_MinStallVelocity))
 		except RuntimeError:
 			raise
@@ -680,8 +637,7 @@ class MotorPositionController(Phidget):
 		_MaxStallVelocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMaxStallVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMaxStallVelocity
 			result = __func(self.handle, ctypes.byref(_MaxStallVelocity))
 		except RuntimeError:
 			raise
@@ -695,8 +651,7 @@ class MotorPositionController(Phidget):
 		_TargetPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getTargetPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getTargetPosition
 			result = __func(self.handle, ctypes.byref(_TargetPosition))
 		except RuntimeError:
 			raise
@@ -710,8 +665,7 @@ class MotorPositionController(Phidget):
 		_TargetPosition = ctypes.c_double(TargetPosition)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setTargetPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setTargetPosition
 			result = __func(self.handle, _TargetPosition)
 		except RuntimeError:
 			raise
@@ -727,7 +681,7 @@ class MotorPositionController(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -745,8 +699,7 @@ class MotorPositionController(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setTargetPosition_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setTargetPosition_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsetTargetPosition_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -760,8 +713,7 @@ class MotorPositionController(Phidget):
 		_VelocityLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getVelocityLimit
 			result = __func(self.handle, ctypes.byref(_VelocityLimit))
 		except RuntimeError:
 			raise
@@ -775,8 +727,7 @@ class MotorPositionController(Phidget):
 		_VelocityLimit = ctypes.c_double(VelocityLimit)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_setVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_setVelocityLimit
 			result = __func(self.handle, _VelocityLimit)
 		except RuntimeError:
 			raise
@@ -789,8 +740,7 @@ class MotorPositionController(Phidget):
 		_MinVelocityLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMinVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMinVelocityLimit
 			result = __func(self.handle, ctypes.byref(_MinVelocityLimit))
 		except RuntimeError:
 			raise
@@ -804,8 +754,7 @@ class MotorPositionController(Phidget):
 		_MaxVelocityLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetMotorPositionController_getMaxVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetMotorPositionController_getMaxVelocityLimit
 			result = __func(self.handle, ctypes.byref(_MaxVelocityLimit))
 		except RuntimeError:
 			raise
@@ -19,8 +19,7 @@ class PHSensor(Phidget):
 		self._onPHChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -45,8 +44,7 @@ class PHSensor(Phidget):
 			self._onPHChange = self._PHChangeFactory(self._localPHChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_setOnPHChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_setOnPHChangeHandler
 			res = __func(self.handle, self._onPHChange, None)
 		except RuntimeError:
 			self._PHChange = None
@@ -56,8 +54,7 @@ class PHSensor(Phidget):
 		_CorrectionTemperature = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getCorrectionTemperature
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getCorrectionTemperature
 			result = __func(self.handle, ctypes.byref(_CorrectionTemperature))
 		except RuntimeError:
 			raise
@@ -71,8 +68,7 @@ class PHSensor(Phidget):
 		_CorrectionTemperature = ctypes.c_double(CorrectionTemperature)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_setCorrectionTemperature
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_setCorrectionTemperature
 			result = __func(self.handle, _CorrectionTemperature)
 		except RuntimeError:
 			raise
@@ -85,8 +81,7 @@ class PHSensor(Phidget):
 		_MinCorrectionTemperature = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getMinCorrectionTemperature
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getMinCorrectionTemperature
 			result = __func(self.handle, ctypes.byref(_MinCorrectionTemperature))
 		except RuntimeError:
 			raise
@@ -100,8 +95,7 @@ class PHSensor(Phidget):
 		_MaxCorrectionTemperature = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getMaxCorrectionTemperature
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getMaxCorrectionTemperature
 			result = __func(self.handle, ctypes.byref(_MaxCorrectionTemperature))
 		except RuntimeError:
 			raise
@@ -115,8 +109,7 @@ class PHSensor(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -130,8 +123,7 @@ class PHSensor(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -144,8 +136,7 @@ class PHSensor(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -159,8 +150,7 @@ class PHSensor(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -174,8 +164,7 @@ class PHSensor(Phidget):
 		_PH = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getPH
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getPH
 			result = __func(self.handle, ctypes.byref(_PH))
 		except RuntimeError:
 			raise
@@ -189,8 +178,7 @@ class PHSensor(Phidget):
 		_MinPH = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getMinPH
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getMinPH
 			result = __func(self.handle, ctypes.byref(_MinPH))
 		except RuntimeError:
 			raise
@@ -204,8 +192,7 @@ class PHSensor(Phidget):
 		_MaxPH = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getMaxPH
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getMaxPH
 			result = __func(self.handle, ctypes.byref(_MaxPH))
 		except RuntimeError:
 			raise
@@ -219,8 +206,7 @@ class PHSensor(Phidget):
 		_PHChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getPHChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getPHChangeTrigger
 			result = __func(self.handle, ctypes.byref(_PHChangeTrigger))
 		except RuntimeError:
 			raise
@@ -234,8 +220,7 @@ class PHSensor(Phidget):
 		_PHChangeTrigger = ctypes.c_double(PHChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_setPHChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_setPHChangeTrigger
 			result = __func(self.handle, _PHChangeTrigger)
 		except RuntimeError:
 			raise
@@ -248,8 +233,7 @@ class PHSensor(Phidget):
 		_MinPHChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getMinPHChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getMinPHChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinPHChangeTrigger))
 		except RuntimeError:
 			raise
@@ -263,8 +247,7 @@ class PHSensor(Phidget):
 		_MaxPHChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPHSensor_getMaxPHChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPHSensor_getMaxPHChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxPHChangeTrigger))
 		except RuntimeError:
 			raise
@@ -13,8 +13,7 @@ class PowerGuard(Phidget):
 		self.handle = ctypes.c_void_p()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPowerGuard_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPowerGuard_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -29,8 +28,7 @@ class PowerGuard(Phidget):
 		_FanMode = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPowerGuard_getFanMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPowerGuard_getFanMode
 			result = __func(self.handle, ctypes.byref(_FanMode))
 		except RuntimeError:
 			raise
@@ -44,8 +42,7 @@ class PowerGuard(Phidget):
 		_FanMode = ctypes.c_int(FanMode)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPowerGuard_setFanMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPowerGuard_setFanMode
 			result = __func(self.handle, _FanMode)
 		except RuntimeError:
 			raise
@@ -58,8 +55,7 @@ class PowerGuard(Phidget):
 		_OverVoltage = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPowerGuard_getOverVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPowerGuard_getOverVoltage
 			result = __func(self.handle, ctypes.byref(_OverVoltage))
 		except RuntimeError:
 			raise
@@ -73,8 +69,7 @@ class PowerGuard(Phidget):
 		_OverVoltage = ctypes.c_double(OverVoltage)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPowerGuard_setOverVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPowerGuard_setOverVoltage
 			result = __func(self.handle, _OverVoltage)
 		except RuntimeError:
 			raise
@@ -87,8 +82,7 @@ class PowerGuard(Phidget):
 		_MinOverVoltage = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPowerGuard_getMinOverVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPowerGuard_getMinOverVoltage
 			result = __func(self.handle, ctypes.byref(_MinOverVoltage))
 		except RuntimeError:
 			raise
@@ -102,8 +96,7 @@ class PowerGuard(Phidget):
 		_MaxOverVoltage = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPowerGuard_getMaxOverVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPowerGuard_getMaxOverVoltage
 			result = __func(self.handle, ctypes.byref(_MaxOverVoltage))
 		except RuntimeError:
 			raise
@@ -117,8 +110,7 @@ class PowerGuard(Phidget):
 		_PowerEnabled = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPowerGuard_getPowerEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPowerGuard_getPowerEnabled
 			result = __func(self.handle, ctypes.byref(_PowerEnabled))
 		except RuntimeError:
 			raise
@@ -132,8 +124,7 @@ class PowerGuard(Phidget):
 		_PowerEnabled = ctypes.c_int(PowerEnabled)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPowerGuard_setPowerEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPowerGuard_setPowerEnabled
 			result = __func(self.handle, _PowerEnabled)
 		except RuntimeError:
 			raise
@@ -19,8 +19,7 @@ class PressureSensor(Phidget):
 		self._onPressureChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -45,8 +44,7 @@ class PressureSensor(Phidget):
 			self._onPressureChange = self._PressureChangeFactory(self._localPressureChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_setOnPressureChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_setOnPressureChangeHandler
 			res = __func(self.handle, self._onPressureChange, None)
 		except RuntimeError:
 			self._PressureChange = None
@@ -56,8 +54,7 @@ class PressureSensor(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -71,8 +68,7 @@ class PressureSensor(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -85,8 +81,7 @@ class PressureSensor(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -100,8 +95,7 @@ class PressureSensor(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -115,8 +109,7 @@ class PressureSensor(Phidget):
 		_Pressure = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_getPressure
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_getPressure
 			result = __func(self.handle, ctypes.byref(_Pressure))
 		except RuntimeError:
 			raise
@@ -130,8 +123,7 @@ class PressureSensor(Phidget):
 		_MinPressure = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_getMinPressure
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_getMinPressure
 			result = __func(self.handle, ctypes.byref(_MinPressure))
 		except RuntimeError:
 			raise
@@ -145,8 +137,7 @@ class PressureSensor(Phidget):
 		_MaxPressure = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_getMaxPressure
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_getMaxPressure
 			result = __func(self.handle, ctypes.byref(_MaxPressure))
 		except RuntimeError:
 			raise
@@ -160,8 +151,7 @@ class PressureSensor(Phidget):
 		_PressureChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_getPressureChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_getPressureChangeTrigger
 			result = __func(self.handle, ctypes.byref(_PressureChangeTrigger))
 		except RuntimeError:
 			raise
@@ -175,8 +165,7 @@ class PressureSensor(Phidget):
 		_PressureChangeTrigger = ctypes.c_double(PressureChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_setPressureChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_setPressureChangeTrigger
 			result = __func(self.handle, _PressureChangeTrigger)
 		except RuntimeError:
 			raise
@@ -189,8 +178,7 @@ class PressureSensor(Phidget):
 		_MinPressureChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_getMinPressureChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_getMinPressureChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinPressureChangeTrigger))
 		except RuntimeError:
 			raise
@@ -204,8 +192,7 @@ class PressureSensor(Phidget):
 		_MaxPressureChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetPressureSensor_getMaxPressureChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetPressureSensor_getMaxPressureChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxPressureChangeTrigger))
 		except RuntimeError:
 			raise
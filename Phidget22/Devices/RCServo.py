@@ -42,8 +42,7 @@ class RCServo(Phidget):
 		self._onVelocityChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -68,8 +67,7 @@ class RCServo(Phidget):
 			self._onPositionChange = self._PositionChangeFactory(self._localPositionChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setOnPositionChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setOnPositionChangeHandler
 			res = __func(self.handle, self._onPositionChange, None)
 		except RuntimeError:
 			self._PositionChange = None
@@ -89,8 +87,7 @@ class RCServo(Phidget):
 			self._onTargetPositionReached = self._TargetPositionReachedFactory(self._localTargetPositionReachedEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setOnTargetPositionReachedHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setOnTargetPositionReachedHandler
 			res = __func(self.handle, self._onTargetPositionReached, None)
 		except RuntimeError:
 			self._TargetPositionReached = None
@@ -110,8 +107,7 @@ class RCServo(Phidget):
 			self._onVelocityChange = self._VelocityChangeFactory(self._localVelocityChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setOnVelocityChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setOnVelocityChangeHandler
 			res = __func(self.handle, self._onVelocityChange, None)
 		except RuntimeError:
 			self._VelocityChange = None
@@ -121,8 +117,7 @@ class RCServo(Phidget):
 		_Acceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getAcceleration
 			result = __func(self.handle, ctypes.byref(_Acceleration))
 		except RuntimeError:
 			raise
@@ -136,8 +131,7 @@ class RCServo(Phidget):
 		_Acceleration = ctypes.c_double(Acceleration)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setAcceleration
 			result = __func(self.handle, _Acceleration)
 		except RuntimeError:
 			raise
@@ -150,8 +144,7 @@ class RCServo(Phidget):
 		_MinAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMinAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMinAcceleration
 			result = __func(self.handle, ctypes.byref(_MinAcceleration))
 		except RuntimeError:
 			raise
@@ -165,8 +158,7 @@ class RCServo(Phidget):
 		_MaxAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMaxAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMaxAcceleration
 			result = __func(self.handle, ctypes.byref(_MaxAcceleration))
 		except RuntimeError:
 			raise
@@ -180,8 +172,7 @@ class RCServo(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -195,8 +186,7 @@ class RCServo(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -209,8 +199,7 @@ class RCServo(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -224,8 +213,7 @@ class RCServo(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -239,8 +227,7 @@ class RCServo(Phidget):
 		_Engaged = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getEngaged
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getEngaged
 			result = __func(self.handle, ctypes.byref(_Engaged))
 		except RuntimeError:
 			raise
@@ -254,8 +241,7 @@ class RCServo(Phidget):
 		_Engaged = ctypes.c_int(Engaged)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setEngaged
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setEngaged
 			result = __func(self.handle, _Engaged)
 		except RuntimeError:
 			raise
@@ -268,8 +254,7 @@ class RCServo(Phidget):
 		_IsMoving = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getIsMoving
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getIsMoving
 			result = __func(self.handle, ctypes.byref(_IsMoving))
 		except RuntimeError:
 			raise
@@ -283,8 +268,7 @@ class RCServo(Phidget):
 		_Position = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getPosition
 			result = __func(self.handle, ctypes.byref(_Position))
 		except RuntimeError:
 			raise
@@ -298,8 +282,7 @@ class RCServo(Phidget):
 		_MinPosition = ctypes.c_double(MinPosition)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setMinPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setMinPosition
 			result = __func(self.handle, _MinPosition)
 		except RuntimeError:
 			raise
@@ -312,8 +295,7 @@ class RCServo(Phidget):
 		_MinPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMinPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMinPosition
 			result = __func(self.handle, ctypes.byref(_MinPosition))
 		except RuntimeError:
 			raise
@@ -327,8 +309,7 @@ class RCServo(Phidget):
 		_MaxPosition = ctypes.c_double(MaxPosition)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setMaxPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setMaxPosition
 			result = __func(self.handle, _MaxPosition)
 		except RuntimeError:
 			raise
@@ -341,8 +322,7 @@ class RCServo(Phidget):
 		_MaxPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMaxPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMaxPosition
 			result = __func(self.handle, ctypes.byref(_MaxPosition))
 		except RuntimeError:
 			raise
@@ -356,8 +336,7 @@ class RCServo(Phidget):
 		_MinPulseWidth = ctypes.c_double(MinPulseWidth)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setMinPulseWidth
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setMinPulseWidth
 			result = __func(self.handle, _MinPulseWidth)
 		except RuntimeError:
 			raise
@@ -370,8 +349,7 @@ class RCServo(Phidget):
 		_MinPulseWidth = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMinPulseWidth
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMinPulseWidth
 			result = __func(self.handle, ctypes.byref(_MinPulseWidth))
 		except RuntimeError:
 			raise
@@ -385,8 +363,7 @@ class RCServo(Phidget):
 		_MaxPulseWidth = ctypes.c_double(MaxPulseWidth)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setMaxPulseWidth
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setMaxPulseWidth
 			result = __func(self.handle, _MaxPulseWidth)
 		except RuntimeError:
 			raise
@@ -399,8 +376,7 @@ class RCServo(Phidget):
 		_MaxPulseWidth = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMaxPulseWidth
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMaxPulseWidth
 			result = __func(self.handle, ctypes.byref(_MaxPulseWidth))
 		except RuntimeError:
 			raise
@@ -414,8 +390,7 @@ class RCServo(Phidget):
 		_MinPulseWidthLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMinPulseWidthLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMinPulseWidthLimit
 			result = __func(self.handle, ctypes.byref(_MinPulseWidthLimit))
 		except RuntimeError:
 			raise
@@ -429,8 +404,7 @@ class RCServo(Phidget):
 		_MaxPulseWidthLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMaxPulseWidthLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMaxPulseWidthLimit
 			result = __func(self.handle, ctypes.byref(_MaxPulseWidthLimit))
 		except RuntimeError:
 			raise
@@ -444,8 +418,7 @@ class RCServo(Phidget):
 		_SpeedRampingState = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getSpeedRampingState
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getSpeedRampingState
 			result = __func(self.handle, ctypes.byref(_SpeedRampingState))
 		except RuntimeError:
 			raise
@@ -459,8 +432,7 @@ class RCServo(Phidget):
 		_SpeedRampingState = ctypes.c_int(SpeedRampingState)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setSpeedRampingState
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setSpeedRampingState
 			result = __func(self.handle, _SpeedRampingState)
 		except RuntimeError:
 			raise
@@ -473,8 +445,7 @@ class RCServo(Phidget):
 		_TargetPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getTargetPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getTargetPosition
 			result = __func(self.handle, ctypes.byref(_TargetPosition))
 		except RuntimeError:
 			raise
@@ -488,8 +459,7 @@ class RCServo(Phidget):
 		_TargetPosition = ctypes.c_double(TargetPosition)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setTargetPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setTargetPosition
 			result = __func(self.handle, _TargetPosition)
 		except RuntimeError:
 			raise
@@ -505,7 +475,7 @@ class RCServo(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -523,8 +493,7 @@ class RCServo(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setTargetPosition_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setTargetPosition_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsetTargetPosition_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -538,8 +507,7 @@ class RCServo(Phidget):
 		_Torque = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getTorque
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getTorque
 			result = __func(self.handle, ctypes.byref(_Torque))
 		except RuntimeError:
 			raise
@@ -553,8 +521,7 @@ class RCServo(Phidget):
 		_Torque = ctypes.c_double(Torque)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setTorque
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setTorque
 			result = __func(self.handle, _Torque)
 		except RuntimeError:
 			raise
@@ -567,8 +534,7 @@ class RCServo(Phidget):
 		_MinTorque = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMinTorque
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMinTorque
 			result = __func(self.handle, ctypes.byref(_MinTorque))
 		except RuntimeError:
 			raise
@@ -582,8 +548,7 @@ class RCServo(Phidget):
 		_MaxTorque = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMaxTorque
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMaxTorque
 			result = __func(self.handle, ctypes.byref(_MaxTorque))
 		except RuntimeError:
 			raise
@@ -597,8 +562,7 @@ class RCServo(Phidget):
 		_Velocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getVelocity
 			result = __func(self.handle, ctypes.byref(_Velocity))
 		except RuntimeError:
 			raise
@@ -612,8 +576,7 @@ class RCServo(Phidget):
 		_VelocityLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getVelocityLimit
 			result = __func(self.handle, ctypes.byref(_VelocityLimit))
 		except RuntimeError:
 			raise
@@ -627,8 +590,7 @@ class RCServo(Phidget):
 		_VelocityLimit = ctypes.c_double(VelocityLimit)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setVelocityLimit
 			result = __func(self.handle, _VelocityLimit)
 		except RuntimeError:
 			raise
@@ -641,8 +603,7 @@ class RCServo(Phidget):
 		_MinVelocityLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMinVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMinVelocityLimit
 			result = __func(self.handle, ctypes.byref(_MinVelocityLimit))
 		except RuntimeError:
 			raise
@@ -656,8 +617,7 @@ class RCServo(Phidget):
 		_MaxVelocityLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getMaxVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getMaxVelocityLimit
 			result = __func(self.handle, ctypes.byref(_MaxVelocityLimit))
 		except RuntimeError:
 			raise
@@ -671,8 +631,7 @@ class RCServo(Phidget):
 		_Voltage = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_getVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_getVoltage
 			result = __func(self.handle, ctypes.byref(_Voltage))
 		except RuntimeError:
 			raise
@@ -686,8 +645,7 @@ class RCServo(Phidget):
 		_Voltage = ctypes.c_int(Voltage)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRCServo_setVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRCServo_setVoltage
 			result = __func(self.handle, _Voltage)
 		except RuntimeError:
 			raise
@@ -27,8 +27,7 @@ class RFID(Phidget):
 		self._onTagLost = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRFID_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRFID_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -54,8 +53,7 @@ class RFID(Phidget):
 			self._onTag = self._TagFactory(self._localTagEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRFID_setOnTagHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRFID_setOnTagHandler
 			res = __func(self.handle, self._onTag, None)
 		except RuntimeError:
 			self._Tag = None
@@ -76,8 +74,7 @@ class RFID(Phidget):
 			self._onTagLost = self._TagLostFactory(self._localTagLostEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRFID_setOnTagLostHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRFID_setOnTagLostHandler
 			res = __func(self.handle, self._onTagLost, None)
 		except RuntimeError:
 			self._TagLost = None
@@ -87,8 +84,7 @@ class RFID(Phidget):
 		_AntennaEnabled = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRFID_getAntennaEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRFID_getAntennaEnabled
 			result = __func(self.handle, ctypes.byref(_AntennaEnabled))
 		except RuntimeError:
 			raise
@@ -102,8 +98,7 @@ class RFID(Phidget):
 		_AntennaEnabled = ctypes.c_int(AntennaEnabled)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRFID_setAntennaEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRFID_setAntennaEnabled
 			result = __func(self.handle, _AntennaEnabled)
 		except RuntimeError:
 			raise
@@ -118,8 +113,7 @@ class RFID(Phidget):
 		_protocol = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRFID_getLastTag
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRFID_getLastTag
 			result = __func(self.handle, ctypes.byref(_tagString), _tagStringLen, ctypes.byref(_protocol))
 		except RuntimeError:
 			raise
@@ -133,8 +127,7 @@ class RFID(Phidget):
 		_TagPresent = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRFID_getTagPresent
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRFID_getTagPresent
 			result = __func(self.handle, ctypes.byref(_TagPresent))
 		except RuntimeError:
 			raise
@@ -150,8 +143,7 @@ class RFID(Phidget):
 		_lockTag = ctypes.c_int(lockTag)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetRFID_write
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetRFID_write
 			result = __func(self.handle, ctypes.byref(_tagString), _protocol, _lockTag)
 		except RuntimeError:
 			raise
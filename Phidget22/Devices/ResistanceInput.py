@@ -20,8 +20,7 @@ class ResistanceInput(Phidget):
 		self._onResistanceChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -46,8 +45,7 @@ class ResistanceInput(Phidget):
 			self._onResistanceChange = self._ResistanceChangeFactory(self._localResistanceChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_setOnResistanceChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_setOnResistanceChangeHandler
 			res = __func(self.handle, self._onResistanceChange, None)
 		except RuntimeError:
 			self._ResistanceChange = None
@@ -57,8 +55,7 @@ class ResistanceInput(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -72,8 +69,7 @@ class ResistanceInput(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -86,8 +82,7 @@ class ResistanceInput(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -101,8 +96,7 @@ class ResistanceInput(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -116,8 +110,7 @@ class ResistanceInput(Phidget):
 		_Resistance = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getResistance
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getResistance
 			result = __func(self.handle, ctypes.byref(_Resistance))
 		except RuntimeError:
 			raise
@@ -131,8 +124,7 @@ class ResistanceInput(Phidget):
 		_MinResistance = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getMinResistance
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getMinResistance
 			result = __func(self.handle, ctypes.byref(_MinResistance))
 		except RuntimeError:
 			raise
@@ -146,8 +138,7 @@ class ResistanceInput(Phidget):
 		_MaxResistance = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getMaxResistance
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getMaxResistance
 			result = __func(self.handle, ctypes.byref(_MaxResistance))
 		except RuntimeError:
 			raise
@@ -161,8 +152,7 @@ class ResistanceInput(Phidget):
 		_ResistanceChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getResistanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getResistanceChangeTrigger
 			result = __func(self.handle, ctypes.byref(_ResistanceChangeTrigger))
 		except RuntimeError:
 			raise
@@ -176,8 +166,7 @@ class ResistanceInput(Phidget):
 		_ResistanceChangeTrigger = ctypes.c_double(ResistanceChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_setResistanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_setResistanceChangeTrigger
 			result = __func(self.handle, _ResistanceChangeTrigger)
 		except RuntimeError:
 			raise
@@ -190,8 +179,7 @@ class ResistanceInput(Phidget):
 		_MinResistanceChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getMinResistanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getMinResistanceChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinResistanceChangeTrigger))
 		except RuntimeError:
 			raise
@@ -205,8 +193,7 @@ class ResistanceInput(Phidget):
 		_MaxResistanceChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getMaxResistanceChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getMaxResistanceChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxResistanceChangeTrigger))
 		except RuntimeError:
 			raise
@@ -220,8 +207,7 @@ class ResistanceInput(Phidget):
 		_RTDWireSetup = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_getRTDWireSetup
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_getRTDWireSetup
 			result = __func(self.handle, ctypes.byref(_RTDWireSetup))
 		except RuntimeError:
 			raise
@@ -235,8 +221,7 @@ class ResistanceInput(Phidget):
 		_RTDWireSetup = ctypes.c_int(RTDWireSetup)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetResistanceInput_setRTDWireSetup
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetResistanceInput_setRTDWireSetup
 			result = __func(self.handle, _RTDWireSetup)
 		except RuntimeError:
 			raise
@@ -20,8 +20,7 @@ class SoundSensor(Phidget):
 		self._onSPLChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -46,8 +45,7 @@ class SoundSensor(Phidget):
 			self._onSPLChange = self._SPLChangeFactory(self._localSPLChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_setOnSPLChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_setOnSPLChangeHandler
 			res = __func(self.handle, self._onSPLChange, None)
 		except RuntimeError:
 			self._SPLChange = None
@@ -57,8 +55,7 @@ class SoundSensor(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -72,8 +69,7 @@ class SoundSensor(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -86,8 +82,7 @@ class SoundSensor(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -101,8 +96,7 @@ class SoundSensor(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -116,8 +110,7 @@ class SoundSensor(Phidget):
 		_dB = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getdB
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getdB
 			result = __func(self.handle, ctypes.byref(_dB))
 		except RuntimeError:
 			raise
@@ -131,8 +124,7 @@ class SoundSensor(Phidget):
 		_MaxdB = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getMaxdB
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getMaxdB
 			result = __func(self.handle, ctypes.byref(_MaxdB))
 		except RuntimeError:
 			raise
@@ -146,8 +138,7 @@ class SoundSensor(Phidget):
 		_dBA = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getdBA
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getdBA
 			result = __func(self.handle, ctypes.byref(_dBA))
 		except RuntimeError:
 			raise
@@ -161,8 +152,7 @@ class SoundSensor(Phidget):
 		_dBC = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getdBC
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getdBC
 			result = __func(self.handle, ctypes.byref(_dBC))
 		except RuntimeError:
 			raise
@@ -176,8 +166,7 @@ class SoundSensor(Phidget):
 		_NoiseFloor = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getNoiseFloor
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getNoiseFloor
 			result = __func(self.handle, ctypes.byref(_NoiseFloor))
 		except RuntimeError:
 			raise
@@ -191,8 +180,7 @@ class SoundSensor(Phidget):
 		_Octaves = (ctypes.c_double * 10)()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getOctaves
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getOctaves
 			result = __func(self.handle, ctypes.byref(_Octaves))
 		except RuntimeError:
 			raise
@@ -206,8 +194,7 @@ class SoundSensor(Phidget):
 		_SPLChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getSPLChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getSPLChangeTrigger
 			result = __func(self.handle, ctypes.byref(_SPLChangeTrigger))
 		except RuntimeError:
 			raise
@@ -221,8 +208,7 @@ class SoundSensor(Phidget):
 		_SPLChangeTrigger = ctypes.c_double(SPLChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_setSPLChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_setSPLChangeTrigger
 			result = __func(self.handle, _SPLChangeTrigger)
 		except RuntimeError:
 			raise
@@ -235,8 +221,7 @@ class SoundSensor(Phidget):
 		_MinSPLChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getMinSPLChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getMinSPLChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinSPLChangeTrigger))
 		except RuntimeError:
 			raise
@@ -250,8 +235,7 @@ class SoundSensor(Phidget):
 		_MaxSPLChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getMaxSPLChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getMaxSPLChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxSPLChangeTrigger))
 		except RuntimeError:
 			raise
@@ -265,8 +249,7 @@ class SoundSensor(Phidget):
 		_SPLRange = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_getSPLRange
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_getSPLRange
 			result = __func(self.handle, ctypes.byref(_SPLRange))
 		except RuntimeError:
 			raise
@@ -280,8 +263,7 @@ class SoundSensor(Phidget):
 		_SPLRange = ctypes.c_int(SPLRange)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSoundSensor_setSPLRange
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSoundSensor_setSPLRange
 			result = __func(self.handle, _SPLRange)
 		except RuntimeError:
 			raise
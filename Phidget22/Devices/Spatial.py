@@ -19,8 +19,7 @@ class Spatial(Phidget):
 		self._onSpatialData = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -45,8 +44,7 @@ class Spatial(Phidget):
 			self._onSpatialData = self._SpatialDataFactory(self._localSpatialDataEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_setOnSpatialDataHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_setOnSpatialDataHandler
 			res = __func(self.handle, self._onSpatialData, None)
 		except RuntimeError:
 			self._SpatialData = None
@@ -56,8 +54,7 @@ class Spatial(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -71,8 +68,7 @@ class Spatial(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -85,8 +81,7 @@ class Spatial(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -100,8 +95,7 @@ class Spatial(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -127,8 +121,7 @@ class Spatial(Phidget):
 		_T5 = ctypes.c_double(T5)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_setMagnetometerCorrectionParameters
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_setMagnetometerCorrectionParameters
 			result = __func(self.handle, _magneticField, _offset0, _offset1, _offset2, _gain0, _gain1, _gain2, _T0, _T1, _T2, _T3, _T4, _T5)
 		except RuntimeError:
 			raise
@@ -139,8 +132,7 @@ class Spatial(Phidget):
 
 	def resetMagnetometerCorrectionParameters(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_resetMagnetometerCorrectionParameters
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_resetMagnetometerCorrectionParameters
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -151,8 +143,7 @@ class Spatial(Phidget):
 
 	def saveMagnetometerCorrectionParameters(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_saveMagnetometerCorrectionParameters
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_saveMagnetometerCorrectionParameters
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -163,8 +154,7 @@ class Spatial(Phidget):
 
 	def zeroGyro(self):
 		try:
-			__func = PhidgetSupport.getDll().PhidgetSpatial_zeroGyro
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetSpatial_zeroGyro
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -42,8 +42,7 @@ class Stepper(Phidget):
 		self._onVelocityChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -68,8 +67,7 @@ class Stepper(Phidget):
 			self._onPositionChange = self._PositionChangeFactory(self._localPositionChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setOnPositionChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setOnPositionChangeHandler
 			res = __func(self.handle, self._onPositionChange, None)
 		except RuntimeError:
 			self._PositionChange = None
@@ -89,8 +87,7 @@ class Stepper(Phidget):
 			self._onStopped = self._StoppedFactory(self._localStoppedEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setOnStoppedHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setOnStoppedHandler
 			res = __func(self.handle, self._onStopped, None)
 		except RuntimeError:
 			self._Stopped = None
@@ -110,8 +107,7 @@ class Stepper(Phidget):
 			self._onVelocityChange = self._VelocityChangeFactory(self._localVelocityChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setOnVelocityChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setOnVelocityChangeHandler
 			res = __func(self.handle, self._onVelocityChange, None)
 		except RuntimeError:
 			self._VelocityChange = None
@@ -121,8 +117,7 @@ class Stepper(Phidget):
 		_Acceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getAcceleration
 			result = __func(self.handle, ctypes.byref(_Acceleration))
 		except RuntimeError:
 			raise
@@ -136,8 +131,7 @@ class Stepper(Phidget):
 		_Acceleration = ctypes.c_double(Acceleration)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setAcceleration
 			result = __func(self.handle, _Acceleration)
 		except RuntimeError:
 			raise
@@ -150,8 +144,7 @@ class Stepper(Phidget):
 		_MinAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMinAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMinAcceleration
 			result = __func(self.handle, ctypes.byref(_MinAcceleration))
 		except RuntimeError:
 			raise
@@ -165,8 +158,7 @@ class Stepper(Phidget):
 		_MaxAcceleration = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMaxAcceleration
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMaxAcceleration
 			result = __func(self.handle, ctypes.byref(_MaxAcceleration))
 		except RuntimeError:
 			raise
@@ -180,8 +172,7 @@ class Stepper(Phidget):
 		_ControlMode = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getControlMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getControlMode
 			result = __func(self.handle, ctypes.byref(_ControlMode))
 		except RuntimeError:
 			raise
@@ -195,8 +186,7 @@ class Stepper(Phidget):
 		_ControlMode = ctypes.c_int(ControlMode)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setControlMode
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setControlMode
 			result = __func(self.handle, _ControlMode)
 		except RuntimeError:
 			raise
@@ -209,8 +199,7 @@ class Stepper(Phidget):
 		_CurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getCurrentLimit
 			result = __func(self.handle, ctypes.byref(_CurrentLimit))
 		except RuntimeError:
 			raise
@@ -224,8 +213,7 @@ class Stepper(Phidget):
 		_CurrentLimit = ctypes.c_double(CurrentLimit)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setCurrentLimit
 			result = __func(self.handle, _CurrentLimit)
 		except RuntimeError:
 			raise
@@ -238,8 +226,7 @@ class Stepper(Phidget):
 		_MinCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMinCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMinCurrentLimit
 			result = __func(self.handle, ctypes.byref(_MinCurrentLimit))
 		except RuntimeError:
 			raise
@@ -253,8 +240,7 @@ class Stepper(Phidget):
 		_MaxCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMaxCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMaxCurrentLimit
 			result = __func(self.handle, ctypes.byref(_MaxCurrentLimit))
 		except RuntimeError:
 			raise
@@ -268,8 +254,7 @@ class Stepper(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -283,8 +268,7 @@ class Stepper(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -297,8 +281,7 @@ class Stepper(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -312,8 +295,7 @@ class Stepper(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -327,8 +309,7 @@ class Stepper(Phidget):
 		_Engaged = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getEngaged
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getEngaged
 			result = __func(self.handle, ctypes.byref(_Engaged))
 		except RuntimeError:
 			raise
@@ -342,8 +323,7 @@ class Stepper(Phidget):
 		_Engaged = ctypes.c_int(Engaged)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setEngaged
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setEngaged
 			result = __func(self.handle, _Engaged)
 		except RuntimeError:
 			raise
@@ -356,8 +336,7 @@ class Stepper(Phidget):
 		_HoldingCurrentLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getHoldingCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getHoldingCurrentLimit
 			result = __func(self.handle, ctypes.byref(_HoldingCurrentLimit))
 		except RuntimeError:
 			raise
@@ -371,8 +350,7 @@ class Stepper(Phidget):
 		_HoldingCurrentLimit = ctypes.c_double(HoldingCurrentLimit)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setHoldingCurrentLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setHoldingCurrentLimit
 			result = __func(self.handle, _HoldingCurrentLimit)
 		except RuntimeError:
 			raise
@@ -385,8 +363,7 @@ class Stepper(Phidget):
 		_IsMoving = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getIsMoving
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getIsMoving
 			result = __func(self.handle, ctypes.byref(_IsMoving))
 		except RuntimeError:
 			raise
@@ -400,8 +377,7 @@ class Stepper(Phidget):
 		_Position = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getPosition
 			result = __func(self.handle, ctypes.byref(_Position))
 		except RuntimeError:
 			raise
@@ -415,8 +391,7 @@ class Stepper(Phidget):
 		_MinPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMinPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMinPosition
 			result = __func(self.handle, ctypes.byref(_MinPosition))
 		except RuntimeError:
 			raise
@@ -430,8 +405,7 @@ class Stepper(Phidget):
 		_MaxPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMaxPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMaxPosition
 			result = __func(self.handle, ctypes.byref(_MaxPosition))
 		except RuntimeError:
 			raise
@@ -445,8 +419,7 @@ class Stepper(Phidget):
 		_positionOffset = ctypes.c_double(positionOffset)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_addPositionOffset
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_addPositionOffset
 			result = __func(self.handle, _positionOffset)
 		except RuntimeError:
 			raise
@@ -459,8 +432,7 @@ class Stepper(Phidget):
 		_RescaleFactor = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getRescaleFactor
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getRescaleFactor
 			result = __func(self.handle, ctypes.byref(_RescaleFactor))
 		except RuntimeError:
 			raise
@@ -474,8 +446,7 @@ class Stepper(Phidget):
 		_RescaleFactor = ctypes.c_double(RescaleFactor)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setRescaleFactor
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setRescaleFactor
 			result = __func(self.handle, _RescaleFactor)
 		except RuntimeError:
 			raise
@@ -488,8 +459,7 @@ class Stepper(Phidget):
 		_TargetPosition = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getTargetPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getTargetPosition
 			result = __func(self.handle, ctypes.byref(_TargetPosition))
 		except RuntimeError:
 			raise
@@ -503,8 +473,7 @@ class Stepper(Phidget):
 		_TargetPosition = ctypes.c_double(TargetPosition)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setTargetPosition
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setTargetPosition
 			result = __func(self.handle, _TargetPosition)
 		except RuntimeError:
 			raise
@@ -520,7 +489,7 @@ class Stepper(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -538,8 +507,7 @@ class Stepper(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setTargetPosition_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setTargetPosition_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsetTargetPosition_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -553,8 +521,7 @@ class Stepper(Phidget):
 		_Velocity = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getVelocity
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getVelocity
 			result = __func(self.handle, ctypes.byref(_Velocity))
 		except RuntimeError:
 			raise
@@ -568,8 +535,7 @@ class Stepper(Phidget):
 		_VelocityLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getVelocityLimit
 			result = __func(self.handle, ctypes.byref(_VelocityLimit))
 		except RuntimeError:
 			raise
@@ -583,8 +549,7 @@ class Stepper(Phidget):
 		_VelocityLimit = ctypes.c_double(VelocityLimit)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_setVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_setVelocityLimit
 			result = __func(self.handle, _VelocityLimit)
 		except RuntimeError:
 			raise
@@ -597,8 +562,7 @@ class Stepper(Phidget):
 		_MinVelocityLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMinVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMinVelocityLimit
 			result = __func(self.handle, ctypes.byref(_MinVelocityLimit))
 		except RuntimeError:
 			raise
@@ -612,8 +576,7 @@ class Stepper(Phidget):
 		_MaxVelocityLimit = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetStepper_getMaxVelocityLimit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetStepper_getMaxVelocityLimit
 			result = __func(self.handle, ctypes.byref(_MaxVelocityLimit))
 		except RuntimeError:
 			raise
@@ -22,8 +22,7 @@ class TemperatureSensor(Phidget):
 		self._onTemperatureChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -48,8 +47,7 @@ class TemperatureSensor(Phidget):
 			self._onTemperatureChange = self._TemperatureChangeFactory(self._localTemperatureChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_setOnTemperatureChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_setOnTemperatureChangeHandler
 			res = __func(self.handle, self._onTemperatureChange, None)
 		except RuntimeError:
 			self._TemperatureChange = None
@@ -59,8 +57,7 @@ class TemperatureSensor(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -74,8 +71,7 @@ class TemperatureSensor(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -88,8 +84,7 @@ class TemperatureSensor(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -103,8 +98,7 @@ class TemperatureSensor(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -118,8 +112,7 @@ class TemperatureSensor(Phidget):
 		_RTDType = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getRTDType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getRTDType
 			result = __func(self.handle, ctypes.byref(_RTDType))
 		except RuntimeError:
 			raise
@@ -133,8 +126,7 @@ class TemperatureSensor(Phidget):
 		_RTDType = ctypes.c_int(RTDType)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_setRTDType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_setRTDType
 			result = __func(self.handle, _RTDType)
 		except RuntimeError:
 			raise
@@ -147,8 +139,7 @@ class TemperatureSensor(Phidget):
 		_RTDWireSetup = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getRTDWireSetup
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getRTDWireSetup
 			result = __func(self.handle, ctypes.byref(_RTDWireSetup))
 		except RuntimeError:
 			raise
@@ -162,8 +153,7 @@ class TemperatureSensor(Phidget):
 		_RTDWireSetup = ctypes.c_int(RTDWireSetup)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_setRTDWireSetup
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_setRTDWireSetup
 			result = __func(self.handle, _RTDWireSetup)
 		except RuntimeError:
 			raise
@@ -176,8 +166,7 @@ class TemperatureSensor(Phidget):
 		_Temperature = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getTemperature
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getTemperature
 			result = __func(self.handle, ctypes.byref(_Temperature))
 		except RuntimeError:
 			raise
@@ -191,8 +180,7 @@ class TemperatureSensor(Phidget):
 		_MinTemperature = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getMinTemperature
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getMinTemperature
 			result = __func(self.handle, ctypes.byref(_MinTemperature))
 		except RuntimeError:
 			raise
@@ -206,8 +194,7 @@ class TemperatureSensor(Phidget):
 		_MaxTemperature = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getMaxTemperature
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getMaxTemperature
 			result = __func(self.handle, ctypes.byref(_MaxTemperature))
 		except RuntimeError:
 			raise
@@ -221,8 +208,7 @@ class TemperatureSensor(Phidget):
 		_TemperatureChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getTemperatureChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getTemperatureChangeTrigger
 			result = __func(self.handle, ctypes.byref(_TemperatureChangeTrigger))
 		except RuntimeError:
 			raise
@@ -236,8 +222,7 @@ class TemperatureSensor(Phidget):
 		_TemperatureChangeTrigger = ctypes.c_double(TemperatureChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_setTemperatureChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_setTemperatureChangeTrigger
 			result = __func(self.handle, _TemperatureChangeTrigger)
 		except RuntimeError:
 			raise
@@ -250,8 +235,7 @@ class TemperatureSensor(Phidget):
 		_MinTemperatureChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getMinTemperatureChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getMinTemperatureChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinTemperatureChangeTrigger))
 		except RuntimeError:
 			raise
@@ -265,8 +249,7 @@ class TemperatureSensor(Phidget):
 		_MaxTemperatureChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getMaxTemperatureChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getMaxTemperatureChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxTemperatureChangeTrigger))
 		except RuntimeError:
 			raise
@@ -280,8 +263,7 @@ class TemperatureSensor(Phidget):
 		_ThermocoupleType = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_getThermocoupleType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_getThermocoupleType
 			result = __func(self.handle, ctypes.byref(_ThermocoupleType))
 		except RuntimeError:
 			raise
@@ -295,8 +277,7 @@ class TemperatureSensor(Phidget):
 		_ThermocoupleType = ctypes.c_int(ThermocoupleType)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetTemperatureSensor_setThermocoupleType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetTemperatureSensor_setThermocoupleType
 			result = __func(self.handle, _ThermocoupleType)
 		except RuntimeError:
 			raise
@@ -31,8 +31,7 @@ class VoltageInput(Phidget):
 		self._onVoltageChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -60,8 +59,7 @@ class VoltageInput(Phidget):
 			self._onSensorChange = self._SensorChangeFactory(self._localSensorChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_setOnSensorChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_setOnSensorChangeHandler
 			res = __func(self.handle, self._onSensorChange, None)
 		except RuntimeError:
 			self._SensorChange = None
@@ -81,8 +79,7 @@ class VoltageInput(Phidget):
 			self._onVoltageChange = self._VoltageChangeFactory(self._localVoltageChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_setOnVoltageChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_setOnVoltageChangeHandler
 			res = __func(self.handle, self._onVoltageChange, None)
 		except RuntimeError:
 			self._VoltageChange = None
@@ -92,8 +89,7 @@ class VoltageInput(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -107,8 +103,7 @@ class VoltageInput(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -121,8 +116,7 @@ class VoltageInput(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -136,8 +130,7 @@ class VoltageInput(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -151,8 +144,7 @@ class VoltageInput(Phidget):
 		_PowerSupply = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getPowerSupply
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getPowerSupply
 			result = __func(self.handle, ctypes.byref(_PowerSupply))
 		except RuntimeError:
 			raise
@@ -166,8 +158,7 @@ class VoltageInput(Phidget):
 		_PowerSupply = ctypes.c_int(PowerSupply)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_setPowerSupply
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_setPowerSupply
 			result = __func(self.handle, _PowerSupply)
 		except RuntimeError:
 			raise
@@ -180,8 +171,7 @@ class VoltageInput(Phidget):
 		_SensorType = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getSensorType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getSensorType
 			result = __func(self.handle, ctypes.byref(_SensorType))
 		except RuntimeError:
 			raise
@@ -195,8 +185,7 @@ class VoltageInput(Phidget):
 		_SensorType = ctypes.c_int(SensorType)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_setSensorType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_setSensorType
 			result = __func(self.handle, _SensorType)
 		except RuntimeError:
 			raise
@@ -209,8 +198,7 @@ class VoltageInput(Phidget):
 		_SensorUnit = UnitInfo()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getSensorUnit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getSensorUnit
 			result = __func(self.handle, ctypes.byref(_SensorUnit))
 		except RuntimeError:
 			raise
@@ -224,8 +212,7 @@ class VoltageInput(Phidget):
 		_SensorValue = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getSensorValue
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getSensorValue
 			result = __func(self.handle, ctypes.byref(_SensorValue))
 		except RuntimeError:
 			raise
@@ -239,8 +226,7 @@ class VoltageInput(Phidget):
 		_SensorValueChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getSensorValueChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getSensorValueChangeTrigger
 			result = __func(self.handle, ctypes.byref(_SensorValueChangeTrigger))
 		except RuntimeError:
 			raise
@@ -254,8 +240,7 @@ class VoltageInput(Phidget):
 		_SensorValueChangeTrigger = ctypes.c_double(SensorValueChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_setSensorValueChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_setSensorValueChangeTrigger
 			result = __func(self.handle, _SensorValueChangeTrigger)
 		except RuntimeError:
 			raise
@@ -268,8 +253,7 @@ class VoltageInput(Phidget):
 		_Voltage = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getVoltage
 			result = __func(self.handle, ctypes.byref(_Voltage))
 		except RuntimeError:
 			raise
@@ -283,8 +267,7 @@ class VoltageInput(Phidget):
 		_MinVoltage = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getMinVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getMinVoltage
 			result = __func(self.handle, ctypes.byref(_MinVoltage))
 		except RuntimeError:
 			raise
@@ -298,8 +281,7 @@ class VoltageInput(Phidget):
 		_MaxVoltage = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getMaxVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getMaxVoltage
 			result = __func(self.handle, ctypes.byref(_MaxVoltage))
 		except RuntimeError:
 			raise
@@ -313,8 +295,7 @@ class VoltageInput(Phidget):
 		_VoltageChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getVoltageChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getVoltageChangeTrigger
 			result = __func(self.handle, ctypes.byref(_VoltageChangeTrigger))
 		except RuntimeError:
 			raise
@@ -328,8 +309,7 @@ class VoltageInput(Phidget):
 		_VoltageChangeTrigger = ctypes.c_double(VoltageChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_setVoltageChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_setVoltageChangeTrigger
 			result = __func(self.handle, _VoltageChangeTrigger)
 		except RuntimeError:
 			raise
@@ -342,8 +322,7 @@ class VoltageInput(Phidget):
 		_MinVoltageChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getMinVoltageChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getMinVoltageChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinVoltageChangeTrigger))
 		except RuntimeError:
 			raise
@@ -357,8 +336,7 @@ class VoltageInput(Phidget):
 		_MaxVoltageChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getMaxVoltageChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getMaxVoltageChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxVoltageChangeTrigger))
 		except RuntimeError:
 			raise
@@ -372,8 +350,7 @@ class VoltageInput(Phidget):
 		_VoltageRange = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_getVoltageRange
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_getVoltageRange
 			result = __func(self.handle, ctypes.byref(_VoltageRange))
 		except RuntimeError:
 			raise
@@ -387,8 +364,7 @@ class VoltageInput(Phidget):
 		_VoltageRange = ctypes.c_int(VoltageRange)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageInput_setVoltageRange
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageInput_setVoltageRange
 			result = __func(self.handle, _VoltageRange)
 		except RuntimeError:
 			raise
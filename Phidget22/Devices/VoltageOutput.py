@@ -21,8 +21,7 @@ class VoltageOutput(Phidget):
 		self._onsetVoltage_async = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageOutput_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageOutput_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -37,8 +36,7 @@ class VoltageOutput(Phidget):
 		_Enabled = ctypes.c_int(Enabled)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageOutput_setEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageOutput_setEnabled
 			result = __func(self.handle, _Enabled)
 		except RuntimeError:
 			raise
@@ -51,8 +49,7 @@ class VoltageOutput(Phidget):
 		_Enabled = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageOutput_getEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageOutput_getEnabled
 			result = __func(self.handle, ctypes.byref(_Enabled))
 		except RuntimeError:
 			raise
@@ -66,8 +63,7 @@ class VoltageOutput(Phidget):
 		_Voltage = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageOutput_getVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageOutput_getVoltage
 			result = __func(self.handle, ctypes.byref(_Voltage))
 		except RuntimeError:
 			raise
@@ -81,8 +77,7 @@ class VoltageOutput(Phidget):
 		_Voltage = ctypes.c_double(Voltage)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageOutput_setVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageOutput_setVoltage
 			result = __func(self.handle, _Voltage)
 		except RuntimeError:
 			raise
@@ -95,8 +90,7 @@ class VoltageOutput(Phidget):
 		_MinVoltage = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageOutput_getMinVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageOutput_getMinVoltage
 			result = __func(self.handle, ctypes.byref(_MinVoltage))
 		except RuntimeError:
 			raise
@@ -110,8 +104,7 @@ class VoltageOutput(Phidget):
 		_MaxVoltage = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageOutput_getMaxVoltage
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageOutput_getMaxVoltage
 			result = __func(self.handle, ctypes.byref(_MaxVoltage))
 		except RuntimeError:
 			raise
@@ -128,7 +121,7 @@ class VoltageOutput(Phidget):
 		_code = ctypes.c_int(res)
 		_desc = ctypes.c_char_p()
 		try :
-			result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+			result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 		details = _desc.value
@@ -146,8 +139,7 @@ class VoltageOutput(Phidget):
 
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetLCD_setVoltage_async
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetLCD_setVoltage_async
 			res = __func(self.handle, _font, _character, _bitmap, self._onsetVoltage_async, None)
 		except RuntimeError:
 			self._setCharacterBitmap = None
@@ -161,8 +153,7 @@ class VoltageOutput(Phidget):
 		_VoltageOutputRange = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageOutput_getVoltageOutputRange
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageOutput_getVoltageOutputRange
 			result = __func(self.handle, ctypes.byref(_VoltageOutputRange))
 		except RuntimeError:
 			raise
@@ -176,8 +167,7 @@ class VoltageOutput(Phidget):
 		_VoltageOutputRange = ctypes.c_int(VoltageOutputRange)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageOutput_setVoltageOutputRange
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageOutput_setVoltageOutputRange
 			result = __func(self.handle, _VoltageOutputRange)
 		except RuntimeError:
 			raise
@@ -30,8 +30,7 @@ class VoltageRatioInput(Phidget):
 		self._onVoltageRatioChange = None
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_create
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_create
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -59,8 +58,7 @@ class VoltageRatioInput(Phidget):
 			self._onSensorChange = self._SensorChangeFactory(self._localSensorChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_setOnSensorChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_setOnSensorChangeHandler
 			res = __func(self.handle, self._onSensorChange, None)
 		except RuntimeError:
 			self._SensorChange = None
@@ -80,8 +78,7 @@ class VoltageRatioInput(Phidget):
 			self._onVoltageRatioChange = self._VoltageRatioChangeFactory(self._localVoltageRatioChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_setOnVoltageRatioChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_setOnVoltageRatioChangeHandler
 			res = __func(self.handle, self._onVoltageRatioChange, None)
 		except RuntimeError:
 			self._VoltageRatioChange = None
@@ -91,8 +88,7 @@ class VoltageRatioInput(Phidget):
 		_BridgeEnabled = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getBridgeEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getBridgeEnabled
 			result = __func(self.handle, ctypes.byref(_BridgeEnabled))
 		except RuntimeError:
 			raise
@@ -106,8 +102,7 @@ class VoltageRatioInput(Phidget):
 		_BridgeEnabled = ctypes.c_int(BridgeEnabled)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_setBridgeEnabled
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_setBridgeEnabled
 			result = __func(self.handle, _BridgeEnabled)
 		except RuntimeError:
 			raise
@@ -120,8 +115,7 @@ class VoltageRatioInput(Phidget):
 		_BridgeGain = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getBridgeGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getBridgeGain
 			result = __func(self.handle, ctypes.byref(_BridgeGain))
 		except RuntimeError:
 			raise
@@ -135,8 +129,7 @@ class VoltageRatioInput(Phidget):
 		_BridgeGain = ctypes.c_int(BridgeGain)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_setBridgeGain
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_setBridgeGain
 			result = __func(self.handle, _BridgeGain)
 		except RuntimeError:
 			raise
@@ -149,8 +142,7 @@ class VoltageRatioInput(Phidget):
 		_DataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getDataInterval
 			result = __func(self.handle, ctypes.byref(_DataInterval))
 		except RuntimeError:
 			raise
@@ -164,8 +156,7 @@ class VoltageRatioInput(Phidget):
 		_DataInterval = ctypes.c_uint32(DataInterval)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_setDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_setDataInterval
 			result = __func(self.handle, _DataInterval)
 		except RuntimeError:
 			raise
@@ -178,8 +169,7 @@ class VoltageRatioInput(Phidget):
 		_MinDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getMinDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getMinDataInterval
 			result = __func(self.handle, ctypes.byref(_MinDataInterval))
 		except RuntimeError:
 			raise
@@ -193,8 +183,7 @@ class VoltageRatioInput(Phidget):
 		_MaxDataInterval = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getMaxDataInterval
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getMaxDataInterval
 			result = __func(self.handle, ctypes.byref(_MaxDataInterval))
 		except RuntimeError:
 			raise
@@ -208,8 +197,7 @@ class VoltageRatioInput(Phidget):
 		_SensorType = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getSensorType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getSensorType
 			result = __func(self.handle, ctypes.byref(_SensorType))
 		except RuntimeError:
 			raise
@@ -223,8 +211,7 @@ class VoltageRatioInput(Phidget):
 		_SensorType = ctypes.c_int(SensorType)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_setSensorType
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_setSensorType
 			result = __func(self.handle, _SensorType)
 		except RuntimeError:
 			raise
@@ -237,8 +224,7 @@ class VoltageRatioInput(Phidget):
 		_SensorUnit = UnitInfo()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getSensorUnit
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getSensorUnit
 			result = __func(self.handle, ctypes.byref(_SensorUnit))
 		except RuntimeError:
 			raise
@@ -252,8 +238,7 @@ class VoltageRatioInput(Phidget):
 		_SensorValue = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getSensorValue
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getSensorValue
 			result = __func(self.handle, ctypes.byref(_SensorValue))
 		except RuntimeError:
 			raise
@@ -267,8 +252,7 @@ class VoltageRatioInput(Phidget):
 		_SensorValueChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getSensorValueChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getSensorValueChangeTrigger
 			result = __func(self.handle, ctypes.byref(_SensorValueChangeTrigger))
 		except RuntimeError:
 			raise
@@ -282,8 +266,7 @@ class VoltageRatioInput(Phidget):
 		_SensorValueChangeTrigger = ctypes.c_double(SensorValueChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_setSensorValueChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_setSensorValueChangeTrigger
 			result = __func(self.handle, _SensorValueChangeTrigger)
 		except RuntimeError:
 			raise
@@ -296,8 +279,7 @@ class VoltageRatioInput(Phidget):
 		_VoltageRatio = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getVoltageRatio
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getVoltageRatio
 			result = __func(self.handle, ctypes.byref(_VoltageRatio))
 		except RuntimeError:
 			raise
@@ -311,8 +293,7 @@ class VoltageRatioInput(Phidget):
 		_MinVoltageRatio = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getMinVoltageRatio
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getMinVoltageRatio
 			result = __func(self.handle, ctypes.byref(_MinVoltageRatio))
 		except RuntimeError:
 			raise
@@ -326,8 +307,7 @@ class VoltageRatioInput(Phidget):
 		_MaxVoltageRatio = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getMaxVoltageRatio
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getMaxVoltageRatio
 			result = __func(self.handle, ctypes.byref(_MaxVoltageRatio))
 		except RuntimeError:
 			raise
@@ -341,8 +321,7 @@ class VoltageRatioInput(Phidget):
 		_VoltageRatioChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getVoltageRatioChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getVoltageRatioChangeTrigger
 			result = __func(self.handle, ctypes.byref(_VoltageRatioChangeTrigger))
 		except RuntimeError:
 			raise
@@ -356,8 +335,7 @@ class VoltageRatioInput(Phidget):
 		_VoltageRatioChangeTrigger = ctypes.c_double(VoltageRatioChangeTrigger)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_setVoltageRatioChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_setVoltageRatioChangeTrigger
 			result = __func(self.handle, _VoltageRatioChangeTrigger)
 		except RuntimeError:
 			raise
@@ -370,8 +348,7 @@ class VoltageRatioInput(Phidget):
 		_MinVoltageRatioChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getMinVoltageRatioChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getMinVoltageRatioChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MinVoltageRatioChangeTrigger))
 		except RuntimeError:
 			raise
@@ -385,8 +362,7 @@ class VoltageRatioInput(Phidget):
 		_MaxVoltageRatioChangeTrigger = ctypes.c_double()
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetVoltageRatioInput_getMaxVoltageRatioChangeTrigger
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getMaxVoltageRatioChangeTrigger
 			result = __func(self.handle, ctypes.byref(_MaxVoltageRatioChangeTrigger))
 		except RuntimeError:
 			raise
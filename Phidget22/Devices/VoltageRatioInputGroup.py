@@ -0,0 +1,36 @@
+import ctypes
+import numpy
+from Phidget22.PhidgetSupport import PhidgetSupport
+from Phidget22.PhidgetException import PhidgetException
+
+class VoltageRatioInputGroup:
+	"""
+	Reads the current voltage ratio of a fixed list of VoltageRatioInput channels in one call.
+
+	All channels write into a single preallocated ctypes buffer that is exposed as a NumPy float64 array, so a read
+	allocates nothing. The array returned by getVoltageRatios() is that buffer: it is overwritten by the next read
+	and must be copied if the values have to outlive it.
+	"""
+
+	def __init__(self, channels):
+		self.channels = list(channels)
+		self._buffer = (ctypes.c_double * len(self.channels))()
+		self._values = numpy.frombuffer(self._buffer, dtype=numpy.float64)
+
+		size = ctypes.sizeof(ctypes.c_double)
+		self._arguments = []
+		for index, channel in enumerate(self.channels):
+			value = ctypes.c_double.from_buffer(self._buffer, index * size)
+			self._arguments.append((channel.handle, ctypes.byref(value)))
+
+	def __len__(self):
+		return len(self.channels)
+
+	def getVoltageRatios(self):
+		__func = PhidgetSupport.getFunctions().PhidgetVoltageRatioInput_getVoltageRatio
+		for handle, value in self._arguments:
+			result = __func(handle, value)
+			if result > 0:
+				raise PhidgetException(result)
+
+		return self._values
@@ -46,8 +46,7 @@ class Net:
 			self._onServerAdded = self._ServerAddedFactory(self._localServerAddedEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetNet_setOnServerAddedHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetNet_setOnServerAddedHandler
 			res = __func(self._onServerAdded, None)
 		except RuntimeError:
 			self._ServerAdded = None
@@ -70,8 +69,7 @@ class Net:
 			self._onServerRemoved = self._ServerRemovedFactory(self._localServerRemovedEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetNet_setOnServerRemovedHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetNet_setOnServerRemovedHandler
 			res = __func(self._onServerRemoved, None)
 		except RuntimeError:
 			self._ServerRemoved = None
@@ -86,8 +84,7 @@ class Net:
 		_flags = ctypes.c_int(flags)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetNet_addServer
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetNet_addServer
 			result = __func(ctypes.byref(_serverName), ctypes.byref(_address), _port, ctypes.byref(_password), _flags)
 		except RuntimeError:
 			raise
@@ -101,8 +98,7 @@ class Net:
 		_serverName = ctypes.create_string_buffer(serverName.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetNet_removeServer
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetNet_removeServer
 			result = __func(ctypes.byref(_serverName))
 		except RuntimeError:
 			raise
@@ -116,8 +112,7 @@ class Net:
 		_serverName = ctypes.create_string_buffer(serverName.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetNet_enableServer
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetNet_enableServer
 			result = __func(ctypes.byref(_serverName))
 		except RuntimeError:
 			raise
@@ -132,8 +127,7 @@ class Net:
 		_flags = ctypes.c_int(flags)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetNet_disableServer
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetNet_disableServer
 			result = __func(ctypes.byref(_serverName), _flags)
 		except RuntimeError:
 			raise
@@ -147,8 +141,7 @@ class Net:
 		_serverType = ctypes.c_int(serverType)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetNet_enableServerDiscovery
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetNet_enableServerDiscovery
 			result = __func(_serverType)
 		except RuntimeError:
 			raise
@@ -162,8 +155,7 @@ class Net:
 		_serverType = ctypes.c_int(serverType)
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetNet_disableServerDiscovery
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetNet_disableServerDiscovery
 			result = __func(_serverType)
 		except RuntimeError:
 			raise
@@ -178,8 +170,7 @@ class Net:
 		_password = ctypes.create_string_buffer(password.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().PhidgetNet_setServerPassword
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().PhidgetNet_setServerPassword
 			result = __func(ctypes.byref(_serverName), ctypes.byref(_password))
 		except RuntimeError:
 			raise
@@ -50,8 +50,7 @@ class Phidget:
 
 	def __del__(self):
 		try:
-			__func = PhidgetSupport.getDll().Phidget_delete
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_delete
 			res = __func(ctypes.byref(self.handle))
 		except RuntimeError:
 			raise
@@ -73,8 +72,7 @@ class Phidget:
 			self._onAttach = self._AttachFactory(self._localAttachEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setOnAttachHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setOnAttachHandler
 			res = __func(self.handle, self._onAttach, None)
 		except RuntimeError:
 			self._Attach = None
@@ -94,8 +92,7 @@ class Phidget:
 			self._onDetach = self._DetachFactory(self._localDetachEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setOnDetachHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setOnDetachHandler
 			res = __func(self.handle, self._onDetach, None)
 		except RuntimeError:
 			self._Detach = None
@@ -116,8 +113,7 @@ class Phidget:
 			self._onError = self._ErrorFactory(self._localErrorEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setOnErrorHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setOnErrorHandler
 			res = __func(self.handle, self._onError, None)
 		except RuntimeError:
 			self._Error = None
@@ -138,8 +134,7 @@ class Phidget:
 			self._onPropertyChange = self._PropertyChangeFactory(self._localPropertyChangeEvent)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setOnPropertyChangeHandler
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setOnPropertyChangeHandler
 			res = __func(self.handle, self._onPropertyChange, None)
 		except RuntimeError:
 			self._PropertyChange = None
@@ -150,8 +145,7 @@ class Phidget:
 		_flags = ctypes.c_int32(flags)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_finalize
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_finalize
 			result = __func(_flags)
 		except RuntimeError:
 			raise
@@ -165,8 +159,7 @@ class Phidget:
 		_LibraryVersion = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getLibraryVersion
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getLibraryVersion
 			result = __func(ctypes.byref(_LibraryVersion))
 		except RuntimeError:
 			raise
@@ -180,8 +173,7 @@ class Phidget:
 		_Attached = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getAttached
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getAttached
 			result = __func(self.handle, ctypes.byref(_Attached))
 		except RuntimeError:
 			raise
@@ -195,8 +187,7 @@ class Phidget:
 		_Channel = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getChannel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getChannel
 			result = __func(self.handle, ctypes.byref(_Channel))
 		except RuntimeError:
 			raise
@@ -210,8 +201,7 @@ class Phidget:
 		_Channel = ctypes.c_int(Channel)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setChannel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setChannel
 			result = __func(self.handle, _Channel)
 		except RuntimeError:
 			raise
@@ -224,8 +214,7 @@ class Phidget:
 		_ChannelClass = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getChannelClass
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getChannelClass
 			result = __func(self.handle, ctypes.byref(_ChannelClass))
 		except RuntimeError:
 			raise
@@ -239,8 +228,7 @@ class Phidget:
 		_ChannelClassName = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getChannelClassName
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getChannelClassName
 			result = __func(self.handle, ctypes.byref(_ChannelClassName))
 		except RuntimeError:
 			raise
@@ -254,8 +242,7 @@ class Phidget:
 		_ChannelName = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getChannelName
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getChannelName
 			result = __func(self.handle, ctypes.byref(_ChannelName))
 		except RuntimeError:
 			raise
@@ -269,8 +256,7 @@ class Phidget:
 		_ChannelSubclass = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getChannelSubclass
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getChannelSubclass
 			result = __func(self.handle, ctypes.byref(_ChannelSubclass))
 		except RuntimeError:
 			raise
@@ -282,8 +268,7 @@ class Phidget:
 
 	def close(self):
 		try:
-			__func = PhidgetSupport.getDll().Phidget_close
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_close
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -297,8 +282,7 @@ class Phidget:
 		_count = ctypes.c_uint32()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getDeviceChannelCount
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getDeviceChannelCount
 			result = __func(self.handle, _cls, ctypes.byref(_count))
 		except RuntimeError:
 			raise
@@ -312,8 +296,7 @@ class Phidget:
 		_DeviceClass = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getDeviceClass
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getDeviceClass
 			result = __func(self.handle, ctypes.byref(_DeviceClass))
 		except RuntimeError:
 			raise
@@ -327,8 +310,7 @@ class Phidget:
 		_DeviceClassName = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getDeviceClassName
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getDeviceClassName
 			result = __func(self.handle, ctypes.byref(_DeviceClassName))
 		except RuntimeError:
 			raise
@@ -342,8 +324,7 @@ class Phidget:
 		_DeviceID = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getDeviceID
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getDeviceID
 			result = __func(self.handle, ctypes.byref(_DeviceID))
 		except RuntimeError:
 			raise
@@ -357,8 +338,7 @@ class Phidget:
 		_DeviceLabel = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getDeviceLabel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getDeviceLabel
 			result = __func(self.handle, ctypes.byref(_DeviceLabel))
 		except RuntimeError:
 			raise
@@ -372,8 +352,7 @@ class Phidget:
 		_DeviceLabel = ctypes.create_string_buffer(DeviceLabel.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setDeviceLabel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setDeviceLabel
 			result = __func(self.handle, ctypes.byref(_DeviceLabel))
 		except RuntimeError:
 			raise
@@ -386,8 +365,7 @@ class Phidget:
 		_DeviceName = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getDeviceName
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getDeviceName
 			result = __func(self.handle, ctypes.byref(_DeviceName))
 		except RuntimeError:
 			raise
@@ -401,8 +379,7 @@ class Phidget:
 		_DeviceSerialNumber = ctypes.c_int32()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getDeviceSerialNumber
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getDeviceSerialNumber
 			result = __func(self.handle, ctypes.byref(_DeviceSerialNumber))
 		except RuntimeError:
 			raise
@@ -416,8 +393,7 @@ class Phidget:
 		_DeviceSerialNumber = ctypes.c_int32(DeviceSerialNumber)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setDeviceSerialNumber
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setDeviceSerialNumber
 			result = __func(self.handle, _DeviceSerialNumber)
 		except RuntimeError:
 			raise
@@ -430,8 +406,7 @@ class Phidget:
 		_DeviceSKU = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getDeviceSKU
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getDeviceSKU
 			result = __func(self.handle, ctypes.byref(_DeviceSKU))
 		except RuntimeError:
 			raise
@@ -445,8 +420,7 @@ class Phidget:
 		_DeviceVersion = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getDeviceVersion
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getDeviceVersion
 			result = __func(self.handle, ctypes.byref(_DeviceVersion))
 		except RuntimeError:
 			raise
@@ -460,8 +434,7 @@ class Phidget:
 		_Hub = ctypes.c_void_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getHub
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getHub
 			result = __func(self.handle, ctypes.byref(_Hub))
 		except RuntimeError:
 			raise
@@ -477,8 +450,7 @@ class Phidget:
 		_HubPort = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getHubPort
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getHubPort
 			result = __func(self.handle, ctypes.byref(_HubPort))
 		except RuntimeError:
 			raise
@@ -492,8 +464,7 @@ class Phidget:
 		_HubPort = ctypes.c_int(HubPort)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setHubPort
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setHubPort
 			result = __func(self.handle, _HubPort)
 		except RuntimeError:
 			raise
@@ -506,8 +477,7 @@ class Phidget:
 		_HubPortCount = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getHubPortCount
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getHubPortCount
 			result = __func(self.handle, ctypes.byref(_HubPortCount))
 		except RuntimeError:
 			raise
@@ -521,8 +491,7 @@ class Phidget:
 		_IsChannel = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getIsChannel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getIsChannel
 			result = __func(self.handle, ctypes.byref(_IsChannel))
 		except RuntimeError:
 			raise
@@ -536,8 +505,7 @@ class Phidget:
 		_IsHubPortDevice = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getIsHubPortDevice
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getIsHubPortDevice
 			result = __func(self.handle, ctypes.byref(_IsHubPortDevice))
 		except RuntimeError:
 			raise
@@ -551,8 +519,7 @@ class Phidget:
 		_IsHubPortDevice = ctypes.c_int(IsHubPortDevice)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setIsHubPortDevice
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setIsHubPortDevice
 			result = __func(self.handle, _IsHubPortDevice)
 		except RuntimeError:
 			raise
@@ -565,8 +532,7 @@ class Phidget:
 		_IsLocal = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getIsLocal
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getIsLocal
 			result = __func(self.handle, ctypes.byref(_IsLocal))
 		except RuntimeError:
 			raise
@@ -580,8 +546,7 @@ class Phidget:
 		_IsLocal = ctypes.c_int(IsLocal)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setIsLocal
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setIsLocal
 			result = __func(self.handle, _IsLocal)
 		except RuntimeError:
 			raise
@@ -594,8 +559,7 @@ class Phidget:
 		_IsRemote = ctypes.c_int()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getIsRemote
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getIsRemote
 			result = __func(self.handle, ctypes.byref(_IsRemote))
 		except RuntimeError:
 			raise
@@ -609,8 +573,7 @@ class Phidget:
 		_IsRemote = ctypes.c_int(IsRemote)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setIsRemote
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setIsRemote
 			result = __func(self.handle, _IsRemote)
 		except RuntimeError:
 			raise
@@ -621,8 +584,7 @@ class Phidget:
 
 	def open(self):
 		try:
-			__func = PhidgetSupport.getDll().Phidget_open
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_open
 			result = __func(self.handle)
 		except RuntimeError:
 			raise
@@ -635,8 +597,7 @@ class Phidget:
 		_timeout = ctypes.c_uint32(timeout)
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_openWaitForAttachment
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_openWaitForAttachment
 			result = __func(self.handle, _timeout)
 		except RuntimeError:
 			raise
@@ -649,8 +610,7 @@ class Phidget:
 		_Parent = ctypes.c_void_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getParent
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getParent
 			result = __func(self.handle, ctypes.byref(_Parent))
 		except RuntimeError:
 			raise
@@ -666,8 +626,7 @@ class Phidget:
 		_ServerHostname = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getServerHostname
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getServerHostname
 			result = __func(self.handle, ctypes.byref(_ServerHostname))
 		except RuntimeError:
 			raise
@@ -681,8 +640,7 @@ class Phidget:
 		_ServerName = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getServerName
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getServerName
 			result = __func(self.handle, ctypes.byref(_ServerName))
 		except RuntimeError:
 			raise
@@ -696,8 +654,7 @@ class Phidget:
 		_ServerName = ctypes.create_string_buffer(ServerName.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_setServerName
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_setServerName
 			result = __func(self.handle, ctypes.byref(_ServerName))
 		except RuntimeError:
 			raise
@@ -710,8 +667,7 @@ class Phidget:
 		_ServerPeerName = ctypes.c_char_p()
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_getServerPeerName
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_getServerPeerName
 			result = __func(self.handle, ctypes.byref(_ServerPeerName))
 		except RuntimeError:
 			raise
@@ -725,8 +681,7 @@ class Phidget:
 		_deviceLabel = ctypes.create_string_buffer(deviceLabel.encode('utf-8'))
 
 		try:
-			__func = PhidgetSupport.getDll().Phidget_writeDeviceLabel
-			__func.restype = ctypes.c_int32
+			__func = PhidgetSupport.getFunctions().Phidget_writeDeviceLabel
 			result = __func(self.handle, ctypes.byref(_deviceLabel))
 		except RuntimeError:
 			raise
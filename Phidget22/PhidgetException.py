@@ -10,7 +10,7 @@ class PhidgetException(Exception):
 		_desc = ctypes.c_char_p()
 
 		try:
-				result = PhidgetSupport.getDll().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
+				result = PhidgetSupport.getFunctions().Phidget_getErrorDescription(_code, ctypes.byref(_desc))
 		except RuntimeError:
 			raise
 
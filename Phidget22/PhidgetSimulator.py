@@ -0,0 +1,575 @@
+import heapq
+import itertools
+import math
+import os
+import random
+import threading
+import time
+from Phidget22.ErrorCode import ErrorCode
+
+DEVICE_NAME = b"PhidgetBridge 4-Input"
+DEVICE_SKU = b"1046_0"
+CHANNEL_COUNT = 4
+MAX_DATA_INTERVAL = 60000			# ms
+MAX_LAG = 1.0						# s a change event may fall behind before samples are skipped
+
+def sine_signal(serial, channel, t):
+	"""
+	Default signal: a slow sine of 1 mV/V per channel, phase-shifted by channel and board.
+	"""
+	return 0.001 * math.sin(2 * math.pi * (t / 10.0 + channel / 4.0 + serial * 0.1))
+
+def _value(argument):
+	# arguments arrive as ctypes objects (c_int32(...), c_void_p, ...) or plain Python values
+	return getattr(argument, 'value', argument)
+
+def _target(pointer):
+	# out-parameters arrive as byref() arguments or POINTER instances
+	return pointer._obj if hasattr(pointer, '_obj') else pointer.contents
+
+def _store(pointer, value):
+	_target(pointer).value = value
+
+class _EntryPoint:
+	"""
+	Callable standing in for a ctypes function. Accepts the restype and argtypes assignments of PhidgetFunctionTable.
+	"""
+
+	def __init__(self, function):
+		self.function = function
+		self.restype = None
+		self.argtypes = None
+
+	def __call__(self, *args):
+		return self.function(*args)
+
+class _Device:
+
+	def __init__(self, serial):
+		self.serial = serial
+		self.attached = False
+		self.channels = [None] * CHANNEL_COUNT		# user channels attached to the device channels
+		self.handles = [None] * CHANNEL_COUNT		# handles the managers report for the device channels
+
+class _Channel:
+
+	def __init__(self, handle, device=None, index=-1):
+		self.handle = handle
+		self.references = 1
+		self.serial = device.serial if device is not None else -1
+		self.index = index
+		self.device = device					# set while attached (always set for manager-reported channels)
+		self.opened = False
+		self.onAttach = self.onDetach = self.onVoltageRatioChange = None
+		self.dataInterval = 8
+		self.bridgeGain = 8
+		self.bridgeEnabled = 1
+		self.changeTrigger = 0.0
+		self.attachTime = 0.0
+		self.lastReported = None
+		self.lastSample = (None, 0.0)			# (time, value) of the latest polled sample
+		self.generation = 0						# invalidates scheduled change events after detach or re-configuration
+
+class _Manager:
+
+	def __init__(self, handle):
+		self.handle = handle
+		self.opened = False
+		self.onAttach = self.onDetach = None
+		self.reported = set()
+
+class PhidgetSimulator:
+	"""
+	Pure-Python stand-in for libphidget22, to be installed with PhidgetSupport.useLibrary().
+
+	Emulates PhidgetBridge 4-Input boards: the Manager reports their channels on attach and detach, VoltageRatioInput
+	channels match and attach to them when opened, and every attached channel produces a sample per data interval,
+	delivered to its change handler by one scheduler thread and returned by getVoltageRatio. Boards can be plugged in
+	and out at runtime with attach() and detach(). Entry points that are not emulated return EPHIDGET_UNSUPPORTED.
+	"""
+
+	def __init__(self, serials=(1337,), attach_delay=0.05, min_data_interval=1, signal=sine_signal, noise=1e-6,
+				 seed=None):
+		"""
+		:param serials: Serial numbers of the boards connected from the start
+		:param attach_delay: Seconds between opening a channel (or plugging in a board) and its attach event
+		:param min_data_interval: Smallest data interval the channels accept (ms)
+		:param signal: Function (serial, channel, seconds) returning the noise-free voltage ratio
+		:param noise: Standard deviation of the Gaussian noise added to every sample
+		:param seed: Seed of the noise generator (None: random)
+		"""
+		self.attach_delay = attach_delay
+		self.min_data_interval = min_data_interval
+		self.signal = signal
+		self.noise = noise
+		self.random = random.Random(seed)
+		self.start = time.monotonic()
+
+		self.events = 0							# change events delivered
+		self.skipped = 0						# samples skipped because the change handlers fell behind
+
+		self._lock = threading.RLock()
+		self._wakeup = threading.Condition(self._lock)
+		self._handles = itertools.count(1)
+		self._sequence = itertools.count()
+		self._objects = {}
+		self._devices = {}
+		self._queue = []
+		self._thread = None
+		for serial in serials:
+			self._devices[serial] = _Device(serial)
+			self._devices[serial].attached = True
+
+	@staticmethod
+	def fromEnvironment(value=None):
+		"""
+		Create a simulator from a comma-separated list of serial numbers (default: $PHIDGET22_SIMULATOR).
+		"""
+		if value is None:
+			value = os.environ.get('PHIDGET22_SIMULATOR', '')
+		serials = [int(serial) for serial in value.split(',') if serial.strip() != '']
+		return PhidgetSimulator(serials if len(serials) > 0 else (1337,))
+
+	def __getattr__(self, name):
+		if not name.startswith('Phidget'):
+			raise AttributeError(name)
+		function = getattr(type(self), '_' + name, None)
+		if function is None:
+			return _EntryPoint(lambda *args: ErrorCode.EPHIDGET_UNSUPPORTED)
+		return _EntryPoint(function.__get__(self))
+
+	# ------------------------------ hot-plugging ------------------------------
+
+	def attach(self, serial):
+		"""
+		Plug in a board. Open managers and matching channels receive their attach events after attach_delay.
+		"""
+		with self._lock:
+			device = self._devices.setdefault(serial, _Device(serial))
+			device.attached = True
+			self._schedule(self.attach_delay, self._match)
+
+	def detach(self, serial):
+		"""
+		Unplug a board. Its channels and the managers receive their detach events right away.
+		"""
+		with self._lock:
+			device = self._devices.get(serial)
+			if device is None or not device.attached:
+				return
+			device.attached = False
+			self._schedule(0, lambda: self._unplug(device))
+
+	# ------------------------------ scheduling ------------------------------
+
+	def _schedule(self, delay, action):
+		heapq.heappush(self._queue, (time.monotonic() + delay, next(self._sequence), action))
+		if self._thread is None:
+			self._thread = threading.Thread(target=self._run, name='phidget22-simulator', daemon=True)
+			self._thread.start()
+		self._wakeup.notify()
+
+	def _run(self):
+		with self._lock:
+			while True:
+				while len(self._queue) == 0:
+					self._wakeup.wait()
+				due = self._queue[0][0]
+				now = time.monotonic()
+				if due > now:
+					self._wakeup.wait(due - now)
+					continue
+				(due, sequence, action) = heapq.heappop(self._queue)
+				action()
+
+	def _sample(self, channel, t):
+		value = self.signal(channel.serial, channel.index, t - self.start)
+		if self.noise > 0:
+			value += self.random.gauss(0.0, self.noise)
+		return value
+
+	def _startChanges(self, channel):
+		channel.generation += 1
+		if channel.device is not None and channel.onVoltageRatioChange is not None:
+			generation = channel.generation
+			due = time.monotonic() + channel.dataInterval / 1000.0
+			heapq.heappush(self._queue, (due, next(self._sequence), lambda: self._change(channel, generation, due)))
+			self._wakeup.notify()
+
+	def _change(self, channel, generation, due):
+		if generation != channel.generation:
+			return
+		interval = channel.dataInterval / 1000.0
+		now = time.monotonic()
+		if now - due > MAX_LAG:
+			skipped = int((now - due) / interval)
+			self.skipped += skipped
+			due += skipped * interval
+		value = self._sample(channel, due)
+		if channel.lastReported is None or abs(value - channel.lastReported) >= channel.changeTrigger:
+			channel.lastReported = value
+			self.events += 1
+			channel.onVoltageRatioChange(channel.handle, None, value)
+		due += interval
+		heapq.heappush(self._queue, (due, next(self._sequence), lambda: self._change(channel, generation, due)))
+
+	# ------------------------------ attach and detach ------------------------------
+
+	def _match(self):
+		# attach open channels to free device channels, then report new device channels to the managers
+		for channel in list(self._objects.values()):
+			if not isinstance(channel, _Channel) or not channel.opened or channel.device is not None:
+				continue
+			for device in self._devices.values():
+				if not device.attached or channel.serial not in (-1, device.serial):
+					continue
+				free = [i for i in range(CHANNEL_COUNT) if device.channels[i] is None and channel.index in (-1, i)]
+				if len(free) > 0:
+					self._attachChannel(channel, device, free[0])
+					break
+
+		for manager in list(self._objects.values()):
+			if not isinstance(manager, _Manager) or not manager.opened or manager.onAttach is None:
+				continue
+			for device in self._devices.values():
+				for index in range(CHANNEL_COUNT):
+					if device.attached and (device.serial, index) not in manager.reported:
+						manager.reported.add((device.serial, index))
+						manager.onAttach(manager.handle, None, self._deviceChannel(device, index).handle)
+
+	def _deviceChannel(self, device, index):
+		handle = device.handles[index]
+		if handle is None or handle not in self._objects:
+			handle = next(self._handles)
+			self._objects[handle] = _Channel(handle, device, index)
+			device.handles[index] = handle
+		return self._objects[handle]
+
+	def _attachChannel(self, channel, device, index):
+		device.channels[index] = channel
+		channel.device = device
+		channel.serial = device.serial
+		channel.index = index
+		channel.attachTime = time.monotonic()
+		channel.lastReported = None
+		if channel.onAttach is not None:
+			channel.onAttach(channel.handle, None)
+		self._startChanges(channel)
+
+	def _detachChannel(self, channel):
+		device = channel.device
+		if device is None:
+			return
+		device.channels[channel.index] = None
+		channel.device = None
+		channel.generation += 1
+		if channel.onDetach is not None:
+			channel.onDetach(channel.handle, None)
+
+	def _unplug(self, device):
+		for channel in list(device.channels):
+			if channel is not None:
+				self._detachChannel(channel)
+		for manager in list(self._objects.values()):
+			if not isinstance(manager, _Manager):
+				continue
+			for index in range(CHANNEL_COUNT):
+				if (device.serial, index) in manager.reported:
+					manager.reported.discard((device.serial, index))
+					if manager.onDetach is not None:
+						manager.onDetach(manager.handle, None, self._deviceChannel(device, index).handle)
+		self._match()
+
+	# ------------------------------ library ------------------------------
+
+	def _Phidget_getErrorDescription(self, code, description):
+		_store(description, ErrorCode.getName(_value(code)).encode('utf-8'))
+		return ErrorCode.EPHIDGET_OK
+
+	def _Phidget_getLibraryVersion(self, version):
+		_store(version, b"Phidget22 simulator")
+		return ErrorCode.EPHIDGET_OK
+
+	def _Phidget_finalize(self, flags):
+		return ErrorCode.EPHIDGET_OK
+
+	def __create(self, factory, handle):
+		with self._lock:
+			number = next(self._handles)
+			self._objects[number] = factory(number)
+			_store(handle, number)
+		return ErrorCode.EPHIDGET_OK
+
+	def __delete(self, handle):
+		with self._lock:
+			obj = self._objects.get(_value(_target(handle)))
+			if obj is None:
+				return ErrorCode.EPHIDGET_INVALIDARG
+			obj.references -= 1
+			if obj.references <= 0:
+				if isinstance(obj, _Channel):
+					self._detachChannel(obj)
+				del self._objects[obj.handle]
+			_store(handle, None)
+		return ErrorCode.EPHIDGET_OK
+
+	def __channel(self, handle, attached=False):
+		channel = self._objects.get(_value(handle))
+		if not isinstance(channel, _Channel):
+			return None, ErrorCode.EPHIDGET_INVALIDARG
+		if attached and channel.device is None:
+			return None, ErrorCode.EPHIDGET_NOTATTACHED
+		return channel, ErrorCode.EPHIDGET_OK
+
+	# ------------------------------ manager ------------------------------
+
+	def _PhidgetManager_create(self, handle):
+		return self.__create(_Manager, handle)
+
+	def _PhidgetManager_delete(self, handle):
+		with self._lock:
+			manager = self._objects.get(_value(_target(handle)))
+			if isinstance(manager, _Manager):
+				manager.references = 0
+				del self._objects[manager.handle]
+			_store(handle, None)
+		return ErrorCode.EPHIDGET_OK
+
+	def _PhidgetManager_open(self, handle):
+		with self._lock:
+			self._objects[_value(handle)].opened = True
+			self._schedule(self.attach_delay, self._match)
+		return ErrorCode.EPHIDGET_OK
+
+	def _PhidgetManager_close(self, handle):
+		with self._lock:
+			manager = self._objects[_value(handle)]
+			manager.opened = False
+			manager.reported.clear()
+		return ErrorCode.EPHIDGET_OK
+
+	def _PhidgetManager_setOnAttachHandler(self, handle, handler, context):
+		with self._lock:
+			self._objects[_value(handle)].onAttach = handler
+			self._schedule(self.attach_delay, self._match)
+		return ErrorCode.EPHIDGET_OK
+
+	def _PhidgetManager_setOnDetachHandler(self, handle, handler, context):
+		with self._lock:
+			self._objects[_value(handle)].onDetach = handler
+		return ErrorCode.EPHIDGET_OK
+
+	# ------------------------------ channels ------------------------------
+
+	def _PhidgetVoltageRatioInput_create(self, handle):
+		return self.__create(_Channel, handle)
+
+	def _Phidget_delete(self, handle):
+		return self.__delete(handle)
+
+	def _Phidget_retain(self, handle):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				channel.references += 1
+		return result
+
+	def _Phidget_release(self, handle):
+		return self.__delete(handle)
+
+	def _Phidget_setOnAttachHandler(self, handle, handler, context):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				channel.onAttach = handler
+		return result
+
+	def _Phidget_setOnDetachHandler(self, handle, handler, context):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				channel.onDetach = handler
+		return result
+
+	def _Phidget_setOnErrorHandler(self, handle, handler, context):
+		return self.__channel(handle)[1]
+
+	def _Phidget_setOnPropertyChangeHandler(self, handle, handler, context):
+		return self.__channel(handle)[1]
+
+	def _Phidget_open(self, handle):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				channel.opened = True
+				self._schedule(self.attach_delay, self._match)
+		return result
+
+	def _Phidget_openWaitForAttachment(self, handle, timeout):
+		result = self._Phidget_open(handle)
+		if result != ErrorCode.EPHIDGET_OK:
+			return result
+		deadline = time.monotonic() + (_value(timeout) or MAX_DATA_INTERVAL) / 1000.0
+		while time.monotonic() < deadline:
+			with self._lock:
+				if self.__channel(handle)[0].device is not None:
+					return ErrorCode.EPHIDGET_OK
+			time.sleep(0.001)
+		return ErrorCode.EPHIDGET_TIMEOUT
+
+	def _Phidget_close(self, handle):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				channel.opened = False
+				self._detachChannel(channel)
+		return result
+
+	def _Phidget_getAttached(self, handle, attached):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				_store(attached, int(channel.device is not None))
+		return result
+
+	def _Phidget_getChannel(self, handle, index):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				_store(index, channel.index)
+		return result
+
+	def _Phidget_setChannel(self, handle, index):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				channel.index = _value(index)
+		return result
+
+	def _Phidget_getDeviceSerialNumber(self, handle, serial):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				_store(serial, channel.serial)
+		return result
+
+	def _Phidget_setDeviceSerialNumber(self, handle, serial):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				channel.serial = _value(serial)
+		return result
+
+	def _Phidget_getDeviceName(self, handle, name):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is not None:
+				_store(name, DEVICE_NAME)
+		return result
+
+	def _Phidget_getDeviceSKU(self, handle, sku):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is not None:
+				_store(sku, DEVICE_SKU)
+		return result
+
+	# ------------------------------ voltage ratio input ------------------------------
+
+	def _PhidgetVoltageRatioInput_getVoltageRatio(self, handle, voltageRatio):
+		channel = self._objects.get(_value(handle))
+		device = getattr(channel, 'device', None)
+		if device is None:
+			return ErrorCode.EPHIDGET_NOTATTACHED if isinstance(channel, _Channel) else ErrorCode.EPHIDGET_INVALIDARG
+		# the latest sample, taken at the last full data interval since attaching
+		interval = channel.dataInterval / 1000.0
+		now = time.monotonic()
+		t = now - (now - channel.attachTime) % interval
+		if channel.lastSample[0] != t:
+			channel.lastSample = (t, self._sample(channel, t))
+		_store(voltageRatio, channel.lastSample[1])
+		return ErrorCode.EPHIDGET_OK
+
+	def _PhidgetVoltageRatioInput_getMinVoltageRatio(self, handle, voltageRatio):
+		_store(voltageRatio, -1.0)
+		return self.__channel(handle, attached=True)[1]
+
+	def _PhidgetVoltageRatioInput_getMaxVoltageRatio(self, handle, voltageRatio):
+		_store(voltageRatio, 1.0)
+		return self.__channel(handle, attached=True)[1]
+
+	def _PhidgetVoltageRatioInput_getDataInterval(self, handle, dataInterval):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is not None:
+				_store(dataInterval, channel.dataInterval)
+		return result
+
+	def _PhidgetVoltageRatioInput_setDataInterval(self, handle, dataInterval):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is None:
+				return result
+			if not self.min_data_interval <= _value(dataInterval) <= MAX_DATA_INTERVAL:
+				return ErrorCode.EPHIDGET_INVALIDARG
+			channel.dataInterval = _value(dataInterval)
+			self._startChanges(channel)
+		return result
+
+	def _PhidgetVoltageRatioInput_getMinDataInterval(self, handle, dataInterval):
+		_store(dataInterval, self.min_data_interval)
+		return self.__channel(handle, attached=True)[1]
+
+	def _PhidgetVoltageRatioInput_getMaxDataInterval(self, handle, dataInterval):
+		_store(dataInterval, MAX_DATA_INTERVAL)
+		return self.__channel(handle, attached=True)[1]
+
+	def _PhidgetVoltageRatioInput_getBridgeGain(self, handle, bridgeGain):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is not None:
+				_store(bridgeGain, channel.bridgeGain)
+		return result
+
+	def _PhidgetVoltageRatioInput_setBridgeGain(self, handle, bridgeGain):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is not None:
+				channel.bridgeGain = _value(bridgeGain)
+		return result
+
+	def _PhidgetVoltageRatioInput_getBridgeEnabled(self, handle, bridgeEnabled):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is not None:
+				_store(bridgeEnabled, channel.bridgeEnabled)
+		return result
+
+	def _PhidgetVoltageRatioInput_setBridgeEnabled(self, handle, bridgeEnabled):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is not None:
+				channel.bridgeEnabled = _value(bridgeEnabled)
+		return result
+
+	def _PhidgetVoltageRatioInput_getVoltageRatioChangeTrigger(self, handle, trigger):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is not None:
+				_store(trigger, channel.changeTrigger)
+		return result
+
+	def _PhidgetVoltageRatioInput_setVoltageRatioChangeTrigger(self, handle, trigger):
+		with self._lock:
+			channel, result = self.__channel(handle, attached=True)
+			if channel is not None:
+				channel.changeTrigger = _value(trigger)
+		return result
+
+	def _PhidgetVoltageRatioInput_setOnVoltageRatioChangeHandler(self, handle, handler, context):
+		with self._lock:
+			channel, result = self.__channel(handle)
+			if channel is not None:
+				channel.onVoltageRatioChange = handler
+				self._startChanges(channel)
+		return result
@@ -1,22 +1,78 @@
 import threading
 import sys
+import os
 import ctypes
 from ctypes import *
 
+class PhidgetFunctionTable:
+	"""
+	Per-library table of bound Phidget22 entry points.
+
+	Every entry point of the Phidget22 C API returns a PhidgetReturnCode, so restype is set to c_int32 exactly once
+	when a function is first resolved. Functions listed in argtypes additionally get their argument types declared.
+	Resolved functions are stored as plain instance attributes, so subsequent lookups never reach __getattr__.
+	"""
+
+	argtypes = {
+		'Phidget_getAttached': (ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)),
+		'Phidget_getChannel': (ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)),
+		'Phidget_getDeviceSerialNumber': (ctypes.c_void_p, ctypes.POINTER(ctypes.c_int32)),
+		'PhidgetVoltageRatioInput_getVoltageRatio': (ctypes.c_void_p, ctypes.POINTER(ctypes.c_double)),
+		'PhidgetVoltageRatioInput_getSensorValue': (ctypes.c_void_p, ctypes.POINTER(ctypes.c_double)),
+		'PhidgetVoltageRatioInput_getDataInterval': (ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)),
+		'PhidgetVoltageRatioInput_setDataInterval': (ctypes.c_void_p, ctypes.c_uint32),
+		'PhidgetVoltageRatioInput_getBridgeGain': (ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)),
+		'PhidgetVoltageRatioInput_setBridgeGain': (ctypes.c_void_p, ctypes.c_int),
+	}
+
+	def __init__(self, dll):
+		self._dll = dll
+
+	def __getattr__(self, name):
+		if name.startswith('__'):
+			raise AttributeError(name)
+		func = getattr(self._dll, name)
+		func.restype = ctypes.c_int32
+		argtypes = PhidgetFunctionTable.argtypes.get(name)
+		if argtypes is not None:
+			func.argtypes = argtypes
+		setattr(self, name, func)
+		return func
+
 class PhidgetSupport:
 	__dll = None
+	__functions = None
 
 	@staticmethod
 	def getDll():
 		if PhidgetSupport.__dll is None:
-			if sys.platform == 'win32':
+			if os.environ.get('PHIDGET22_SIMULATOR'):
+				from Phidget22.PhidgetSimulator import PhidgetSimulator
+				PhidgetSupport.useLibrary(PhidgetSimulator.fromEnvironment())
+			elif sys.platform == 'win32':
 				PhidgetSupport.__dll = windll.LoadLibrary("phidget22.dll")
 			elif sys.platform == 'darwin':
 				PhidgetSupport.__dll = cdll.LoadLibrary("/Library/Frameworks/Phidget22.framework/Versions/Current/Phidget22")
 			else:
 				PhidgetSupport.__dll = cdll.LoadLibrary("libphidget22.so.0.0.0")
+			PhidgetSupport.__functions = PhidgetFunctionTable(PhidgetSupport.__dll)
 		return PhidgetSupport.__dll
-					
+
+	@staticmethod
+	def useLibrary(dll):
+		"""
+		Use dll (e.g. a PhidgetSimulator) instead of loading libphidget22. Must be called before the first Phidget22
+		object is created.
+		"""
+		PhidgetSupport.__dll = dll
+		PhidgetSupport.__functions = PhidgetFunctionTable(dll)
+
+	@staticmethod
+	def getFunctions():
+		if PhidgetSupport.__functions is None:
+			PhidgetSupport.getDll()
+		return PhidgetSupport.__functions
+
 	def __init__(self):
 		self.handle = None
 
@@ -1,4 +1,4 @@
-# Python 3.6
+# Python 3.7
 # Encoding: UTF-8
 # Date created: 26.06.2018
 # Author: Robert Simpson (robert_zwilling@web.de)
@@ -95,4 +95,5 @@ class PhidgetBridge4Input(object):
 
     def _attach_handler(self, channel):
         channel.setDataInterval(8)
+        channel.setVoltageRatioChangeTrigger(0)     # report every sample, required for event-driven sampling
         channel.setBridgeGain(self.channel_gain)
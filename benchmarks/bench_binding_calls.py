@@ -0,0 +1,76 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Micro-benchmark for the Phidget22 binding call path.
+
+Compiles a tiny stand-in for libphidget22 (two entry points with the real signatures) and measures calls/sec of
+a getter written the old way (CDLL attribute lookup and restype assignment on every call) against the same getter
+going through the pre-bound PhidgetFunctionTable. Requires a C compiler ('cc' or $CC).
+
+Usage: python3 benchmarks/bench_binding_calls.py [calls]
+"""
+
+import ctypes
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Phidget22.PhidgetSupport import PhidgetFunctionTable
+
+STAND_IN_SOURCE = """
+int PhidgetVoltageRatioInput_getVoltageRatio(void *ch, double *voltageRatio) { *voltageRatio = 0.25; return 0; }
+int Phidget_getAttached(void *ch, int *attached) { *attached = 1; return 0; }
+"""
+
+
+def build_stand_in(directory):
+    """
+    Compile the stand-in shared library into the given directory.
+
+    :param directory: Directory to place source and library in
+    :type directory: str
+    :return: Path of the compiled shared library
+    :rtype: str
+    """
+    source = os.path.join(directory, 'standin.c')
+    library = os.path.join(directory, 'libstandin.so')
+    with open(source, 'w') as f:
+        f.write(STAND_IN_SOURCE)
+    subprocess.check_call([os.environ.get('CC', 'cc'), '-shared', '-fPIC', '-O2', '-o', library, source])
+    return library
+
+
+def main(calls):
+    with tempfile.TemporaryDirectory() as directory:
+        dll = ctypes.cdll.LoadLibrary(build_stand_in(directory))
+        functions = PhidgetFunctionTable(dll)
+        handle = ctypes.c_void_p(1)
+
+        def per_call_lookup():
+            _VoltageRatio = ctypes.c_double()
+            __func = dll.PhidgetVoltageRatioInput_getVoltageRatio
+            __func.restype = ctypes.c_int32
+            result = __func(handle, ctypes.byref(_VoltageRatio))
+            return _VoltageRatio.value
+
+        def function_table():
+            _VoltageRatio = ctypes.c_double()
+            __func = functions.PhidgetVoltageRatioInput_getVoltageRatio
+            result = __func(handle, ctypes.byref(_VoltageRatio))
+            return _VoltageRatio.value
+
+        for name, method in (('per-call lookup', per_call_lookup), ('function table', function_table)):
+            seconds = min(timeit.repeat(method, number=calls, repeat=5))
+            print("%-16s %12.0f calls/sec" % (name, calls / seconds))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,69 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Benchmark of the csv output: rows/sec of the original per-value string building (reopening the file for every
+block) against the block formatter used by threads/filewriter, for 1, 4 and 16 boards.
+
+Usage: python3 benchmarks/bench_csv_writer.py [seconds of data per block] [blocks]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from common.recording import frame_block, format_csv_rows
+from threads.filewriter import WRITE_BUFFER_SIZE
+
+SAMPLING_INTERVAL = 0.008
+
+
+def original_writer(filename, blocks):
+    # per-value string concatenation, as written before the block formatter
+    for (timestamps, values, reference) in blocks:
+        output = ""
+        for i in range(0, len(timestamps)):
+            output += str(timestamps[i])
+            for value in values[i]:
+                output += ", " + str(value)
+            output += ", " + str(reference[i])
+            output += "\n"
+        with open(filename, 'a') as file:
+            file.write(output)
+            file.flush()
+
+
+def block_writer(filename, blocks):
+    with open(filename, 'a', buffering=WRITE_BUFFER_SIZE) as file:
+        for (timestamps, values, reference) in blocks:
+            file.write(format_csv_rows(frame_block(timestamps, values, reference)))
+            file.flush()
+
+
+def main(seconds_per_block, block_count):
+    rows = round(seconds_per_block / SAMPLING_INTERVAL)
+    with tempfile.TemporaryDirectory() as directory:
+        for boards in (1, 4, 16):
+            random = numpy.random.RandomState(boards)
+            blocks = [(43000 + random.rand(rows), random.randn(rows, 4 * boards) * 100, random.randn(rows))
+                      for _ in range(block_count)]
+            results = []
+            for name, writer in (('original', original_writer), ('block', block_writer)):
+                filename = os.path.join(directory, name + '.csv')
+                start = time.perf_counter()
+                writer(filename, blocks)
+                results.append(rows * block_count / (time.perf_counter() - start))
+                os.remove(filename)
+            print("%2i boards: original %9.0f rows/sec, block %9.0f rows/sec (x%.1f)"
+                  % (boards, results[0], results[1], results[1] / results[0]))
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0, int(sys.argv[2]) if len(sys.argv) > 2 else 20)
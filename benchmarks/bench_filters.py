@@ -0,0 +1,94 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Benchmark of the filter stage: frames/sec of a 4th order Butterworth low-pass plus a 4x FIR decimator, computed per
+sample in Python against the block filters of common/filters, for 1, 4 and 16 boards. Also reports the largest
+difference between both results.
+
+Usage: python3 benchmarks/bench_filters.py [seconds of data per block] [blocks]
+"""
+
+import os
+import sys
+import time
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from common.filters import FilterChain, BiquadCascade, FirDecimator, butterworth_lowpass, lowpass_taps
+
+SAMPLING_INTERVAL = 0.008
+FACTOR = 4
+
+
+def design():
+    sample_rate = 1 / SAMPLING_INTERVAL
+    sections = butterworth_lowpass(4, 10.0, sample_rate)
+    taps = lowpass_taps(8 * FACTOR + 1, 0.4 * sample_rate / FACTOR, sample_rate)
+    return sections, taps
+
+
+def per_sample_filter(blocks):
+    # transposed direct form II and a tap loop, one frame at a time (vectorized over channels only)
+    sections, taps = design()
+    states = None
+    history = None
+    outputs = []
+    index = 0
+    for values in blocks:
+        for row in values:
+            if states is None:
+                states = []
+                signal = row
+                for b0, b1, b2, a0, a1, a2 in sections:
+                    a = numpy.array([[-a1, 1.0], [-a2, 0.0]])
+                    states.append(numpy.outer(numpy.linalg.solve(numpy.eye(2) - a, [b1 - a1 * b0, b2 - a2 * b0]),
+                                              signal))
+                history = [row] * (len(taps) - 1)
+            signal = row
+            for (b0, b1, b2, a0, a1, a2), state in zip(sections, states):
+                output = b0 * signal + state[0]
+                state[0] = b1 * signal - a1 * output + state[1]
+                state[1] = b2 * signal - a2 * output
+                signal = output
+            history.append(signal)
+            if index % FACTOR == FACTOR - 1:
+                outputs.append(sum(tap * history[-1 - k] for k, tap in enumerate(taps)))
+            history.pop(0)
+            index += 1
+    return numpy.array(outputs)
+
+
+def block_filter(blocks):
+    sections, taps = design()
+    chain = FilterChain([BiquadCascade(sections), FirDecimator(taps, FACTOR)])
+    outputs = []
+    index = 0
+    for values in blocks:
+        frames = numpy.zeros(len(values))
+        outputs.append(chain.process(index, frames, values, frames)[2])
+        index += len(values)
+    return numpy.concatenate(outputs)
+
+
+def main(seconds_per_block, block_count):
+    rows = round(seconds_per_block / SAMPLING_INTERVAL)
+    for boards in (1, 4, 16):
+        random = numpy.random.RandomState(boards)
+        blocks = [random.randn(rows, 4 * boards) * 100 for _ in range(block_count)]
+        results = []
+        for filter_method in (per_sample_filter, block_filter):
+            start = time.perf_counter()
+            output = filter_method(blocks)
+            results.append((rows * block_count / (time.perf_counter() - start), output))
+        print("%2i boards: per sample %9.0f frames/sec, block %9.0f frames/sec (x%.0f), max. difference %.1e"
+              % (boards, results[0][0], results[1][0], results[1][0] / results[0][0],
+                 numpy.abs(results[0][1] - results[1][1]).max()))
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0, int(sys.argv[2]) if len(sys.argv) > 2 else 20)
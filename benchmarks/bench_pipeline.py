@@ -0,0 +1,320 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+End-to-end benchmark of the sampling pipeline, headless and without hardware.
+
+All boards are PhidgetBridge4Input objects whose Phidget22 bindings talk to the simulator (Phidget22/PhidgetSimulator)
+instead of libphidget22. For every number of boards it measures:
+
+    sampler     cost of one polling tick (read all channels, calibrate, fill all caches)
+    filewriter  rows/sec of the csv and binary writer threads draining a full result cache (60 s of frames)
+    udpwriter   datagrams/sec of the udp writer thread draining the same, received on the loopback interface
+    display     time to update and repaint the display (needs PyQt5 and pyqtgraph, runs on Qt's offscreen platform)
+    latency     time from sampling a frame until it is received from the udp writer, sampling live at 125 Hz
+
+Results are stored as JSON. With --compare, every metric is printed next to the one of an earlier run.
+
+Usage: python3 benchmarks/bench_pipeline.py [--boards 1,2,4,8,16,32] [--seconds 2] [--cache-seconds 60]
+                                            [--output results.json] [--compare previous.json]
+"""
+
+import argparse
+import ipaddress
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Phidget22.PhidgetSupport import PhidgetSupport
+from Phidget22.PhidgetSimulator import PhidgetSimulator
+
+SERIALS = list(range(10001, 10033))
+SIMULATOR = PhidgetSimulator(SERIALS, attach_delay=0.0, seed=1)
+PhidgetSupport.useLibrary(SIMULATOR)
+
+import PhidgetBridge4Input
+from Phidget22.Devices.VoltageRatioInputGroup import VoltageRatioInputGroup
+from common import recording, udpreceiver
+from common.decimation import MinMaxPyramid
+from common.recording import frame_block, format_csv_rows
+from common.ringbuffer import RingBuffer
+from common.scheduler import DeadlineScheduler
+from common.timebase import TimeBase, NS_PER_DAY
+from threads import datasampler, filewriter, udpwriter
+
+SAMPLING_INTERVAL = 0.008
+SECONDS_BEFORE = 15
+SECONDS_AFTER = 5
+GAINS = numpy.full(4, 1000 * 490.5)
+
+
+def statistics(samples, scale=1e6):
+    """
+    :param samples: Durations (in seconds)
+    :type samples: list
+    :param scale: Factor applied to all results, e.g. 1e6 for microseconds
+    :type scale: float
+    :return: Mean, median, 99th percentile and maximum
+    :rtype: dict
+    """
+    samples = numpy.asarray(samples) * scale
+    if len(samples) == 0:
+        return {}
+    return {'mean': float(samples.mean()), 'p50': float(numpy.percentile(samples, 50)),
+            'p99': float(numpy.percentile(samples, 99)), 'max': float(samples.max())}
+
+
+def open_boards(count):
+    boards = {}
+    for serial in SERIALS[:count]:
+        boards[serial] = PhidgetBridge4Input.PhidgetBridge4Input(serial)
+    deadline = time.time() + 5.0
+    while not all(channel.getAttached() for board in boards.values() for channel in board.channels):
+        if time.time() > deadline:
+            raise RuntimeError("Simulated boards did not attach")
+        time.sleep(0.001)
+    return boards
+
+
+def close_boards(boards):
+    for board in boards.values():
+        for channel in board.channels:
+            channel.close()
+
+
+def sample_caches(boards, frames):
+    display_cache = [MinMaxPyramid(round(SECONDS_AFTER / SAMPLING_INTERVAL), 4, with_sum=True) for _ in boards]
+    reference_cache = MinMaxPyramid(round((SECONDS_BEFORE + SECONDS_AFTER) / SAMPLING_INTERVAL))
+    result_cache = RingBuffer(frames, 4 * len(boards))
+    return display_cache, reference_cache, result_cache
+
+
+def filled_cache(boards, frames):
+    # a result cache holding 'frames' frames of random values, sampled at the usual rate up to now
+    cache = RingBuffer(frames + 1, 4 * len(boards))
+    random = numpy.random.RandomState(len(boards))
+    now = time.monotonic_ns()
+    for i, row in enumerate(random.randn(frames, 4 * len(boards)) * 100):
+        cache.write(now - int((frames - i) * SAMPLING_INTERVAL * 1e9), row, float(i))
+    return cache
+
+
+def bench_sampler(boards, ticks):
+    (display_cache, reference_cache, result_cache) = sample_caches(boards, ticks)
+    processor = datasampler.SampleProcessor(boards, [[0.0, 0.0]], display_cache, result_cache, reference_cache,
+                                            GAINS, SECONDS_BEFORE, SAMPLING_INTERVAL)
+    read_channels = VoltageRatioInputGroup([channel for board in boards.values() for channel in board.channels])
+    durations = []
+    for tick in range(ticks):
+        start = time.perf_counter()
+        processor.process(read_channels.getVoltageRatios(), time.monotonic_ns(), tick * SAMPLING_INTERVAL)
+        durations.append(time.perf_counter() - start)
+    return {'tick_us': statistics(durations), 'ticks': ticks}
+
+
+def bench_filewriter(boards, frames, directory):
+    result = {}
+    columns = recording.column_names(boards)
+    for mode in ('csv', 'binary'):
+        cache = filled_cache(boards, frames)
+        timebase = TimeBase()
+        filename = os.path.join(directory, 'bench.' + mode)
+        if mode == 'csv':
+            (timestamps, values, reference) = cache.reader().read()
+            expected = len(format_csv_rows(frame_block(timebase.to_excel(timestamps), values, reference)))
+            target = filewriter.thread_method
+            kwargs = dict(filename=filename)
+            open(filename, 'w').close()
+        else:
+            expected = len(recording.encode_header(columns)) + frames * (len(columns)) * recording.DTYPE.itemsize
+            target = filewriter.binary_thread_method
+            kwargs = dict(filename=filename, columns=columns)
+
+        stop = threading.Event()
+        start = time.perf_counter()
+        thread = threading.Thread(target=target, daemon=True, kwargs=dict(
+            kwargs, result_cache=cache, interval=0.001, fsync_interval=None, timebase=timebase, stop=stop))
+        thread.start()
+        while not os.path.exists(filename) or os.path.getsize(filename) < expected:
+            time.sleep(0.0005)
+        seconds = time.perf_counter() - start
+        stop.set()
+        thread.join()
+        result[mode] = {'rows_per_s': frames / seconds, 'bytes': os.path.getsize(filename)}
+        os.remove(filename)
+    return result
+
+
+def bench_udpwriter(boards, frames):
+    cache = filled_cache(boards, frames)
+    receiver = udpreceiver.Receiver('127.0.0.1', 0, timeout=0.5)
+    stop = threading.Event()
+    thread = threading.Thread(target=udpwriter.thread_method, daemon=True, kwargs=dict(
+        ip=ipaddress.IPv4Address('127.0.0.1'), port=receiver.port, result_cache=cache, interval=0.001, stop=stop))
+    start = time.perf_counter()
+    thread.start()
+    datagrams = received = 0
+    last = start
+    while received < frames:
+        result = receiver.receive()
+        if result is None:
+            break                                       # the rest was lost
+        datagrams += 1
+        received += len(result[1])
+        last = time.perf_counter()
+    stop.set()
+    thread.join()
+    receiver.close()
+    return {'datagrams_per_s': datagrams / (last - start), 'frames_per_s': received / (last - start),
+            'datagrams': datagrams, 'lost_frames': frames - received}
+
+
+def bench_display(boards, frames, repeats):
+    try:
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5 import QtWidgets
+        from sampledisplay import sample_display
+    except ImportError as e:
+        return {'skipped': str(e)}
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    (display_cache, reference_cache, _) = sample_caches(boards, 1)
+    random = numpy.random.RandomState(len(boards))
+    for row in random.randn(frames, 4 * len(boards)) * 100:
+        for board_index, board_cache in enumerate(display_cache):
+            board_cache.append(row[4 * board_index:4 * board_index + 4])
+        reference_cache.append(row[0])
+
+    form = sample_display.SampleDisplay(display_cache, reference_cache, boards, SAMPLING_INTERVAL, SECONDS_BEFORE,
+                                        SECONDS_AFTER)
+    form.timer.stop()
+    form.resize(1280, 800)
+    form.show()
+    app.processEvents()
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        form.update()
+        form.layout_widget.repaint()
+        app.processEvents()
+        durations.append(time.perf_counter() - start)
+    form.close()
+    return {'frame_ms': statistics(durations, 1e3)}
+
+
+def bench_latency(boards, seconds, udp_interval):
+    (display_cache, reference_cache, result_cache) = sample_caches(boards, round(60 / SAMPLING_INTERVAL))
+    processor = datasampler.SampleProcessor(boards, [[0.0, 0.0]], display_cache, result_cache, reference_cache,
+                                            GAINS, SECONDS_BEFORE, SAMPLING_INTERVAL)
+    read_channels = VoltageRatioInputGroup([channel for board in boards.values() for channel in board.channels])
+    timebase = TimeBase()
+    receiver = udpreceiver.Receiver('127.0.0.1', 0, timeout=0.5)
+    stop = threading.Event()
+    writer = threading.Thread(target=udpwriter.thread_method, daemon=True, kwargs=dict(
+        ip=ipaddress.IPv4Address('127.0.0.1'), port=receiver.port, result_cache=result_cache, interval=udp_interval,
+        timebase=timebase, stop=stop))
+    writer.start()
+
+    # sample live, paced like threads/datasampler.thread_method
+    scheduler = DeadlineScheduler(SAMPLING_INTERVAL)
+
+    def sample():
+        while not stop.is_set():
+            time_elapsed = scheduler.wait()
+            processor.process(read_channels.getVoltageRatios(), time.monotonic_ns(), time_elapsed)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+
+    latencies = []
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        result = receiver.receive()
+        if result is None:
+            continue
+        receive_time = time.monotonic_ns()
+        sampled = (result[1][:, 0] - timebase.excel_anchor) * NS_PER_DAY + timebase.monotonic_anchor
+        latencies.extend(((receive_time - sampled) / 1e9).tolist())
+    stop.set()
+    sampler.join()
+    writer.join()
+    receiver.close()
+    return {'latency_ms': statistics(latencies, 1e3), 'frames': len(latencies),
+            'sampler_lateness_ms_max': scheduler.lateness_max * 1e3, 'sampler_overruns': scheduler.overruns}
+
+
+def run(board_counts, seconds, udp_interval, cache_seconds):
+    frames = round(seconds / SAMPLING_INTERVAL)
+    cache_frames = round(cache_seconds / SAMPLING_INTERVAL)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for count in board_counts:
+            boards = open_boards(count)
+            print("%2i board(s)..." % count)
+            results[str(count)] = {
+                'sampler': bench_sampler(boards, frames),
+                'filewriter': bench_filewriter(boards, cache_frames, directory),
+                'udpwriter': bench_udpwriter(boards, cache_frames),
+                'display': bench_display(boards, frames, 50),
+                'latency': bench_latency(boards, seconds, udp_interval),
+            }
+            close_boards(boards)
+    return results
+
+
+def flatten(results, prefix=''):
+    # nested results as {'1.sampler.tick_us.mean': value, ...}, numbers only
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, prefix + key + '.'))
+        elif isinstance(value, (int, float)):
+            flat[prefix + key] = value
+    return flat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end benchmark of the sampling pipeline.")
+    parser.add_argument('--boards', default='1,2,4,8,16,32', help="comma-separated numbers of simulated boards")
+    parser.add_argument('--seconds', type=float, default=2.0, help="seconds of data per measurement")
+    parser.add_argument('--cache-seconds', type=float, default=60.0, help="seconds of data drained by the writers")
+    parser.add_argument('--udp-interval', type=float, default=0.1, help="interval of the udp writer in the latency run")
+    parser.add_argument('--output', default='bench_pipeline.json', help="file to store the results in")
+    parser.add_argument('--compare', metavar='FILE', help="results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    board_counts = [int(count) for count in args.boards.split(',')]
+    if max(board_counts) > len(SERIALS):
+        parser.error("at most " + str(len(SERIALS)) + " boards can be simulated")
+    results = run(board_counts, args.seconds, args.udp_interval, args.cache_seconds)
+
+    document = {'date': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+                'platform': platform.platform(), 'seconds': args.seconds, 'results': results}
+    with open(args.output, 'w') as f:
+        json.dump(document, f, indent=2)
+    print("Results written to " + args.output)
+
+    current = flatten(results)
+    previous = {}
+    if args.compare is not None:
+        with open(args.compare) as f:
+            previous = flatten(json.load(f)['results'])
+    for key in sorted(current, key=lambda key: (int(key.split('.')[0]), key)):
+        line = "%-45s %14.2f" % (key, current[key])
+        if key in previous and previous[key] != 0:
+            line += "  (previous %14.2f, %+6.1f %%)" % (previous[key], 100 * (current[key] / previous[key] - 1))
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,328 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+What happens to results when a writer cannot keep up, e.g. because the disk or the UDP target stalls.
+
+The result cache is a RingBuffer of fixed capacity, so memory never grows; the policy decides what happens once the
+backlog of a writer crosses the high-water mark (a fraction of the capacity):
+
+    'drop'  the sampler keeps overwriting the oldest frames, the writer loses them (counted as overflows)
+    'spill' a spool thread moves the backlog into an append-only temporary file, the writer reads it back in order
+            before it continues with the cache, so nothing is lost as long as there is disk space
+    'block' writing into the cache waits (at most block_timeout per frame) until the writer is below the mark again,
+            which delays sampling instead of losing results. Only works with the writer in the sampling process.
+"""
+
+import tempfile
+import threading
+import time
+import numpy
+from common import metrics
+
+POLICIES = ('drop', 'spill', 'block')
+
+
+class SpillFile(object):
+    """
+    Append-only temporary file of frames, read back oldest first. The file is deleted when closed; whenever it has
+    been read completely it is truncated, so it only takes up disk space while a writer is behind.
+    """
+
+    def __init__(self, channels, directory=None):
+        """
+        :param channels: Number of values per frame
+        :type channels: int
+        :param directory: Directory of the file (None: the system's temporary directory)
+        :type directory: str
+        """
+        self.dtype = numpy.dtype([('timestamp', numpy.int64), ('values', numpy.float64, (channels,)),
+                                  ('reference', numpy.float64)])
+        self.file = tempfile.TemporaryFile(prefix='spill-', suffix='.frames', dir=directory)
+        self.blocks = []                    # [sequence number of the next frame, frames left] per contiguous run
+        self.read_offset = 0
+        self.write_offset = 0
+
+    @property
+    def frames(self):
+        """
+        Number of frames written but not read yet.
+        """
+        return (self.write_offset - self.read_offset) // self.dtype.itemsize
+
+    def append(self, sequence, timestamps, values, reference):
+        """
+        Append a contiguous run of frames.
+
+        :param sequence: Sequence number (position in the result cache) of the first frame
+        :type sequence: int
+        :param timestamps: One timestamp per frame
+        :type timestamps: numpy.ndarray
+        :param values: Values of all channels (frames x channels)
+        :type values: numpy.ndarray
+        :param reference: One reference value per frame
+        :type reference: numpy.ndarray
+        :return: Nothing
+        :rtype: None
+        """
+        if len(timestamps) == 0:
+            return
+        block = numpy.empty(len(timestamps), dtype=self.dtype)
+        block['timestamp'] = timestamps
+        block['values'] = values
+        block['reference'] = reference
+        self.file.seek(self.write_offset)
+        self.file.write(block.tobytes())
+        self.write_offset += block.nbytes
+        if len(self.blocks) > 0 and sum(self.blocks[-1]) == sequence:
+            self.blocks[-1][1] += len(block)
+        else:
+            self.blocks.append([sequence, len(block)])
+
+    def read(self, max_frames):
+        """
+        Read the oldest frames, never across a gap in the sequence numbers.
+
+        :param max_frames: Upper limit for the number of frames returned
+        :type max_frames: int
+        :return: Sequence number of the first frame, timestamps, values (frames x channels) and reference values
+        :rtype: tuple
+        """
+        (sequence, left) = self.blocks[0]
+        count = min(left, max_frames)
+        self.file.seek(self.read_offset)
+        block = numpy.frombuffer(self.file.read(count * self.dtype.itemsize), dtype=self.dtype)
+        self.read_offset += block.nbytes
+        if count < left:
+            self.blocks[0] = [sequence + count, left - count]
+        else:
+            self.blocks.pop(0)
+        if self.read_offset == self.write_offset:
+            self.file.truncate(0)
+            self.read_offset = self.write_offset = 0
+        return sequence, block['timestamp'].copy(), block['values'].copy(), block['reference'].copy()
+
+    def close(self):
+        self.file.close()
+
+
+class Backpressure(object):
+    """
+    Policy for writers falling behind the sampler. One instance is shared by the writer (see reader()) and, for the
+    'block' policy, the sampler (see cache()).
+    """
+
+    def __init__(self, policy='drop', high_water=0.5, directory=None, interval=0.1, block_timeout=1.0):
+        """
+        :param policy: 'drop', 'spill' or 'block' (see module documentation)
+        :type policy: str
+        :param high_water: Backlog of a writer (as fraction of the result cache's capacity) above which frames are
+        spilled or writing blocks
+        :type high_water: float
+        :param directory: Directory of the spill files (None: the system's temporary directory)
+        :type directory: str
+        :param interval: Time between checks of the backlog by the spool thread (in seconds)
+        :type interval: float
+        :param block_timeout: Longest time writing one frame may be blocked (in seconds), after that the oldest frame
+        is overwritten anyway
+        :type block_timeout: float
+        """
+        if policy not in POLICIES:
+            raise ValueError("Backpressure policy must be one of " + ", ".join(POLICIES) + ", not '" + str(policy) +
+                             "'")
+        if not 0.0 < high_water <= 1.0:
+            raise ValueError("High-water mark must be a fraction of the cache capacity in (0, 1]")
+        self.policy = policy
+        self.high_water = high_water
+        self.directory = directory
+        self.interval = interval
+        self.block_timeout = block_timeout
+
+        self.blocked = 0                    # frames whose writing had to wait
+        self.blocked_seconds = 0.0          # total time writing waited
+        self.readers = []
+        self.condition = threading.Condition()
+
+    def __getstate__(self):
+        # passed to writer processes as configuration only
+        state = dict(self.__dict__)
+        del state['readers'], state['condition']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.readers = []
+        self.condition = threading.Condition()
+
+    def reader(self, reader, registry=None):
+        """
+        Apply the policy to the reader of a writer.
+
+        :param reader: Reader of the result cache (not a wrapper)
+        :type reader: RingBufferReader
+        :param registry: Metrics registry the policy counts in (default: metrics.REGISTRY)
+        :type registry: MetricsRegistry
+        :return: Reader to be used by the writer instead
+        :rtype: BackpressureReader
+        """
+        backpressure_reader = BackpressureReader(reader, self, registry)
+        if self.policy == 'block':
+            with self.condition:
+                self.readers.append(backpressure_reader)
+        return backpressure_reader
+
+    def cache(self, result_cache, registry=None):
+        """
+        The result cache as seen by the sampler: for the 'block' policy, writing waits for the writers.
+
+        :param result_cache: Cache the sampler writes into
+        :type result_cache: RingBuffer
+        :param registry: Metrics registry the policy counts in (default: metrics.REGISTRY)
+        :type registry: MetricsRegistry
+        :return: The result cache itself, or a BlockingCache wrapping it
+        :rtype: RingBuffer
+        """
+        if self.policy != 'block':
+            return result_cache
+        if registry is None:
+            registry = metrics.REGISTRY
+        registry.counter('backpressure_blocked_frames_total', "Frames whose writing waited for a writer",
+                         short='blocked', function=lambda: self.blocked)
+        registry.counter('backpressure_blocked_seconds_total', "Time writing into the result cache waited",
+                         function=lambda: self.blocked_seconds)
+        return BlockingCache(result_cache, self)
+
+    def wait(self):
+        """
+        Wait until no writer's backlog is above the high-water mark, but at most block_timeout.
+
+        :return: Nothing
+        :rtype: None
+        """
+        if not any(reader.full for reader in self.readers):
+            return
+        start = time.perf_counter()
+        with self.condition:
+            self.condition.wait_for(lambda: not any(reader.full for reader in self.readers), self.block_timeout)
+        self.blocked += 1
+        self.blocked_seconds += time.perf_counter() - start
+
+    def notify(self):
+        with self.condition:
+            self.condition.notify_all()
+
+
+class BlockingCache(object):
+    """
+    Write side of a result cache that waits for the writers before each frame (policy 'block').
+    """
+
+    def __init__(self, result_cache, backpressure):
+        self.result_cache = result_cache
+        self.backpressure = backpressure
+
+    def write(self, timestamp, values, reference):
+        self.backpressure.wait()
+        self.result_cache.write(timestamp, values, reference)
+
+
+class BackpressureReader(object):
+    """
+    Wraps the RingBufferReader of a writer and applies a Backpressure policy to it. Like the wrapped reader,
+    'position' is the sequence number of the next frame returned, so filters and sequence numbers of UDP packets are
+    not affected by spilling.
+    """
+
+    def __init__(self, reader, backpressure, registry=None):
+        self.reader = reader
+        self.backpressure = backpressure
+        self.position = reader.position
+        self.limit = max(1, int(backpressure.high_water * (reader.ring_buffer.capacity - 1)))
+        self.chunk = reader.ring_buffer.capacity        # most frames read back from the spill file at once
+        self.lock = threading.Lock()
+        self.spill = None
+        self.spilled = 0                    # frames moved into the spill file
+        self.restored = 0                   # frames read back from the spill file
+        self.caught_up = True               # the last read was served from the cache, none are left in the spill file
+        self.closed = False
+
+        if registry is None:
+            registry = metrics.REGISTRY
+        if backpressure.policy == 'spill':
+            self.spill = SpillFile(reader.ring_buffer.channels, backpressure.directory)
+            registry.counter('backpressure_spilled_frames_total', "Frames moved into the spill file", short='spilled',
+                             function=lambda: self.spilled)
+            registry.counter('backpressure_restored_frames_total', "Frames read back from the spill file",
+                             function=lambda: self.restored)
+            registry.gauge('backpressure_spill_frames', "Frames waiting in the spill file", short='spill',
+                           function=lambda: self.backlog)
+            threading.Thread(target=self.__spool, name='spool', daemon=True).start()
+
+    @property
+    def overflows(self):
+        return self.reader.overflows
+
+    @property
+    def backlog(self):
+        """
+        Number of frames waiting in the spill file.
+        """
+        return self.spill.frames if self.spill is not None else 0
+
+    @property
+    def full(self):
+        return self.reader.available > self.limit
+
+    def read(self, max_frames=None):
+        """
+        Read the oldest frames not read yet: first those in the spill file (at most one cache capacity at a time),
+        then those in the cache.
+
+        :param max_frames: Upper limit for the number of frames returned (default: no limit)
+        :type max_frames: int
+        :return: Timestamps, values (frames x channels) and reference values
+        :rtype: tuple
+        """
+        with self.lock:
+            if self.backlog > 0:
+                (sequence, timestamps, values, reference) = self.spill.read(
+                    self.chunk if max_frames is None else min(max_frames, self.chunk))
+                self.restored += len(timestamps)
+                self.position = sequence + len(timestamps)
+                self.caught_up = False
+            else:
+                (timestamps, values, reference) = self.reader.read(max_frames)
+                self.position = self.reader.position
+                self.caught_up = True
+        if self.backpressure.policy == 'block':
+            self.backpressure.notify()
+        return timestamps, values, reference
+
+    def close(self):
+        """
+        Stop spilling and delete the spill file, frames left in it are lost.
+
+        :return: Nothing
+        :rtype: None
+        """
+        with self.lock:
+            self.closed = True
+            if self.spill is not None:
+                self.spill.close()
+        if self in self.backpressure.readers:
+            self.backpressure.readers.remove(self)
+
+    def __spool(self):
+        # move the backlog of the cache into the spill file whenever it crosses the high-water mark
+        while True:
+            time.sleep(self.backpressure.interval)
+            with self.lock:
+                if self.closed:
+                    return
+                if self.full:
+                    (timestamps, values, reference) = self.reader.read()
+                    self.spill.append(self.reader.position - len(timestamps), timestamps, values, reference)
+                    self.spilled += len(timestamps)
@@ -1,4 +1,4 @@
-# Python 3.6
+# Python 3.7
 # Encoding: UTF-8
 # Date created: 17.08.2018
 # Author: Robert Simpson (robert_zwilling@web.de)
@@ -0,0 +1,221 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+import json
+import os
+import numpy
+
+
+class OffsetCalibration(object):
+    """
+    Determines the static offset of every channel while the load cells are unloaded and subtracts it afterwards.
+
+    During zeroing the mean and variance of every channel are updated with Welford's algorithm, so no samples are
+    stored and the cost per frame is constant. Once the warm-up is over the means become the new offsets, and every
+    channel whose standard deviation exceeded the noise limit is flagged. Zeroing runs once at the start and again
+    whenever rezero() is called, also from another thread; until it completes, the previous offsets stay in use.
+    """
+
+    def __init__(self, channels, warmup=1.0, noise_limit=None):
+        """
+        :param channels: Number of channels
+        :type channels: int
+        :param warmup: Duration of zeroing (in seconds)
+        :type warmup: float
+        :param noise_limit: Highest acceptable standard deviation of a channel during zeroing (None: do not check)
+        :type noise_limit: float
+        """
+        self.warmup = warmup
+        self.noise_limit = noise_limit
+        self.offsets = numpy.zeros(channels)
+        self.noise = numpy.zeros(channels)              # standard deviation during the last zeroing
+        self.noisy = numpy.zeros(channels, dtype=bool)  # channels whose noise exceeded the limit
+        self.calibrated = False
+
+        self.__count = 0
+        self.__mean = numpy.zeros(channels)
+        self.__m2 = numpy.zeros(channels)
+        self.__delta = numpy.zeros(channels)
+        self.__zeroing_start = None
+        self.__rezero_requested = True
+
+    @property
+    def zeroing(self):
+        return self.__rezero_requested or self.__zeroing_start is not None
+
+    def rezero(self):
+        """
+        Start zeroing again with the next frame. The load cells must be unloaded for the warm-up duration.
+        """
+        self.__rezero_requested = True
+
+    def apply(self, measurements, time_elapsed):
+        """
+        Feed one frame into the zeroing (if active) and subtract the current offsets in place.
+
+        :param measurements: Measurements of all channels
+        :type measurements: numpy.ndarray
+        :param time_elapsed: Seconds since the start of sampling
+        :type time_elapsed: float
+        :return: The measurements, with offsets subtracted
+        :rtype: numpy.ndarray
+        """
+        if self.__rezero_requested:
+            self.__rezero_requested = False
+            self.__zeroing_start = time_elapsed
+            self.__count = 0
+            self.__mean[:] = 0
+            self.__m2[:] = 0
+
+        if self.__zeroing_start is not None:
+            self.__update(measurements)
+            if time_elapsed - self.__zeroing_start >= self.warmup:
+                self.__finish()
+
+        measurements -= self.offsets
+        return measurements
+
+    def __update(self, measurements):
+        # Welford: mean += (x - mean) / n, m2 += (x - mean_old) * (x - mean_new)
+        self.__count += 1
+        delta = self.__delta
+        numpy.subtract(measurements, self.__mean, out=delta)
+        self.__mean += delta / self.__count
+        self.__m2 += delta * (measurements - self.__mean)
+
+    def __finish(self):
+        self.__zeroing_start = None
+        self.offsets[:] = self.__mean
+        self.noise[:] = numpy.sqrt(self.__m2 / max(1, self.__count - 1))
+        self.calibrated = True
+
+        if self.noise_limit is not None:
+            self.noisy[:] = self.noise > self.noise_limit
+            for channel in numpy.flatnonzero(self.noisy):
+                print("Warning: channel " + str(channel) + " was noisy while zeroing (standard deviation "
+                      + str(self.noise[channel]) + ", limit " + str(self.noise_limit) + ")")
+
+
+class ChannelCalibration(object):
+    """
+    Converts the voltage ratios of all channels of all boards into forces with one calibration per channel.
+
+    Calibrations are read from a JSON file keyed by board serial number and channel number:
+
+        {
+            "12345": {
+                "0": {"gain": 490500.0, "offset": 0.0},
+                "1": {"polynomial": [0.0, 490500.0, 12.5]},
+                ...
+            },
+            ...
+        }
+
+    A channel is either linear (force = gain * ratio + offset) or, if 'polynomial' is given, a polynomial in the
+    ratio with the coefficients in ascending order. Channels missing from the file use the default gain of their
+    channel number. All calibrations are stored as one coefficient matrix, so a frame of all boards is converted with
+    a few vector operations (Horner's scheme) regardless of the number of channels.
+
+    The file is checked for changes at most every reload_interval seconds and reloaded while sampling. A file that
+    cannot be read is reported and the previous calibration stays in use.
+    """
+
+    def __init__(self, filename, serial_numbers, default_gains, reload_interval=1.0):
+        """
+        :param filename: Path of the calibration file (None: use the default gains only). If it does not exist, a
+        template with the default gains of all connected boards is created.
+        :type filename: str
+        :param serial_numbers: Serial numbers of the boards, in the ordering of their channels in a frame
+        :type serial_numbers: list
+        :param default_gains: Gain per channel number (4 values) for channels missing from the file
+        :type default_gains: numpy.ndarray or list
+        :param reload_interval: Minimum time between checks of the file for changes (in seconds)
+        :type reload_interval: float
+        """
+        self.filename = filename
+        self.serial_numbers = [str(serial_number) for serial_number in serial_numbers]
+        self.default_gains = list(default_gains)
+        self.reload_interval = reload_interval
+        self.coefficients = None            # channels x (degree + 1), ascending powers
+        self.output = numpy.zeros(4 * len(self.serial_numbers))
+        self.__modified = None
+        self.__last_check = None
+
+        if filename is not None and not os.path.exists(filename):
+            self.__create_template()
+        self.__load(self.__read())
+
+    def __create_template(self):
+        template = {serial_number: {str(i): {'gain': float(gain), 'offset': 0.0}
+                                    for i, gain in enumerate(self.default_gains)}
+                    for serial_number in self.serial_numbers}
+        with open(self.filename, mode='w') as f:
+            json.dump(template, f, indent=4)
+
+    def __read(self):
+        if self.filename is None:
+            return {}
+        self.__modified = os.stat(self.filename).st_mtime
+        with open(self.filename, mode='r') as f:
+            return json.load(f)
+
+    def __load(self, calibrations):
+        rows = []
+        for serial_number in self.serial_numbers:
+            board = calibrations.get(serial_number, {})
+            for i in range(0, 4):
+                channel = board.get(str(i), {'gain': self.default_gains[i]})
+                if 'polynomial' in channel:
+                    rows.append([float(c) for c in channel['polynomial']])
+                else:
+                    rows.append([float(channel.get('offset', 0.0)), float(channel['gain'])])
+
+        coefficients = numpy.zeros((len(rows), max(len(row) for row in rows)))
+        for i, row in enumerate(rows):
+            coefficients[i, :len(row)] = row
+        self.coefficients = coefficients        # replaced as a whole, so apply() never sees a partial update
+
+    def check_for_changes(self, time_elapsed):
+        """
+        Reload the calibration file if it was modified. Checks at most every reload_interval seconds.
+
+        :param time_elapsed: Seconds since the start of sampling
+        :type time_elapsed: float
+        :return: True if the calibration was reloaded
+        :rtype: bool
+        """
+        if self.filename is None:
+            return False
+        if self.__last_check is not None and time_elapsed - self.__last_check < self.reload_interval:
+            return False
+        self.__last_check = time_elapsed
+
+        try:
+            if os.stat(self.filename).st_mtime == self.__modified:
+                return False
+            self.__load(self.__read())
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print("Could not reload calibration file " + self.filename + ": " + str(e))
+            return False
+        print("Calibration reloaded from " + self.filename)
+        return True
+
+    def apply(self, ratios):
+        """
+        Convert voltage ratios into forces.
+
+        :param ratios: Voltage ratios of all channels, ordered board by board
+        :type ratios: numpy.ndarray
+        :return: Forces of all channels. The array is reused by the next call.
+        :rtype: numpy.ndarray
+        """
+        coefficients = self.coefficients
+        output = self.output
+        output[:] = coefficients[:, -1]
+        for power in range(coefficients.shape[1] - 2, -1, -1):
+            output *= ratios
+            output += coefficients[:, power]
+        return output
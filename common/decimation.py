@@ -0,0 +1,141 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+import numpy
+from common.ringbuffer import HistoryBuffer
+
+
+class MinMaxPyramid(object):
+    """
+    History of a sample stream at several resolutions, used to display long windows without drawing every sample.
+
+    Level 0 holds the raw samples. Every higher level holds the minimum and maximum of blocks of 'factor' entries of
+    the level below, so level k summarizes factor**k samples per entry. When a window is requested for a given number
+    of pixels, the finest level that needs no more than that many entries is chosen, and every entry is drawn as a
+    min/max point pair. The drawn curve keeps all peaks while its cost no longer depends on the window length.
+
+    Appending costs one row copy plus, amortized, one min/max update per completed block. Only completed blocks are
+    shown, so above level 0 the newest (less than one pixel wide) part of the window is missing.
+
+    Supports the parts of the deque interface the sampler uses (append, maxlen, indexing) on the raw samples, so it
+    can replace a HistoryBuffer as display or reference cache.
+    """
+
+    def __init__(self, length, width=None, factor=4, with_sum=False):
+        """
+        :param length: Number of raw samples kept, i.e. the longest window that can be displayed
+        :type length: int
+        :param width: Number of values per sample (None: one scalar value per sample)
+        :type width: int
+        :param factor: Number of entries of a level summarized by one entry of the next level
+        :type factor: int
+        :param with_sum: Keep an additional last column holding the sum of each sample's values
+        :type with_sum: bool
+        """
+        self.maxlen = length
+        self.width = width
+        self.factor = factor
+        self.with_sum = with_sum
+        self.columns = (1 if width is None else width) + (1 if with_sum else 0)
+        self.row = numpy.zeros(self.columns)
+        self.appended = 0
+
+        self.raw = HistoryBuffer(length, self.columns)
+        self.lows = [None]                  # per level: minimum of each block (level 0 is the raw history)
+        self.highs = [None]                 # per level: maximum of each block
+        self.pending_lows = [None]          # per level: minimum of the block currently being filled
+        self.pending_highs = [None]
+        self.pending_counts = [0]           # per level: entries of the level below in the block being filled
+        block = factor
+        while length // block >= 2:
+            self.lows.append(HistoryBuffer(length // block, self.columns))
+            self.highs.append(HistoryBuffer(length // block, self.columns))
+            self.pending_lows.append(numpy.zeros(self.columns))
+            self.pending_highs.append(numpy.zeros(self.columns))
+            self.pending_counts.append(0)
+            block *= factor
+
+    @property
+    def levels(self):
+        return len(self.lows)
+
+    def append(self, value):
+        """
+        Append one sample and update all levels whose block it completes.
+
+        :param value: New sample (a row of 'width' values if the pyramid has a width)
+        :type value: float or numpy.ndarray
+        :return: Nothing
+        :rtype: None
+        """
+        row = self.row
+        if self.with_sum:
+            row[:-1] = value
+            row[-1] = row[:-1].sum()
+        else:
+            row[:] = value
+        self.raw.append(row)
+        self.appended += 1
+
+        low = high = row
+        for level in range(1, self.levels):
+            pending_low = self.pending_lows[level]
+            pending_high = self.pending_highs[level]
+            if self.pending_counts[level] == 0:
+                pending_low[:] = low
+                pending_high[:] = high
+            else:
+                numpy.minimum(pending_low, low, out=pending_low)
+                numpy.maximum(pending_high, high, out=pending_high)
+            self.pending_counts[level] += 1
+
+            if self.pending_counts[level] < self.factor:
+                break
+            # block complete: store it and pass it on to the next level
+            self.pending_counts[level] = 0
+            self.lows[level].append(pending_low)
+            self.highs[level].append(pending_high)
+            low, high = pending_low, pending_high
+
+    def window(self, samples, points, column=0):
+        """
+        Get the most recent part of the history, reduced to at most about 'points' point pairs.
+
+        :param samples: Length of the window (in samples, at most maxlen)
+        :type samples: int
+        :param points: Number of point pairs the window may be drawn with, e.g. the plot width in pixels
+        :type points: int
+        :param column: Column to return (the sum column is the last one)
+        :type column: int
+        :return: Age of every point (in samples, 0 = newest sample, oldest first) and the values. Above level 0 every
+        entry contributes its minimum and its maximum at the same age.
+        :rtype: tuple
+        """
+        samples = min(samples, self.maxlen)
+        level = 0
+        block = 1
+        while level + 1 < self.levels and -(-samples // block) > points:
+            level += 1
+            block *= self.factor
+
+        if level == 0:
+            values = self.raw.view()[-samples:, column].copy()
+            return numpy.arange(samples - 1, -1, -1, dtype=float), values
+
+        count = min(-(-samples // block), self.lows[level].maxlen)
+        newest_age = self.appended % block          # samples appended since the newest complete block
+        ages = newest_age + (numpy.arange(count - 1, -1, -1) * block) + (block - 1) / 2
+        values = numpy.empty(2 * count)
+        values[0::2] = self.lows[level].view()[-count:, column]
+        values[1::2] = self.highs[level].view()[-count:, column]
+        return numpy.repeat(ages, 2), values
+
+    def __getitem__(self, index):
+        row = self.raw[index]
+        return row[0] if self.width is None else row[:self.width]
+
+    def __len__(self):
+        return self.maxlen
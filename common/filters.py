@@ -0,0 +1,273 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Digital filters and decimators working on blocks of frames, placed between the result cache and a writer.
+
+Every stage takes a block of frames (timestamps, values as frames x channels, reference) and returns the filtered
+block, carrying its state over to the next block, so a stream filtered block by block is identical to the stream
+filtered at once. All channels are processed together and no stage loops over samples in Python:
+
+    BiquadCascade   IIR filter of second-order sections. The recursion of each section is solved in closed form for
+                    a whole chunk of samples (state-space form), which turns it into two matrix products.
+    FirDecimator    FIR low-pass that only computes every factor-th output, one vector operation per tap.
+
+A FilterChain combines stages and FilteredReader applies a chain to everything read from a RingBufferReader, so a
+writer uses it like the plain reader.
+"""
+
+import math
+import numpy
+
+
+def butterworth_lowpass(order, cutoff, sample_rate):
+    """
+    Design a Butterworth low-pass as second-order sections (bilinear transform with prewarping).
+
+    :param order: Filter order
+    :type order: int
+    :param cutoff: -3 dB frequency (in Hz, below sample_rate / 2)
+    :type cutoff: float
+    :param sample_rate: Sampling frequency (in Hz)
+    :type sample_rate: float
+    :return: One row [b0, b1, b2, a0, a1, a2] per section
+    :rtype: numpy.ndarray
+    """
+    if not 0 < cutoff < sample_rate / 2:
+        raise ValueError("Cutoff frequency must be between 0 and half the sampling frequency")
+
+    w = math.tan(math.pi * cutoff / sample_rate)
+    sections = []
+    for k in range(order // 2):
+        # the pole pairs of a Butterworth filter differ only in their quality factor
+        q = 1 / (2 * math.sin((2 * k + 1) * math.pi / (2 * order)))
+        norm = 1 + w / q + w * w
+        sections.append([w * w / norm, 2 * w * w / norm, w * w / norm,
+                         1.0, 2 * (w * w - 1) / norm, (1 - w / q + w * w) / norm])
+    if order % 2 == 1:
+        sections.append([w / (1 + w), w / (1 + w), 0.0, 1.0, (w - 1) / (1 + w), 0.0])
+    return numpy.array(sections)
+
+
+def lowpass_taps(count, cutoff, sample_rate):
+    """
+    Design a linear-phase FIR low-pass (windowed sinc, Hamming window) with unity gain at DC.
+
+    :param count: Number of taps
+    :type count: int
+    :param cutoff: Cutoff frequency (in Hz, below sample_rate / 2)
+    :type cutoff: float
+    :param sample_rate: Sampling frequency (in Hz)
+    :type sample_rate: float
+    :return: Taps
+    :rtype: numpy.ndarray
+    """
+    if not 0 < cutoff < sample_rate / 2:
+        raise ValueError("Cutoff frequency must be between 0 and half the sampling frequency")
+
+    n = numpy.arange(count) - (count - 1) / 2
+    taps = numpy.sinc(2 * cutoff / sample_rate * n) * numpy.hamming(count)
+    return taps / taps.sum()
+
+
+class BiquadCascade(object):
+    """
+    IIR filter made of second-order sections in series, applied to every channel.
+
+    Each section (transposed direct form II) is written as a state-space system s[n+1] = A s[n] + B x[n],
+    y[n] = C s[n] + D x[n]. For a chunk of up to chunk_length samples, the outputs and the final state then follow from
+    the initial state and the inputs by matrix products with precomputed matrices (the impulse response as a Toeplitz
+    matrix and the powers of A), which replaces the per-sample recursion.
+
+    The state is initialized with the steady state of the first frame, so the filter starts without a transient.
+    """
+
+    def __init__(self, sections, chunk_length=256):
+        """
+        :param sections: One row [b0, b1, b2, a0, a1, a2] per section, e.g. from butterworth_lowpass()
+        :type sections: numpy.ndarray
+        :param chunk_length: Number of samples solved by one matrix product (larger chunks cost more per sample)
+        :type chunk_length: int
+        """
+        self.sections = numpy.array(sections, dtype=float)
+        self.chunk_length = chunk_length
+        self.states = None                  # per section: state (2 x channels)
+        self.__matrices = [self.__precompute(section, chunk_length) for section in self.sections]
+
+    @staticmethod
+    def __precompute(section, length):
+        b0, b1, b2, a0, a1, a2 = section / section[3]
+        a = numpy.array([[-a1, 1.0], [-a2, 0.0]])
+        b = numpy.array([b1 - a1 * b0, b2 - a2 * b0])
+
+        powers = numpy.empty((length + 1, 2, 2))            # A^m
+        powers[0] = numpy.eye(2)
+        for m in range(1, length + 1):
+            powers[m] = a.dot(powers[m - 1])
+        inputs = powers[:length].dot(b)                     # A^m B: contribution of an input m samples ago to the state
+        impulse = numpy.concatenate(([b0], inputs[:length - 1, 0]))      # h[0] = D, h[m] = C A^(m-1) B
+        lags = numpy.arange(length)[:, None] - numpy.arange(length)[None, :]
+        toeplitz = numpy.where(lags >= 0, impulse[numpy.maximum(lags, 0)], 0.0)
+        steady_state = numpy.linalg.solve(numpy.eye(2) - a, b)           # state for a constant input of 1
+        return powers, inputs, toeplitz, steady_state
+
+    def reset(self):
+        """
+        Forget the state. The next block initializes it again from its first frame.
+        """
+        self.states = None
+
+    def process(self, index, timestamps, values, reference):
+        """
+        Filter a block of frames.
+
+        :param index: Sequence number of the first frame
+        :type index: int
+        :param timestamps: Timestamps of the frames
+        :type timestamps: numpy.ndarray
+        :param values: Values (frames x channels)
+        :type values: numpy.ndarray
+        :param reference: Reference values of the frames
+        :type reference: numpy.ndarray
+        :return: Sequence number of the first frame, timestamps, filtered values and reference values
+        :rtype: tuple
+        """
+        if len(values) == 0:
+            return index, timestamps, values, reference
+        if self.states is None:
+            self.states = [None] * len(self.sections)
+
+        signal = values
+        for i, (powers, inputs, toeplitz, steady_state) in enumerate(self.__matrices):
+            if self.states[i] is None:
+                self.states[i] = numpy.outer(steady_state, signal[0])
+            output = numpy.empty_like(signal)
+            state = self.states[i]
+            for start in range(0, len(signal), self.chunk_length):
+                x = signal[start:start + self.chunk_length]
+                n = len(x)
+                output[start:start + n] = powers[:n, 0, :].dot(state) + toeplitz[:n, :n].dot(x)
+                state = powers[n].dot(state) + inputs[n - 1::-1].T.dot(x)
+            self.states[i] = state
+            signal = output
+        return index, timestamps, signal, reference
+
+
+class FirDecimator(object):
+    """
+    FIR low-pass followed by keeping every factor-th frame, for all channels. Only the kept outputs are computed.
+
+    Frames are kept by their sequence number (those with number % factor == factor - 1), so the decimated stream has
+    the same phase regardless of how it is split into blocks, and frames lost before the filter show up as gaps in
+    the decimated sequence numbers. Kept frames carry the timestamp and reference value of the newest input frame
+    they were computed from.
+    """
+
+    def __init__(self, taps, factor):
+        """
+        :param taps: Filter taps, e.g. from lowpass_taps()
+        :type taps: numpy.ndarray
+        :param factor: Decimation factor
+        :type factor: int
+        """
+        self.taps = numpy.array(taps, dtype=float)
+        self.factor = factor
+        self.history = None                 # the last len(taps) - 1 input frames
+
+    def reset(self):
+        """
+        Forget the input history. The next block fills it with its first frame.
+        """
+        self.history = None
+
+    def process(self, index, timestamps, values, reference):
+        """
+        Filter and decimate a block of frames.
+
+        :param index: Sequence number of the first frame
+        :type index: int
+        :param timestamps: Timestamps of the frames
+        :type timestamps: numpy.ndarray
+        :param values: Values (frames x channels)
+        :type values: numpy.ndarray
+        :param reference: Reference values of the frames
+        :type reference: numpy.ndarray
+        :return: Sequence number of the first kept frame (in the decimated stream), timestamps, filtered values and
+        reference values of the kept frames
+        :rtype: tuple
+        """
+        count = len(values)
+        first = (-index - 1) % self.factor                  # first kept frame of this block
+        if count == 0:
+            return (index + first) // self.factor, timestamps, values, reference
+
+        delay = len(self.taps) - 1
+        if self.history is None:
+            self.history = numpy.repeat(values[:1], delay, axis=0)
+        signal = numpy.concatenate((self.history, values))
+        kept = numpy.arange(first, count, self.factor)
+
+        output = numpy.zeros((len(kept), values.shape[1]))
+        for k, tap in enumerate(self.taps):
+            output += tap * signal[kept + delay - k]
+
+        if delay > 0:
+            self.history = signal[-delay:].copy()
+        return (index + first) // self.factor, timestamps[kept], output, reference[kept]
+
+
+class FilterChain(object):
+    """
+    Stages applied one after another to every block.
+    """
+
+    def __init__(self, stages):
+        """
+        :param stages: Filter stages, e.g. a BiquadCascade followed by a FirDecimator
+        :type stages: list
+        """
+        self.stages = list(stages)
+
+    def reset(self):
+        for stage in self.stages:
+            stage.reset()
+
+    def process(self, index, timestamps, values, reference):
+        for stage in self.stages:
+            (index, timestamps, values, reference) = stage.process(index, timestamps, values, reference)
+        return index, timestamps, values, reference
+
+
+class FilteredReader(object):
+    """
+    Wraps a RingBufferReader and passes everything read through a filter chain. Like the wrapped reader, 'position'
+    is the sequence number of the next frame, counted in the filtered stream.
+    """
+
+    def __init__(self, reader, chain):
+        self.reader = reader
+        self.chain = chain
+        self.position = 0
+
+    @property
+    def overflows(self):
+        return self.reader.overflows
+
+    def read(self, max_frames=None):
+        """
+        Read all new frames from the wrapped reader and filter them.
+
+        :param max_frames: Upper limit for the number of unfiltered frames read (default: no limit)
+        :type max_frames: int
+        :return: Timestamps, values (frames x channels) and reference values of the filtered frames
+        :rtype: tuple
+        """
+        (timestamps, values, reference) = self.reader.read(max_frames)
+        index = self.reader.position - len(timestamps)
+        (index, timestamps, values, reference) = self.chain.process(index, timestamps, values, reference)
+        if len(timestamps) > 0:
+            self.position = index + len(timestamps)
+        return timestamps, values, reference
@@ -0,0 +1,302 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Runtime metrics of the pipeline.
+
+Every stage counts what it does in counters and histograms of a MetricsRegistry (by default the module-wide
+REGISTRY). Updating a metric is a single addition (plus a bisect for histograms) without locks: every metric has
+exactly one writing thread, readers only ever see a slightly stale value. Values that a stage already keeps, like
+the counters of a DeadlineScheduler or the depth of a cache, are read through callbacks when the metrics are
+collected and cost nothing while running.
+
+The registry is rendered in the Prometheus text format by serve() (GET /metrics on a local port) and condensed into
+one line by summary(), which start_reporter() prints periodically. Metrics are per process: in process-mode the
+writer and display processes keep their own registries.
+"""
+
+import bisect
+import http.server
+import threading
+import time
+
+# upper bin edges (in seconds) of duration histograms, the last bin collects everything longer
+DURATION_EDGES = (0.00005, 0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+
+
+class Counter(object):
+    """
+    Monotonically increasing count, e.g. of ticks or bytes.
+    """
+
+    kind = 'counter'
+
+    def __init__(self, name, description, short=None, function=None):
+        """
+        :param name: Metric name, e.g. 'filewriter_bytes_total'
+        :type name: str
+        :param description: Help text
+        :type description: str
+        :param short: Label in the summary line (None: not shown there), counters are shown as rate per second
+        :type short: str
+        :param function: Called without arguments to read the value (None: the value is counted with inc())
+        :type function: function
+        """
+        self.name = name
+        self.description = description
+        self.short = short
+        self.function = function
+        self.count = 0
+
+    def inc(self, amount=1):
+        self.count += amount
+
+    @property
+    def value(self):
+        return self.function() if self.function is not None else self.count
+
+    def samples(self):
+        return [(self.name, '', self.value)]
+
+
+class Gauge(Counter):
+    """
+    Value that goes up and down, e.g. the number of frames waiting in a cache.
+    """
+
+    kind = 'gauge'
+
+    def set(self, value):
+        self.count = value
+
+
+class Histogram(object):
+    """
+    Distribution of observed values (e.g. durations in seconds) over fixed bins.
+    """
+
+    kind = 'histogram'
+
+    def __init__(self, name, description, edges=DURATION_EDGES, short=None, source=None):
+        """
+        :param name: Metric name, e.g. 'display_frame_seconds'
+        :type name: str
+        :param description: Help text
+        :type description: str
+        :param edges: Upper edges of the bins, ascending (a last bin collects everything above)
+        :type edges: tuple
+        :param short: Label in the summary line (None: not shown there), histograms are shown with mean and max
+        :type short: str
+        :param source: Called without arguments to read (counts per bin, sum, max) from another object, e.g. the
+        lateness histogram of a DeadlineScheduler (None: values are counted with observe())
+        :type source: function
+        """
+        self.name = name
+        self.description = description
+        self.edges = tuple(edges)
+        self.short = short
+        self.source = source
+        self.counts = [0] * (len(self.edges) + 1)
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.edges, value)] += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def read(self):
+        """
+        :return: Counts per bin, sum and maximum of all observed values
+        :rtype: tuple
+        """
+        if self.source is not None:
+            (counts, total, maximum) = self.source()
+            return list(counts), total, maximum
+        return list(self.counts), self.sum, self.max
+
+    def samples(self):
+        (counts, total, _) = self.read()
+        samples = []
+        cumulative = 0
+        for edge, count in zip(list(self.edges) + ['+Inf'], counts):
+            cumulative += count
+            samples.append((self.name + '_bucket', '{le="' + str(edge) + '"}', cumulative))
+        samples.append((self.name + '_sum', '', total))
+        samples.append((self.name + '_count', '', cumulative))
+        return samples
+
+
+class MetricsRegistry(object):
+    """
+    Named metrics of one process. Creating a metric that already exists returns the existing one (with its function
+    or source replaced), so a stage that is started again keeps counting where it left off.
+    """
+
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+        self.last_summary = None            # (time, counter values) of the previous summary, for rates
+
+    def __get(self, metric_type, name, *args, **kwargs):
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None or type(metric) is not metric_type:
+                metric = self.metrics[name] = metric_type(name, *args, **kwargs)
+            elif metric_type is Histogram:
+                metric.source = kwargs.get('source')
+            else:
+                metric.function = kwargs.get('function')
+            return metric
+
+    def counter(self, name, description, short=None, function=None):
+        return self.__get(Counter, name, description, short=short, function=function)
+
+    def gauge(self, name, description, short=None, function=None):
+        return self.__get(Gauge, name, description, short=short, function=function)
+
+    def histogram(self, name, description, edges=DURATION_EDGES, short=None, source=None):
+        return self.__get(Histogram, name, description, edges=edges, short=short, source=source)
+
+    def __snapshot(self):
+        # stages may register metrics while they are collected
+        with self.lock:
+            metrics = list(self.metrics.values())
+        return sorted(metrics, key=lambda metric: metric.name)
+
+    def render(self):
+        """
+        :return: All metrics in the Prometheus text exposition format
+        :rtype: str
+        """
+        lines = []
+        for metric in self.__snapshot():
+            lines.append("# HELP " + metric.name + " " + metric.description)
+            lines.append("# TYPE " + metric.name + " " + metric.kind)
+            for (name, labels, value) in metric.samples():
+                lines.append(name + labels + " " + repr(float(value)))
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """
+        One line with all metrics that have a short label: counters as rate since the previous summary, gauges as
+        value, histograms as mean and maximum (in ms).
+
+        :return: Summary line
+        :rtype: str
+        """
+        now = time.monotonic()
+        counters = {}
+        parts = []
+        (last_time, last_counters) = self.last_summary or (None, {})
+        for metric in self.__snapshot():
+            if metric.short is None:
+                continue
+            if metric.kind == 'counter':
+                value = counters[metric.name] = metric.value
+                if last_time is not None and now > last_time:
+                    parts.append("%s %.1f/s" % (metric.short, (value - last_counters.get(metric.name, 0))
+                                                / (now - last_time)))
+                else:
+                    parts.append("%s %i" % (metric.short, value))
+            elif metric.kind == 'gauge':
+                parts.append("%s %g" % (metric.short, metric.value))
+            else:
+                (counts, total, maximum) = metric.read()
+                count = sum(counts)
+                parts.append("%s %.2f/%.2f ms" % (metric.short, 1000 * total / count if count > 0 else 0.0,
+                                                  1000 * maximum))
+        self.last_summary = (now, counters)
+        return ", ".join(parts)
+
+
+REGISTRY = MetricsRegistry()
+
+
+def watch_reader(reader, prefix, label, registry=REGISTRY):
+    """
+    Publish the backlog and the overflows of a cache reader as '<prefix>_queue_frames' and
+    '<prefix>_overflows_total'.
+
+    :param reader: Reader of a RingBuffer (not a wrapper, those hide frames they hold back)
+    :type reader: RingBufferReader
+    :param prefix: Name prefix of the metrics, e.g. 'filewriter'
+    :type prefix: str
+    :param label: Prefix of the short labels, e.g. 'file'
+    :type label: str
+    :param registry: Registry to publish the metrics in
+    :type registry: MetricsRegistry
+    :return: Nothing
+    :rtype: None
+    """
+    registry.gauge(prefix + '_queue_frames', "Frames in the cache not yet read by the " + prefix,
+                   short=label + ' queue', function=lambda: reader.available)
+    registry.counter(prefix + '_overflows_total', "Frames overwritten before the " + prefix + " read them",
+                     short=label + ' lost', function=lambda: reader.overflows)
+
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers GET /metrics with the metrics of the server's registry.
+    """
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass                                # scrapes are not worth a line on the console
+
+
+def serve(port, registry=REGISTRY, address='127.0.0.1'):
+    """
+    Serve the metrics over HTTP from a daemon thread.
+
+    :param port: Local port (0: pick a free port, see server.server_port)
+    :type port: int
+    :param registry: Metrics to serve
+    :type registry: MetricsRegistry
+    :param address: Local address to listen on (default: loopback only)
+    :type address: str
+    :return: The running server
+    :rtype: http.server.HTTPServer
+    """
+    server = http.server.HTTPServer((address, port), MetricsHandler)
+    server.registry = registry
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    return server
+
+
+def start_reporter(interval, registry=REGISTRY, output=print):
+    """
+    Print the summary line of the registry every interval seconds from a daemon thread.
+
+    :param interval: Time between summary lines (in seconds)
+    :type interval: float
+    :param registry: Metrics to summarize
+    :type registry: MetricsRegistry
+    :param output: Called with every summary line
+    :type output: function
+    :return: The started thread
+    :rtype: threading.Thread
+    """
+    def report():
+        registry.summary()                  # start counting the rates from now on
+        while True:
+            time.sleep(interval)
+            output(registry.summary())
+
+    thread = threading.Thread(target=report, name='metrics-reporter', daemon=True)
+    thread.start()
+    return thread
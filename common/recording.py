@@ -0,0 +1,252 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Binary recording format.
+
+A recording consists of a fixed header followed by frames of little-endian float64 values. Every frame holds the
+timestamp (excel-format), one value per channel and the reference value, i.e. the same columns as the csv output.
+Frames are appended in blocks, so the data section is one contiguous frames x columns matrix that can be
+memory-mapped with NumPy without parsing.
+
+Header layout (all integers little-endian uint32):
+
+    offset  0   magic b'PHBRREC\\0'
+    offset  8   format version
+    offset 12   header size in bytes (multiple of 8, start of the data section)
+    offset 16   number of columns
+    offset 20   reserved (0)
+    offset 24   UTF-8 JSON object with the key 'columns' (list of column names), padded with spaces
+"""
+
+import json
+import os
+import struct
+import numpy
+from common.timebase import COLUMN_NAMES
+
+MAGIC = b'PHBRREC\0'
+VERSION = 1
+DTYPE = numpy.dtype('<f8')
+
+__fixed_header = struct.Struct('<8sIIII')
+
+
+def column_names(connected_boards, timebase=None):
+    """
+    Compute the column names of a recording, identical to the column headers of the csv output.
+
+    :param connected_boards: Dict of connected boards
+    :type connected_boards: dict
+    :param timebase: Conversion of the timestamps in the time column (None: excel serial dates)
+    :type timebase: TimeBase
+    :return: Column names: time, one per channel of every board, reference
+    :rtype: list
+    """
+    names = [timebase.column_name if timebase is not None else COLUMN_NAMES['excel']]
+    for serial_nr, board in connected_boards.items():
+        for i in range(0, 4):
+            names.append(board.name + board.name_separator + str(board.channel_names[i]) + " (mV/V)")
+    names.append("Reference data")
+    return names
+
+
+def encode_header(columns, **metadata):
+    """
+    Build the header of a recording.
+
+    :param columns: Column names
+    :type columns: list
+    :param metadata: Additional entries stored in the JSON part of the header
+    :return: Header, padded to a multiple of 8 bytes
+    :rtype: bytes
+    """
+    metadata['columns'] = list(columns)
+    text = json.dumps(metadata).encode('utf-8')
+    size = __fixed_header.size + len(text)
+    size += -size % 8
+    text = text.ljust(size - __fixed_header.size, b' ')
+    return __fixed_header.pack(MAGIC, VERSION, size, len(columns), 0) + text
+
+
+def decode_header(data):
+    """
+    Parse the header at the start of a recording.
+
+    :param data: At least the first bytes of a recording, including the full header
+    :type data: bytes
+    :return: Header size in bytes and header metadata (including 'columns')
+    :rtype: tuple
+    """
+    (magic, version, size, column_count, _) = __fixed_header.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a recording: bad magic number")
+    if version != VERSION:
+        raise ValueError("Unsupported recording version " + str(version))
+
+    metadata = json.loads(data[__fixed_header.size:size].decode('utf-8'))
+    if len(metadata['columns']) != column_count:
+        raise ValueError("Corrupt recording: column count does not match column names")
+    return size, metadata
+
+
+class RecordingWriter(object):
+    """
+    Appends blocks of frames to a binary recording. The file stays open until close() is called.
+    """
+
+    def __init__(self, filename, columns, **metadata):
+        """
+        Create the recording and write its header.
+
+        :param filename: Path of the recording to be created
+        :type filename: str
+        :param columns: Column names (time, channels, reference)
+        :type columns: list
+        :param metadata: Additional entries stored in the header
+        """
+        self.file = open(filename, 'wb')
+        self.file.write(encode_header(columns, **metadata))
+        self.file.flush()
+
+    def append(self, timestamps, values, reference):
+        """
+        Append a block of frames.
+
+        :param timestamps: One timestamp per frame
+        :type timestamps: numpy.ndarray
+        :param values: Values of all channels (frames x channels)
+        :type values: numpy.ndarray
+        :param reference: One reference value per frame
+        :type reference: numpy.ndarray
+        :return: Number of bytes written
+        :rtype: int
+        """
+        return self.file.write(frame_block(timestamps, values, reference).tobytes())
+
+    def flush(self, sync=False):
+        """
+        Flush written frames to the operating system and optionally force them onto the disk.
+
+        :param sync: Also fsync the file
+        :type sync: bool
+        """
+        self.file.flush()
+        if sync:
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+
+def open_recording(filename, mode='r'):
+    """
+    Memory-map a recording. Frames that were only partially written (e.g. after a crash) are ignored.
+
+    :param filename: Path of the recording
+    :type filename: str
+    :param mode: 'r' (read-only) or 'r+' (changes are written to the file)
+    :type mode: str
+    :return: Column names and the frames x columns data matrix
+    :rtype: tuple
+    """
+    with open(filename, 'rb') as f:
+        head = f.read(__fixed_header.size)
+        (_, _, size, _, _) = __fixed_header.unpack(head)
+        f.seek(0)
+        (size, metadata) = decode_header(f.read(size))
+        f.seek(0, 2)
+        frames = (f.tell() - size) // (len(metadata['columns']) * DTYPE.itemsize)
+
+    columns = metadata['columns']
+    if frames == 0:
+        return columns, numpy.zeros((0, len(columns)), dtype=DTYPE)
+    return columns, numpy.memmap(filename, dtype=DTYPE, mode=mode, offset=size, shape=(frames, len(columns)))
+
+
+def sort_recording(filename, earliest=None):
+    """
+    Sort the frames of a recording by time, in place (e.g. after frames were appended out of order). Only the frames
+    from the first one later than 'earliest' on are read into memory and written back.
+
+    :param filename: Path of the recording
+    :type filename: str
+    :param earliest: Earliest timestamp of the frames out of order (None: sort all frames)
+    :type earliest: float
+    :return: Nothing
+    :rtype: None
+    """
+    (_, data) = open_recording(filename, 'r+')
+    if len(data) == 0:
+        return
+    later = data[:, 0] > earliest if earliest is not None else numpy.ones(len(data), dtype=bool)
+    if not later.any():
+        return
+    start = int(numpy.argmax(later))
+    tail = numpy.array(data[start:])
+    data[start:] = tail[numpy.argsort(tail[:, 0], kind='stable')]
+    data.flush()
+
+
+def frame_block(timestamps, values, reference):
+    """
+    Combine timestamps, channel values and reference values into one frames x columns matrix.
+
+    :param timestamps: One timestamp per frame
+    :type timestamps: numpy.ndarray
+    :param values: Values of all channels (frames x channels)
+    :type values: numpy.ndarray
+    :param reference: One reference value per frame
+    :type reference: numpy.ndarray
+    :return: Frames x (channels + 2) matrix
+    :rtype: numpy.ndarray
+    """
+    block = numpy.empty((len(timestamps), values.shape[1] + 2), dtype=DTYPE)
+    block[:, 0] = timestamps
+    block[:, 1:-1] = values
+    block[:, -1] = reference
+    return block
+
+
+def format_csv_rows(data, labels=None):
+    """
+    Format frames the way the csv output does: comma and space separated, one frame per line. The whole block is
+    formatted by a single %-operation with one shortest round-trip (repr) conversion per value.
+
+    :param data: Frames x columns matrix
+    :type data: numpy.ndarray
+    :param labels: Text written as first column of every frame, e.g. ISO timestamps (None: no such column)
+    :type labels: list
+    :return: Text of all rows, each terminated by a newline
+    :rtype: str
+    """
+    (frames, columns) = data.shape
+    row_format = ", ".join(["%r"] * columns) + "\n"
+    if labels is None:
+        return (row_format * frames) % tuple(data.ravel().tolist())
+    row_format = "%s, " + row_format
+    return (row_format * frames) % tuple(x for (label, row) in zip(labels, data.tolist()) for x in [label] + row)
+
+
+def convert_to_csv(recording, csv_filename, block_frames=65536):
+    """
+    Convert a binary recording into the csv layout written by the file writer.
+
+    :param recording: Path of the binary recording
+    :type recording: str
+    :param csv_filename: Path of the csv file to be created
+    :type csv_filename: str
+    :param block_frames: Number of frames converted at once
+    :type block_frames: int
+    :return: Number of frames converted
+    :rtype: int
+    """
+    (columns, data) = open_recording(recording)
+    with open(csv_filename, 'w') as f:
+        f.write(", ".join(columns) + "\n")
+        for start in range(0, len(data), block_frames):
+            f.write(format_csv_rows(data[start:start + block_frames]))
+    return len(data)
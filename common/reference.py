@@ -0,0 +1,82 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+import bisect
+import numpy
+
+
+class ReferenceTrajectory(object):
+    """
+    Desired force over time, as read from desired_force.txt (a list of [force, time] pairs).
+
+    The pairs are sorted by time once, so the reference for any point in time is found by binary search, independent
+    of the sampling rate and of the order and density of the pairs. Without interpolation the reference is the force
+    of the latest pair whose time has passed (a step function); with interpolation it is linear between the pairs.
+    Before the first pair the reference is initial_value, after the last pair it stays at the last force.
+    """
+
+    def __init__(self, desired_force_vector, interpolate=False, initial_value=0.0):
+        """
+        :param desired_force_vector: Pairs of [force, time (in seconds since start of sampling)]
+        :type desired_force_vector: list
+        :param interpolate: Interpolate linearly between the pairs instead of holding the force of the last one
+        :type interpolate: bool
+        :param initial_value: Reference before the first pair
+        :type initial_value: float
+        """
+        array = numpy.array(desired_force_vector, dtype=float).reshape(-1, 2)
+        order = numpy.argsort(array[:, 1], kind='mergesort')        # stable, keeps the file order of equal times
+        self.forces = array[order, 0]
+        self.times = array[order, 1]
+        self.interpolate = interpolate
+        self.initial_value = initial_value
+        self.__times = self.times.tolist()                          # for fast scalar lookups with bisect
+        self.__forces = self.forces.tolist()
+
+    @property
+    def duration(self):
+        """
+        Time of the last pair (in seconds), after which the reference no longer changes.
+        """
+        return self.__times[-1] if len(self.__times) > 0 else 0.0
+
+    def value(self, time_elapsed):
+        """
+        :param time_elapsed: Seconds since the start of sampling
+        :type time_elapsed: float
+        :return: Reference at that time
+        :rtype: float
+        """
+        times = self.__times
+        if self.interpolate:
+            i = bisect.bisect_right(times, time_elapsed)
+            if i == 0:
+                return self.initial_value
+            if i == len(times):
+                return self.__forces[-1]
+            fraction = (time_elapsed - times[i - 1]) / (times[i] - times[i - 1])
+            return self.__forces[i - 1] + fraction * (self.__forces[i] - self.__forces[i - 1])
+
+        i = bisect.bisect_left(times, time_elapsed)               # pairs with a time before time_elapsed
+        return self.__forces[i - 1] if i > 0 else self.initial_value
+
+    def values(self, times_elapsed):
+        """
+        Evaluate the reference for a whole block of times at once.
+
+        :param times_elapsed: Seconds since the start of sampling
+        :type times_elapsed: numpy.ndarray
+        :return: Reference at each of the times
+        :rtype: numpy.ndarray
+        """
+        times_elapsed = numpy.asarray(times_elapsed, dtype=float)
+        if len(self.times) == 0:
+            return numpy.full(times_elapsed.shape, self.initial_value)
+        if self.interpolate:
+            return numpy.interp(times_elapsed, self.times, self.forces, left=self.initial_value)
+
+        indices = numpy.searchsorted(self.times, times_elapsed, side='left')
+        return numpy.where(indices > 0, self.forces[numpy.maximum(indices - 1, 0)], self.initial_value)
@@ -0,0 +1,233 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Replay of recordings through the live pipeline.
+
+Recordings written by the file writer (csv with excel, epoch or ISO timestamps, or the binary format of
+common/recording.py) are read in blocks and pushed into the same caches the sampler fills: the result cache read by
+the writers, the display caches, the reference cache and, in process-mode, the preview bus. Frames are pushed at
+their recorded pace, accelerated by a factor, or as fast as possible, and stamped with the monotonic clock when
+they enter the pipeline, just like sampled frames.
+"""
+
+import itertools
+import os
+import time
+import types
+import numpy
+from common import recording
+
+SECONDS_PER_DAY = 86400.0
+EPOCH_LIMIT = 10**7                     # time values above this are Unix epoch seconds, below it excel serial dates
+SLEEP_MIN = 10**6                       # frames due within this many ns are pushed without sleeping first
+
+
+def read_blocks(filename, block_frames=4096):
+    """
+    Read a recording in blocks, without loading all of it.
+
+    :param filename: Path of a csv or binary (*.rec) recording
+    :type filename: str
+    :param block_frames: Number of frames per block
+    :type block_frames: int
+    :return: Column names, and a generator of blocks (seconds, values (frames x channels), reference). Seconds are
+    relative to an arbitrary, fixed origin.
+    :rtype: tuple
+    """
+    with open(filename, 'rb') as f:
+        binary = f.read(len(recording.MAGIC)) == recording.MAGIC
+    if binary:
+        (columns, data) = recording.open_recording(filename)
+        return columns, __binary_blocks(data, block_frames)
+
+    with open(filename, 'r') as f:
+        columns = [column.strip() for column in f.readline().split(',')]
+    return columns, __csv_blocks(filename, len(columns), block_frames)
+
+
+def __binary_blocks(data, block_frames):
+    for start in range(0, len(data), block_frames):
+        block = numpy.asarray(data[start:start + block_frames])
+        yield block[:, 0] * SECONDS_PER_DAY, block[:, 1:-1], block[:, -1]
+
+
+def __csv_blocks(filename, column_count, block_frames):
+    with open(filename, 'r') as f:
+        f.readline()
+        while True:
+            lines = list(itertools.islice(f, block_frames))
+            if len(lines) == 0:
+                return
+            labels = [line.split(',', 1)[0].strip() for line in lines]
+            data = numpy.loadtxt(lines, delimiter=',', ndmin=2, usecols=range(1, column_count))
+            if labels[0][:1].isdigit() and '-' not in labels[0][1:]:
+                seconds = numpy.array(labels, dtype=float)
+                if seconds[0] < EPOCH_LIMIT:
+                    seconds *= SECONDS_PER_DAY
+            else:
+                # ISO 8601, written in UTC with a 'Z' suffix
+                dates = numpy.array([label.rstrip('Z') for label in labels], dtype='datetime64[ns]')
+                seconds = dates.astype(numpy.int64) / 1e9
+            yield seconds, data[:, :-1], data[:, -1]
+
+
+def replay_boards(columns):
+    """
+    Stand-ins for the boards of a recording, as far as the display and the writers need them.
+
+    :param columns: Column names of the recording (time, four channels per board, reference)
+    :type columns: list
+    :return: Boards by number, with name, name_separator, channel_names and virtual set
+    :rtype: dict
+    """
+    boards = {}
+    channels = [column.replace(" (mV/V)", "") for column in columns[1:-1]]
+    for number in range(len(channels) // 4):
+        names = channels[4 * number:4 * number + 4]
+        parts = [name.rpartition(':') for name in names]
+        board_name = parts[0][0] if parts[0][1] != '' else "Board " + str(number + 1)
+        boards[number] = types.SimpleNamespace(name=board_name, name_separator=':', virtual=True,
+                                               channel_names=[part[2] for part in parts])
+    return boards
+
+
+class Replay(object):
+    """
+    Pushes the frames of a recording into the caches of the live pipeline.
+
+    The reference cache of the display leads the measurements by lead_frames, as it does while sampling; the
+    reference written with every frame is the recorded one. Like the sampler, the replay never waits for the writers:
+    if it runs faster than they can drain the result cache, their readers count overflows.
+    """
+
+    def __init__(self, filename, speed=1.0, block_frames=4096, lead_frames=0, max_gap=None):
+        """
+        :param filename: Path of a csv or binary recording
+        :type filename: str
+        :param speed: Replay speed relative to the recorded pace (0 or None: as fast as possible)
+        :type speed: float
+        :param block_frames: Number of frames read from the recording at once
+        :type block_frames: int
+        :param lead_frames: Frames by which the reference cache leads the measurements
+        :type lead_frames: int
+        :param max_gap: Longest pause between recorded frames that is replayed (in seconds, None: all), e.g. to skip
+        the gaps between the windows of a triggered recording
+        :type max_gap: float
+        """
+        if not os.path.isfile(filename):
+            raise ValueError("Recording '" + filename + "' does not exist")
+        self.filename = filename
+        self.speed = speed
+        self.block_frames = block_frames
+        self.lead_frames = lead_frames
+        self.max_gap = max_gap
+        (self.columns, _) = read_blocks(filename, block_frames)
+
+        self.frames = 0                     # frames pushed so far
+        self.lag_max = 0.0                  # longest time a frame was pushed after it was due (in seconds)
+        self.finished = False
+
+    @property
+    def channels(self):
+        return len(self.columns) - 2
+
+    def run(self, result_cache=None, display_cache=(), reference_cache=None, preview_cache=None, loops=1):
+        """
+        Replay the recording, to be executed by a thread of its own. Returns when the recording has been replayed.
+
+        :param result_cache: Cache read by the writers
+        :type result_cache: RingBuffer
+        :param display_cache: Display caches, one per board of four channels
+        :type display_cache: list
+        :param reference_cache: Reference cache of the display
+        :type reference_cache: MinMaxPyramid
+        :param preview_cache: Bus carrying the current reference to the display process
+        :type preview_cache: RingBuffer
+        :param loops: Number of times the recording is replayed (None: forever)
+        :type loops: int
+        :return: Number of frames pushed
+        :rtype: int
+        """
+        preview = numpy.zeros(1)
+        start = time.monotonic_ns()
+        offset = 0.0                        # replayed seconds before the current pass of the recording
+
+        for _ in (range(loops) if loops is not None else itertools.count()):
+            seconds = None
+            for (seconds, values, reference, ahead) in self.__blocks():
+                for i in range(len(seconds)):
+                    timestamp = self.__wait(start, offset + seconds[i])
+                    for board_index, board_cache in enumerate(display_cache):
+                        board_cache.append(values[i, 4 * board_index:4 * board_index + 4])
+                    if reference_cache is not None:
+                        reference_cache.append(ahead[i])
+                    if result_cache is not None:
+                        result_cache.write(timestamp, values[i], reference[i])
+                    if preview_cache is not None:
+                        preview[0] = ahead[i]
+                        preview_cache.write(timestamp, preview, reference[i])
+                    self.frames += 1
+            if seconds is None:
+                break
+            # the next pass starts one frame interval after the last frame of this one
+            offset += seconds[-1] + (seconds[-1] - seconds[0]) / max(1, len(seconds) - 1)
+
+        self.finished = True
+        return self.frames
+
+    def __blocks(self):
+        """
+        Read the recording block by block and pace it.
+
+        :return: Generator of blocks (seconds since the start of the pass, as replayed, values, reference, and the
+        reference lead_frames ahead)
+        :rtype: generator
+        """
+        (_, blocks) = read_blocks(self.filename, self.block_frames)
+        lead = self.lead_frames
+        origin = previous = None
+        removed = 0.0                       # seconds of pauses dropped so far
+        pending = None
+
+        for block in itertools.chain(blocks, [None]):
+            if block is not None:
+                (seconds, values, reference) = block
+                if origin is None:
+                    origin = previous = seconds[0]
+                # drop the part of every pause exceeding max_gap, then apply the speed
+                if self.max_gap is not None:
+                    steps = numpy.diff(numpy.concatenate(([previous], seconds)))
+                    dropped = removed + numpy.cumsum(numpy.maximum(steps - self.max_gap, 0.0))
+                    previous = seconds[-1]
+                    removed = dropped[-1]
+                    seconds = seconds - dropped
+                seconds = (seconds - origin) / self.speed if self.speed else seconds - origin
+                block = (seconds, values, reference)
+                pending = block if pending is None else tuple(
+                    numpy.concatenate((kept, new)) for (kept, new) in zip(pending, block))
+            if pending is None:
+                return
+
+            # frames are passed on once the reference lead frames ahead is known; at the end it holds its last value
+            (seconds, values, reference) = pending
+            count = max(0, len(seconds) - lead) if block is not None else len(seconds)
+            ahead = numpy.concatenate((reference[lead:], numpy.repeat(reference[-1:], lead)))
+            if count > 0:
+                yield seconds[:count], values[:count], reference[:count], ahead[:count]
+            pending = (seconds[count:], values[count:], reference[count:])
+
+    def __wait(self, start, seconds):
+        # sleep until the frame is due (unless replaying as fast as possible) and return its timestamp
+        now = time.monotonic_ns()
+        if not self.speed:
+            return now
+        due = start + int(seconds * 10**9)
+        if due - now > SLEEP_MIN:
+            time.sleep((due - now) / 10**9)
+        elif due < now:
+            self.lag_max = max(self.lag_max, (now - due) / 10**9)
+        return due
@@ -0,0 +1,187 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+import numpy
+
+
+class RingBuffer(object):
+    """
+    Fixed-capacity, array-backed store for sampled frames. Every frame consists of a timestamp (time.monotonic_ns(),
+    see common/timebase.py), one value per channel and a reference value. All storage is allocated up front; writing a
+    frame only copies into the preallocated arrays.
+
+    There is exactly one producer (the sampler), which calls write(). Any number of consumers read through their own
+    RingBufferReader, so every consumer sees every frame. The producer never waits for consumers: if a consumer falls
+    behind by more than the capacity, the oldest frames are overwritten and counted as overflows of that reader.
+    """
+
+    def __init__(self, capacity, channels):
+        """
+        :param capacity: Number of frames that can be held
+        :type capacity: int
+        :param channels: Number of values per frame
+        :type channels: int
+        """
+        self.capacity = capacity
+        self.channels = channels
+        self.timestamps = numpy.zeros(capacity, dtype=numpy.int64)
+        self.values = numpy.zeros((capacity, channels))
+        self.reference = numpy.zeros(capacity)
+        self.written = 0                    # total number of frames ever written, also the next write position
+
+    def write(self, timestamp, values, reference):
+        """
+        Append one frame, overwriting the oldest one if the buffer is full.
+
+        :param timestamp: Timestamp of the frame (monotonic clock, in ns)
+        :type timestamp: int
+        :param values: One value per channel
+        :type values: numpy.ndarray or list
+        :param reference: Reference value of the frame
+        :type reference: float
+        :return: Nothing
+        :rtype: None
+        """
+        index = self.written % self.capacity
+        self.timestamps[index] = timestamp
+        self.values[index] = values
+        self.reference[index] = reference
+        self.written += 1                   # publish only after the frame is complete
+
+    def reader(self):
+        """
+        Create a new consumer cursor. It starts at the oldest frame that is safe to read, so a consumer that is created
+        after the producer started does not miss anything that has not been overwritten yet.
+
+        :return: New reader
+        :rtype: RingBufferReader
+        """
+        return RingBufferReader(self)
+
+    def __len__(self):
+        return min(self.written, self.capacity)
+
+
+class RingBufferReader(object):
+    """
+    Read cursor of a single consumer of a RingBuffer.
+    """
+
+    def __init__(self, ring_buffer):
+        self.ring_buffer = ring_buffer
+        self.position = max(0, ring_buffer.written - ring_buffer.capacity + 1)
+        self.overflows = 0                  # frames that were overwritten before this reader got to them
+
+    @property
+    def available(self):
+        """
+        Number of frames written but not yet read by this reader (including any that were already overwritten).
+        """
+        return self.ring_buffer.written - self.position
+
+    def read(self, max_frames=None):
+        """
+        Copy all frames that have not been read yet out of the buffer and advance the cursor.
+
+        :param max_frames: Upper limit for the number of frames returned (default: no limit)
+        :type max_frames: int
+        :return: Timestamps, values (frames x channels) and reference values. All arrays are copies.
+        :rtype: tuple
+        """
+        buffer = self.ring_buffer
+        end = buffer.written
+        self.__skip_overwritten(end)
+        if max_frames is not None:
+            end = min(end, self.position + max_frames)
+
+        start = self.position
+        first = start % buffer.capacity
+        count = end - start
+        if first + count <= buffer.capacity:
+            timestamps = buffer.timestamps[first:first + count].copy()
+            values = buffer.values[first:first + count].copy()
+            reference = buffer.reference[first:first + count].copy()
+        else:
+            rows = numpy.arange(start, end) % buffer.capacity
+            timestamps = buffer.timestamps[rows]
+            values = buffer.values[rows]
+            reference = buffer.reference[rows]
+
+        # The producer may have lapped this reader while copying, and may be writing over the oldest frame right now.
+        # Drop the frames that might have been overwritten.
+        self.position = end
+        lapped = buffer.written - buffer.capacity + 1 - start
+        if lapped > 0:
+            lapped = min(lapped, count)
+            self.overflows += lapped
+            timestamps, values, reference = timestamps[lapped:], values[lapped:], reference[lapped:]
+
+        return timestamps, values, reference
+
+    def __skip_overwritten(self, end):
+        oldest = end - self.ring_buffer.capacity + 1      # the frame before it may be overwritten right now
+        if self.position < oldest:
+            self.overflows += oldest - self.position
+            self.position = oldest
+
+
+class HistoryBuffer(object):
+    """
+    Keeps the most recent values of a stream for display. Every value is stored twice, in a buffer of twice the
+    length, so the history in chronological order is always one contiguous slice: view() costs no copy and the
+    result can be handed directly to a plot.
+
+    Supports the parts of the deque interface used for the display and reference caches (append, maxlen, indexing).
+    """
+
+    def __init__(self, maxlen, width=None, initial_value=0.0):
+        """
+        :param maxlen: Number of values kept
+        :type maxlen: int
+        :param width: If given, every value is a row of this many values (e.g. all channels of a board)
+        :type width: int
+        :param initial_value: Value the history is filled with initially
+        :type initial_value: float
+        """
+        self.maxlen = maxlen
+        self.data = numpy.full((2 * maxlen,) if width is None else (2 * maxlen, width), initial_value)
+        self.start = 0                      # position of the oldest value
+        self.appended = 0                   # total number of values ever appended
+
+    def append(self, value):
+        """
+        Append a value, dropping the oldest one.
+
+        :param value: New value (a row of values if the buffer has a width)
+        :type value: float or numpy.ndarray
+        :return: Nothing
+        :rtype: None
+        """
+        start = self.start
+        self.data[start] = value
+        self.data[start + self.maxlen] = value
+        self.start = start + 1 if start + 1 < self.maxlen else 0
+        self.appended += 1
+
+    def view(self):
+        """
+        :return: Read-only view of the history, oldest value first (maxlen x width if the buffer has a width). It
+        changes as values are appended.
+        :rtype: numpy.ndarray
+        """
+        view = self.data[self.start:self.start + self.maxlen]
+        view.flags.writeable = False
+        return view
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.maxlen
+        if not 0 <= index < self.maxlen:
+            raise IndexError("history index out of range")
+        return self.data[self.start + index]
+
+    def __len__(self):
+        return self.maxlen
@@ -0,0 +1,114 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+import bisect
+import time
+import numpy
+
+
+class DeadlineScheduler(object):
+    """
+    Paces a loop at a fixed interval without drift.
+
+    Tick n is due at start + n * interval on a monotonic clock (time.perf_counter), so neither steps of the wall
+    clock (e.g. by NTP) nor late wake-ups shift later ticks. The scheduler sleeps until shortly before a deadline and
+    busy-waits for the last 'spin' seconds, because sleeping alone routinely wakes up late by a millisecond or more.
+
+    A tick that starts after its successor was already due is an overrun. The deadlines missed entirely are skipped
+    (counted in 'skipped') instead of being run back to back, so the loop keeps its phase.
+
+    The lateness of every tick is counted in a histogram which, like all counters, can be read at any time from
+    another thread.
+    """
+
+    # upper bin edges of the lateness histogram (in seconds), the last bin collects everything later
+    histogram_edges = (0.00005, 0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02)
+
+    def __init__(self, interval, spin=0.0005, clock=time.perf_counter):
+        """
+        :param interval: Time between ticks (in seconds)
+        :type interval: float
+        :param spin: Time before a deadline from which on to busy-wait instead of sleeping (in seconds, 0: never)
+        :type spin: float
+        :param clock: Monotonic clock returning seconds
+        :type clock: function
+        """
+        self.interval = interval
+        self.spin = spin
+        self.clock = clock
+        self.start = None
+        self.tick = 0                       # number of the tick due next
+
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.lateness_max = 0.0
+        self.lateness_sum = 0.0
+        self.histogram = numpy.zeros(len(self.histogram_edges) + 1, dtype=numpy.int64)
+
+    def wait(self):
+        """
+        Wait for the next deadline. The first call starts the schedule and returns immediately.
+
+        :return: Time of the deadline relative to the start of the schedule (in seconds)
+        :rtype: float
+        """
+        clock = self.clock
+        if self.start is None:
+            self.start = clock()
+
+        deadline = self.start + self.tick * self.interval
+        now = clock()
+
+        # sleep until shortly before the deadline, then spin
+        remaining = deadline - now
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while now < deadline:
+            now = clock()
+
+        lateness = now - deadline
+        if lateness >= self.interval:
+            # the next deadline(s) already passed as well: skip them to keep the phase
+            missed = int(lateness // self.interval)
+            self.overruns += 1
+            self.skipped += missed
+            self.tick += missed
+            deadline += missed * self.interval
+            lateness -= missed * self.interval
+
+        self.tick += 1
+        self.ticks += 1
+        self.lateness_sum += lateness
+        if lateness > self.lateness_max:
+            self.lateness_max = lateness
+        self.histogram[bisect.bisect_left(self.histogram_edges, lateness)] += 1
+
+        return deadline - self.start
+
+    def statistics(self):
+        """
+        :return: Counters and the lateness histogram. 'histogram' maps the upper edge of every bin (in seconds, None
+        for the last bin) to the number of ticks in it.
+        :rtype: dict
+        """
+        edges = list(self.histogram_edges) + [None]
+        return {'ticks': self.ticks,
+                'overruns': self.overruns,
+                'skipped': self.skipped,
+                'lateness_mean': self.lateness_sum / self.ticks if self.ticks > 0 else 0.0,
+                'lateness_max': self.lateness_max,
+                'histogram': dict(zip(edges, self.histogram.tolist()))}
+
+    def summary(self):
+        """
+        :return: One line summarizing the statistics
+        :rtype: str
+        """
+        statistics = self.statistics()
+        return "ticks: %i, overruns: %i, skipped: %i, lateness mean/max: %.3f/%.3f ms" \
+               % (statistics['ticks'], statistics['overruns'], statistics['skipped'],
+                  statistics['lateness_mean'] * 1000, statistics['lateness_max'] * 1000)
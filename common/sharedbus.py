@@ -0,0 +1,176 @@
+# Python 3.8
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Sample bus in shared memory, so the sampler, the writer and the display can run in separate processes.
+
+A bus is a RingBuffer whose arrays live in a multiprocessing.shared_memory block instead of the private heap. The
+block starts with a small header holding the layout and the write index, so other processes can attach by name
+alone and read frames through their own RingBufferReader without any copying between processes.
+
+Shared memory layout (int64 header and timestamps, then float64 arrays):
+
+    header      [magic, version, capacity, channels, written, 0, 0, 0]
+    timestamps  capacity (monotonic clock, in ns)
+    values      capacity x channels
+    reference   capacity
+
+Requires Python 3.8 or newer.
+"""
+
+import threading
+import time
+import numpy
+from multiprocessing import shared_memory
+from common.ringbuffer import RingBuffer
+
+MAGIC = 0x5048425242555331          # 'PHBRBUS1'
+VERSION = 2
+HEADER_FIELDS = 8
+
+
+class SharedRingBuffer(RingBuffer):
+    """
+    RingBuffer in shared memory. Create it once in the producing process with create() and attach to it in every
+    consuming process with attach(). Only the producer may write.
+    """
+
+    def __init__(self, memory, owner):
+        self.memory = memory
+        self.owner = owner
+        self.header = numpy.ndarray((HEADER_FIELDS,), dtype=numpy.int64, buffer=memory.buf)
+        if self.header[0] != MAGIC or self.header[1] != VERSION:
+            raise ValueError("Shared memory block '" + memory.name + "' is not a sample bus")
+
+        self.capacity = int(self.header[2])
+        self.channels = int(self.header[3])
+        offset = HEADER_FIELDS * 8
+        self.timestamps = numpy.ndarray((self.capacity,), dtype=numpy.int64, buffer=memory.buf, offset=offset)
+        offset += self.capacity * 8
+        self.values = numpy.ndarray((self.capacity, self.channels), dtype=numpy.float64, buffer=memory.buf,
+                                    offset=offset)
+        offset += self.capacity * self.channels * 8
+        self.reference = numpy.ndarray((self.capacity,), dtype=numpy.float64, buffer=memory.buf, offset=offset)
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    @property
+    def written(self):
+        return int(self.header[4])
+
+    @written.setter
+    def written(self, value):
+        self.header[4] = value
+
+    @staticmethod
+    def create(capacity, channels, name=None):
+        """
+        Allocate a new bus. The creating process owns it and removes it in close().
+
+        :param capacity: Number of frames that can be held
+        :type capacity: int
+        :param channels: Number of values per frame
+        :type channels: int
+        :param name: Name of the shared memory block (default: chosen by the system)
+        :type name: str
+        :return: New bus
+        :rtype: SharedRingBuffer
+        """
+        size = (HEADER_FIELDS + capacity * (channels + 2)) * 8
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = numpy.ndarray((HEADER_FIELDS,), dtype=numpy.int64, buffer=memory.buf)
+        header[:] = [MAGIC, VERSION, capacity, channels, 0, 0, 0, 0]
+        del header
+        return SharedRingBuffer(memory, owner=True)
+
+    @staticmethod
+    def attach(name):
+        """
+        Attach to a bus created by another process. The attaching process must be a child of the creating process:
+        they then share one resource tracker, which leaves removing the block to the owner.
+
+        :param name: Name of the bus
+        :type name: str
+        :return: Bus
+        :rtype: SharedRingBuffer
+        """
+        memory = shared_memory.SharedMemory(name=name)
+        return SharedRingBuffer(memory, owner=False)
+
+    def close(self):
+        """
+        Detach from the bus. The owner also removes it; attached processes keep working until they close.
+        """
+        self.header = self.timestamps = self.values = self.reference = None
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+
+def process_method(target, bus_names, kwargs):
+    """
+    Entry point of a child process: attach to buses by name and call the target with them as keyword arguments, e.g.
+    a writer's thread_method with its result_cache.
+
+    :param target: Function to execute
+    :type target: function
+    :param bus_names: Bus name per keyword argument of the target
+    :type bus_names: dict
+    :param kwargs: All other keyword arguments of the target
+    :type kwargs: dict
+    :return: Nothing
+    :rtype: None
+    """
+    buses = {argument: SharedRingBuffer.attach(name) for argument, name in bus_names.items()}
+    kwargs = dict(kwargs, **buses)
+    try:
+        target(**kwargs)
+    finally:
+        for bus in buses.values():
+            bus.close()
+
+
+def feed_thread_method(bus, caches, interval, columns=None):
+    """
+    Copy all frames arriving on a bus into local caches, e.g. the display caches of a display process. Caches are
+    appended row by row, exactly as the sampler would do it.
+
+    :param bus: Bus to read from
+    :type bus: RingBuffer
+    :param caches: Caches to feed, each fed with a slice of the frame values
+    :type caches: list
+    :param interval: Time between reads of the bus (in seconds)
+    :type interval: float
+    :param columns: Value columns per cache (slice objects). Default: consecutive blocks of 4 channels per cache.
+    :type columns: list
+    :return: Nothing
+    :rtype: None
+    """
+    if columns is None:
+        columns = [slice(4 * i, 4 * i + 4) for i in range(len(caches))]
+    reader = bus.reader()
+    start_time = time.time()
+
+    while True:
+        time.sleep(interval - ((time.time() - start_time) % interval))
+        (_, values, _) = reader.read()
+        for row in values:
+            for cache, column in zip(caches, columns):
+                cache.append(row[column])
+
+
+def start_feed_thread(bus, caches, interval, columns=None):
+    """
+    Run feed_thread_method in a daemon thread.
+
+    :return: The started thread
+    :rtype: threading.Thread
+    """
+    thread = threading.Thread(target=feed_thread_method, args=(bus, caches, interval, columns), daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,94 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+import datetime
+import time
+import numpy
+
+FORMATS = ('excel', 'epoch', 'iso')
+COLUMN_NAMES = {'excel': "time (excel-format)", 'epoch': "time (unix epoch, s)", 'iso': "time (ISO 8601, UTC)"}
+EXCEL_UNIX_EPOCH = 25569                # excel serial date of 1970-01-01 (day 0 is 1899-12-30, not 31st Dec)
+NS_PER_DAY = 86400 * 10**9
+
+
+class TimeBase(object):
+    """
+    Relates the monotonic clock used to timestamp frames to calendar time.
+
+    The sampler stores every timestamp as an integer of time.monotonic_ns(), which is cheap to read and never jumps.
+    The monotonic clock and the wall clock are read together once per run; the writers then convert whole blocks of
+    timestamps with a single NumPy expression. Like the timestamps before, excel serial dates are in local time, with
+    the UTC offset taken at the start of the run.
+    """
+
+    clock = staticmethod(time.monotonic_ns)
+
+    def __init__(self, timestamp_format='excel'):
+        """
+        :param timestamp_format: Format of converted timestamps: 'excel' (serial date, local time), 'epoch' (seconds
+        since 1970-01-01 UTC) or 'iso' (ISO 8601 strings, UTC)
+        :type timestamp_format: str
+        """
+        if timestamp_format not in FORMATS:
+            raise ValueError("Unknown timestamp format '" + timestamp_format + "', expected one of " + str(FORMATS))
+        self.timestamp_format = timestamp_format
+
+        self.monotonic_anchor = time.monotonic_ns()
+        self.epoch_anchor = time.time_ns()          # wall clock (ns since 1970) at monotonic_anchor
+        utc_offset = datetime.datetime.now().astimezone().utcoffset().total_seconds()
+        self.excel_anchor = EXCEL_UNIX_EPOCH + (self.epoch_anchor + round(utc_offset * 10**9)) / NS_PER_DAY
+
+    @property
+    def column_name(self):
+        """
+        Header of the time column holding timestamps converted by convert().
+        """
+        return COLUMN_NAMES[self.timestamp_format]
+
+    def to_excel(self, timestamps):
+        """
+        :param timestamps: Values of the monotonic clock (in ns)
+        :type timestamps: numpy.ndarray
+        :return: Excel serial dates (in days)
+        :rtype: numpy.ndarray
+        """
+        return self.excel_anchor + (numpy.asarray(timestamps, dtype=numpy.int64) - self.monotonic_anchor) / NS_PER_DAY
+
+    def to_epoch(self, timestamps):
+        """
+        :param timestamps: Values of the monotonic clock (in ns)
+        :type timestamps: numpy.ndarray
+        :return: Seconds since 1970-01-01 UTC
+        :rtype: numpy.ndarray
+        """
+        delta = numpy.asarray(timestamps, dtype=numpy.int64) - self.monotonic_anchor
+        return self.epoch_anchor / 10**9 + delta / 10**9
+
+    def to_iso(self, timestamps):
+        """
+        :param timestamps: Values of the monotonic clock (in ns)
+        :type timestamps: numpy.ndarray
+        :return: ISO 8601 date and time (UTC) with microseconds
+        :rtype: numpy.ndarray
+        """
+        delta = numpy.asarray(timestamps, dtype=numpy.int64) - self.monotonic_anchor
+        dates = (delta + self.epoch_anchor).astype('datetime64[ns]')
+        return numpy.datetime_as_string(dates, unit='us', timezone='UTC')
+
+    def convert(self, timestamps):
+        """
+        Convert timestamps into the format chosen for this run.
+
+        :param timestamps: Values of the monotonic clock (in ns)
+        :type timestamps: numpy.ndarray
+        :return: Converted timestamps (floats, or strings for 'iso')
+        :rtype: numpy.ndarray
+        """
+        if self.timestamp_format == 'excel':
+            return self.to_excel(timestamps)
+        if self.timestamp_format == 'epoch':
+            return self.to_epoch(timestamps)
+        return self.to_iso(timestamps)
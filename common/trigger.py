@@ -0,0 +1,208 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Triggered capture: pass on only the frames around trigger events, e.g. to write just the seconds around each load
+event of a long unattended run.
+
+A TriggerCondition fires when a channel (or the sum of all channels) crosses a threshold, either with its level or
+with its rate of change. TriggeredCapture keeps the last pre_frames frames in memory and, when any condition fires,
+passes on these frames, the trigger frame and the following post_frames frames. Windows that overlap are merged, a
+trigger inside an open window extends it. Blocks are evaluated with vector operations, and the state (last values,
+open window, pre-trigger history) is carried across blocks.
+"""
+
+import numpy
+
+DIRECTIONS = ('rising', 'falling', 'either')
+
+
+class TriggerCondition(object):
+    """
+    Threshold crossing of one channel or of the sum of all channels.
+    """
+
+    def __init__(self, channel, threshold, direction='rising', slope=False):
+        """
+        :param channel: Column of the values to watch, or 'sum' for the sum of all columns
+        :type channel: int or str
+        :param threshold: Level to cross (or rate of change per second, if slope is set)
+        :type threshold: float
+        :param direction: Crossing that fires: 'rising', 'falling' or 'either'
+        :type direction: str
+        :param slope: Watch the rate of change of the signal instead of its level
+        :type slope: bool
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError("Unknown trigger direction '" + str(direction) + "', expected one of " + str(DIRECTIONS))
+        self.channel = channel
+        self.threshold = threshold
+        self.direction = direction
+        self.slope = slope
+        self.last_value = None              # last sample of the previous block
+        self.last_timestamp = None
+        self.last_signal = None             # last level (or slope) compared with the threshold
+
+    def reset(self):
+        self.last_value = self.last_timestamp = self.last_signal = None
+
+    def evaluate(self, timestamps, values):
+        """
+        Find the frames of a block at which the condition fires.
+
+        :param timestamps: Timestamps of the frames (monotonic clock, in ns)
+        :type timestamps: numpy.ndarray
+        :param values: Values (frames x channels)
+        :type values: numpy.ndarray
+        :return: Whether the condition fires at each frame
+        :rtype: numpy.ndarray
+        """
+        if len(values) == 0:
+            return numpy.zeros(0, dtype=bool)
+        value = values.sum(axis=1) if self.channel == 'sum' else values[:, self.channel]
+
+        signal = value
+        if self.slope:
+            previous_value = numpy.concatenate(([value[0] if self.last_value is None else self.last_value], value[:-1]))
+            previous_time = numpy.concatenate(([timestamps[0] if self.last_timestamp is None else self.last_timestamp],
+                                               timestamps[:-1]))
+            seconds = (timestamps - previous_time) / 1e9
+            signal = numpy.divide(value - previous_value, seconds, out=numpy.zeros(len(value)), where=seconds > 0)
+        self.last_value = value[-1]
+        self.last_timestamp = timestamps[-1]
+
+        # the first frame ever has no predecessor and cannot fire
+        previous = numpy.concatenate(([signal[0] if self.last_signal is None else self.last_signal], signal[:-1]))
+        self.last_signal = signal[-1]
+        above = signal >= self.threshold
+        was_above = previous >= self.threshold
+        if self.direction == 'rising':
+            return above & ~was_above
+        if self.direction == 'falling':
+            return ~above & was_above
+        return above != was_above
+
+
+class TriggeredCapture(object):
+    """
+    Passes on only the frames within pre_frames before and post_frames after any trigger event.
+    """
+
+    def __init__(self, conditions, pre_frames, post_frames):
+        """
+        :param conditions: Trigger conditions, any of which starts a capture window
+        :type conditions: list
+        :param pre_frames: Frames kept before a trigger event
+        :type pre_frames: int
+        :param post_frames: Frames kept after a trigger event
+        :type post_frames: int
+        """
+        self.conditions = list(conditions)
+        self.pre_frames = pre_frames
+        self.post_frames = post_frames
+        self.history = None                 # (index of first frame, timestamps, values, reference) before this block
+        self.capture_until = 0              # sequence number after the last frame of the open window
+        self.passed_until = 0               # sequence number after the last frame passed on
+
+        self.triggers = 0                   # trigger events
+        self.windows = 0                    # capture windows started (overlapping windows count once)
+        self.frames_seen = 0
+        self.frames_passed = 0
+
+    def reset(self):
+        for condition in self.conditions:
+            condition.reset()
+        self.history = None
+        self.capture_until = self.passed_until = 0
+
+    def process(self, index, timestamps, values, reference):
+        """
+        Filter a block of consecutive frames.
+
+        :param index: Sequence number of the first frame
+        :type index: int
+        :param timestamps: Timestamps of the frames
+        :type timestamps: numpy.ndarray
+        :param values: Values (frames x channels)
+        :type values: numpy.ndarray
+        :param reference: Reference values of the frames
+        :type reference: numpy.ndarray
+        :return: Timestamps, values and reference values of the frames inside capture windows, which may come from
+        earlier blocks (pre-trigger history)
+        :rtype: tuple
+        """
+        count = len(timestamps)
+        self.frames_seen += count
+        fired = numpy.zeros(count, dtype=bool)
+        for condition in self.conditions:
+            fired |= condition.evaluate(timestamps, values)
+
+        # prepend the pre-trigger history, if it directly precedes this block (frames lost in between break it)
+        if self.history is not None and self.history[0] + len(self.history[1]) == index:
+            (first, history_timestamps, history_values, history_reference) = self.history
+            timestamps = numpy.concatenate((history_timestamps, timestamps))
+            values = numpy.concatenate((history_values, values))
+            reference = numpy.concatenate((history_reference, reference))
+        else:
+            first = index
+        total = len(timestamps)
+        events = numpy.flatnonzero(fired) + (index - first)     # trigger frames, as positions in the combined arrays
+
+        # mark all windows at once: +1 where a window starts, -1 after it ends, covered frames have a positive sum
+        coverage = numpy.zeros(total + 1, dtype=numpy.int64)
+        if self.capture_until > first:
+            coverage[0] += 1
+            coverage[min(total, self.capture_until - first)] -= 1
+        numpy.add.at(coverage, numpy.maximum(events - self.pre_frames, 0), 1)
+        numpy.add.at(coverage, numpy.minimum(events + self.post_frames + 1, total), -1)
+        selected = numpy.cumsum(coverage[:-1]) > 0
+        selected[:max(0, min(total, self.passed_until - first))] = False
+
+        # trigger events are rare, so the windows they open are counted one by one
+        for event in events:
+            if first + event - self.pre_frames >= self.capture_until:
+                self.windows += 1
+            self.capture_until = max(self.capture_until, first + int(event) + self.post_frames + 1)
+        self.triggers += len(events)
+
+        passed = numpy.flatnonzero(selected)
+        if len(passed) > 0:
+            self.passed_until = first + int(passed[-1]) + 1
+        self.frames_passed += len(passed)
+
+        # keep the newest frames as history for the next block
+        keep = min(self.pre_frames, total)
+        if keep > 0:
+            self.history = (first + total - keep, timestamps[total - keep:], values[total - keep:],
+                            reference[total - keep:])
+        return timestamps[passed], values[passed], reference[passed]
+
+
+class TriggeredReader(object):
+    """
+    Wraps a RingBufferReader (or FilteredReader) and returns only the frames of capture windows.
+    """
+
+    def __init__(self, reader, capture):
+        self.reader = reader
+        self.capture = capture
+
+    @property
+    def overflows(self):
+        return self.reader.overflows
+
+    def read(self, max_frames=None):
+        """
+        Read all new frames from the wrapped reader and keep those inside capture windows.
+
+        :param max_frames: Upper limit for the number of frames read from the wrapped reader (default: no limit)
+        :type max_frames: int
+        :return: Timestamps, values (frames x channels) and reference values of the captured frames
+        :rtype: tuple
+        """
+        (timestamps, values, reference) = self.reader.read(max_frames)
+        index = self.reader.position - len(timestamps)
+        return self.capture.process(index, timestamps, values, reference)
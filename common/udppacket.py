@@ -0,0 +1,85 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Datagram format for pushing results to a UDP target.
+
+Every datagram carries a block of consecutive frames. All values are little-endian.
+
+    offset  0   2s   magic b'PB'
+    offset  2   B    format version
+    offset  3   B    reserved (0)
+    offset  4   H    number of channels per frame
+    offset  6   H    number of frames in this datagram
+    offset  8   I    sequence number of the first frame (frames are numbered consecutively from 0, wrapping at 2^32)
+    offset 12   I    reserved (0)
+    offset 16   d    send time (seconds since the epoch, sender clock)
+    offset 24   frames x (channels + 2) float64: timestamp (excel-format), channel values, reference
+"""
+
+import collections
+import struct
+import numpy
+
+MAGIC = b'PB'
+VERSION = 1
+DTYPE = numpy.dtype('<f8')
+HEADER = struct.Struct('<2sBBHHIId')
+IP_UDP_OVERHEAD = 28                # bytes of IPv4 and UDP headers per datagram
+
+PacketHeader = collections.namedtuple('PacketHeader', ['version', 'channels', 'frames', 'sequence', 'send_time'])
+
+
+def frames_per_datagram(channels, mtu=1500):
+    """
+    Compute how many frames fit into one datagram without IP fragmentation.
+
+    :param channels: Number of channels per frame
+    :type channels: int
+    :param mtu: Maximum transmission unit of the network path (in bytes)
+    :type mtu: int
+    :return: Number of frames per datagram (at least 1)
+    :rtype: int
+    """
+    frame_size = (channels + 2) * DTYPE.itemsize
+    return max(1, (mtu - IP_UDP_OVERHEAD - HEADER.size) // frame_size)
+
+
+def encode(sequence, send_time, block):
+    """
+    Build one datagram.
+
+    :param sequence: Sequence number of the first frame in the block
+    :type sequence: int
+    :param send_time: Send time (seconds since the epoch)
+    :type send_time: float
+    :param block: Frames x (channels + 2) matrix of timestamp, channel values and reference
+    :type block: numpy.ndarray
+    :return: Datagram
+    :rtype: bytes
+    """
+    (frames, columns) = block.shape
+    header = HEADER.pack(MAGIC, VERSION, 0, columns - 2, frames, sequence & 0xFFFFFFFF, 0, send_time)
+    return header + numpy.ascontiguousarray(block, dtype=DTYPE).tobytes()
+
+
+def decode(datagram):
+    """
+    Parse one datagram. The returned frames are a read-only view into the datagram.
+
+    :param datagram: Received datagram
+    :type datagram: bytes
+    :return: Header and frames x (channels + 2) matrix
+    :rtype: tuple
+    """
+    (magic, version, _, channels, frames, sequence, _, send_time) = HEADER.unpack_from(datagram)
+    if magic != MAGIC:
+        raise ValueError("Not a result datagram: bad magic number")
+    if version != VERSION:
+        raise ValueError("Unsupported datagram version " + str(version))
+
+    data = numpy.frombuffer(datagram, dtype=DTYPE, count=frames * (channels + 2), offset=HEADER.size)
+    return PacketHeader(version, channels, frames, sequence, send_time), data.reshape(frames, channels + 2)
@@ -0,0 +1,261 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+"""
+Receiving side of the datagram format defined in common/udppacket.py.
+"""
+
+import collections
+import socket
+import struct
+import time
+import numpy
+from common import udppacket
+from common.recording import RecordingWriter, sort_recording
+from common.timebase import COLUMN_NAMES
+
+MAX_DATAGRAM_SIZE = 65535
+RECEIVE_BUFFER_SIZE = 4 << 20     # requested kernel receive buffer, absorbs bursts while a datagram is processed
+LATENCY_HISTORY = 100000          # number of datagrams the latency statistics are computed over
+MAX_GAPS = 10000                  # sequence gaps remembered for late datagrams, older ones stay counted as lost
+
+
+class ReceiverStatistics(object):
+    """
+    Loss, reordering and latency statistics of a datagram stream, based on the frame sequence numbers.
+
+    Only the latest MAX_GAPS gaps are remembered. Frames arriving from before the oldest one (or from before the first
+    datagram) cannot be told apart from duplicates; they are counted as untracked, are not reported as new, and frames
+    of forgotten gaps stay counted as lost.
+    """
+
+    def __init__(self):
+        self.datagrams = 0
+        self.frames = 0                 # frames received
+        self.lost = 0                   # frames skipped by a sequence gap and not (yet) received late
+        self.reordered = 0              # datagrams arriving late, filling (part of) a gap counted as lost
+        self.duplicates = 0             # frames received more than once
+        self.malformed = 0              # datagrams that could not be decoded and were skipped
+        self.expected_sequence = None   # sequence number of the frame expected next
+        self.position = 0               # the expected sequence number, without the 32 bit wrap-around
+        self.gaps = []                  # [start, end) of the gaps counted as lost, in the numbering of position
+        self.horizon = 0                # the gaps before this position are not remembered any more
+        self.untracked = 0              # frames arriving late from before the horizon
+        # receive time - send time per datagram (seconds, includes the offset between both clocks)
+        self.latencies = collections.deque(maxlen=LATENCY_HISTORY)
+
+    def update(self, header, receive_time):
+        """
+        Account for one received datagram.
+
+        :param header: Header of the datagram
+        :type header: udppacket.PacketHeader
+        :param receive_time: Time the datagram was received (seconds since the epoch)
+        :type receive_time: float
+        :return: (offset, count) of the runs of frames in the datagram that were not received before, in order
+        :rtype: list
+        """
+        self.datagrams += 1
+        self.frames += header.frames
+        self.latencies.append(receive_time - header.send_time)
+
+        if self.expected_sequence is None:
+            self.expected_sequence = header.sequence
+
+        # difference to the expected sequence number, taking the 32 bit wrap-around into account
+        distance = (header.sequence - self.expected_sequence + 2 ** 31) % 2 ** 32 - 2 ** 31
+        start = self.position + distance
+        end = start + header.frames
+        runs = []
+        if start > self.position:
+            self.lost += start - self.position
+            self.gaps.append([self.position, start])
+            if len(self.gaps) > MAX_GAPS:
+                self.horizon = self.gaps.pop(0)[1]
+        elif start < self.position:
+            # frames before the expected one either fill a gap counted as lost or were received before
+            late = min(end, self.position) - start
+            untracked = max(0, min(end, self.horizon) - start)
+            runs = [(run_start - start, run_end - run_start)
+                    for (run_start, run_end) in self.__recover(start + untracked, min(end, self.position))]
+            recovered = sum(count for (_, count) in runs)
+            if recovered > 0:
+                self.reordered += 1
+                self.lost -= recovered
+            self.untracked += untracked
+            self.duplicates += late - untracked - recovered
+
+        if end > self.position:
+            runs.append((max(start, self.position) - start, end - max(start, self.position)))
+            self.position = end
+            self.expected_sequence = (header.sequence + header.frames) % 2 ** 32
+        return runs
+
+    def __recover(self, start, end):
+        # remove [start, end) from the gaps and return the parts of it that were in them, in order
+        recovered = []
+        gaps = []
+        for (gap_start, gap_end) in self.gaps:
+            if min(gap_end, end) <= max(gap_start, start):
+                gaps.append([gap_start, gap_end])
+                continue
+            recovered.append((max(gap_start, start), min(gap_end, end)))
+            if gap_start < start:
+                gaps.append([gap_start, start])
+            if end < gap_end:
+                gaps.append([end, gap_end])
+        self.gaps = gaps
+        return recovered
+
+    def summary(self):
+        """
+        :return: One line summarizing the statistics
+        :rtype: str
+        """
+        line = "datagrams: %i, frames: %i, lost: %i, reordered: %i, duplicates: %i, untracked: %i, malformed: %i" \
+               % (self.datagrams, self.frames, self.lost, self.reordered, self.duplicates, self.untracked,
+                  self.malformed)
+        if len(self.latencies) > 0:
+            latencies = numpy.array(self.latencies) * 1000
+            line += ", latency (ms) min/median/max: %.3f/%.3f/%.3f" \
+                    % (latencies.min(), numpy.median(latencies), latencies.max())
+        return line
+
+
+class Receiver(object):
+    """
+    Receives result datagrams on a UDP port and decodes them without per-value Python work.
+    """
+
+    def __init__(self, ip, port, timeout=None):
+        """
+        :param ip: Local address to listen on ('' or '0.0.0.0' for all interfaces)
+        :type ip: str
+        :param port: Local port to listen on (0: pick a free port, see self.port)
+        :type port: int
+        :param timeout: Seconds to wait for a datagram before receive() returns None (None: wait forever)
+        :type timeout: float
+        """
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE)
+        self.socket.bind((ip, port))
+        self.socket.settimeout(timeout)
+        self.port = self.socket.getsockname()[1]
+        self.buffer = bytearray(MAX_DATAGRAM_SIZE)
+        self.statistics = ReceiverStatistics()
+
+    def receive(self):
+        """
+        Wait for one datagram and decode it. Datagrams that cannot be decoded (too short, foreign or of another
+        version) are counted as malformed and skipped.
+
+        :return: Header, frames x (channels + 2) matrix (a copy) and the (offset, count) runs of frames not received
+        before (see ReceiverStatistics.update), or None on timeout or for a malformed datagram
+        :rtype: tuple
+        """
+        try:
+            size = self.socket.recv_into(self.buffer)
+        except socket.timeout:
+            return None
+
+        receive_time = time.time()
+        try:
+            (header, frames) = udppacket.decode(memoryview(self.buffer)[:size])
+        except (struct.error, ValueError):
+            self.statistics.malformed += 1
+            return None
+        runs = self.statistics.update(header, receive_time)
+        return header, frames.copy(), runs
+
+    def close(self):
+        self.socket.close()
+
+
+def receive_to_recording(receiver, filename, duration=None, on_datagram=None):
+    """
+    Write all frames received until the duration is over (or forever) to a binary recording. Every frame is written
+    once, duplicates are skipped. Frames arriving late (filling a gap) are appended as they arrive, and the recording
+    is sorted by time when it is closed.
+
+    :param receiver: Receiver to read datagrams from
+    :type receiver: Receiver
+    :param filename: Path of the recording to be created (column names are generic, the sender does not transmit them)
+    :type filename: str
+    :param duration: Seconds to receive for (None: until interrupted)
+    :type duration: float
+    :param on_datagram: Called with (header, frames) for every datagram
+    :type on_datagram: function
+    :return: Nothing
+    :rtype: None
+    """
+    recording = None
+    latest = -numpy.inf                 # latest timestamp written
+    earliest_late = None                # earliest timestamp written after a later one
+    end_time = None if duration is None else time.time() + duration
+    try:
+        while end_time is None or time.time() < end_time:
+            result = receiver.receive()
+            if result is None:
+                continue
+            (header, frames, runs) = result
+            if recording is None:
+                columns = [COLUMN_NAMES['excel']] + ["channel " + str(i) for i in range(header.channels)] \
+                          + ["Reference data"]
+                recording = RecordingWriter(filename, columns)
+            for (offset, count) in runs:
+                block = frames[offset:offset + count]
+                if block[0, 0] < latest and (earliest_late is None or block[0, 0] < earliest_late):
+                    earliest_late = block[0, 0]
+                latest = max(latest, block[-1, 0])
+                recording.append(block[:, 0], block[:, 1:-1], block[:, -1])
+            if on_datagram is not None:
+                on_datagram(header, frames)
+    finally:
+        if recording is not None:
+            recording.close()
+            if earliest_late is not None:
+                sort_recording(filename, earliest_late)
+
+
+def send_test_stream(ip, port, frames, channels=4, frames_per_datagram=None, interval=0.0, shuffle=False):
+    """
+    Send a synthetic stream of frames in the datagram format, e.g. to a Receiver on the loopback interface.
+    Every value of frame n is n, so received data can be checked easily.
+
+    :param ip: Target address
+    :type ip: str
+    :param port: Target port
+    :type port: int
+    :param frames: Number of frames to send
+    :type frames: int
+    :param channels: Number of channels per frame
+    :type channels: int
+    :param frames_per_datagram: Frames packed per datagram (default: as many as fit a 1500 byte MTU)
+    :type frames_per_datagram: int
+    :param interval: Pause between datagrams (seconds)
+    :type interval: float
+    :param shuffle: Send the second datagram twice and swap the third and fourth, so a receiver must count one
+    duplicated datagram and one reordered datagram (and nothing lost)
+    :type shuffle: bool
+    :return: Number of datagrams sent
+    :rtype: int
+    """
+    if frames_per_datagram is None:
+        frames_per_datagram = udppacket.frames_per_datagram(channels)
+    block = numpy.repeat(numpy.arange(frames, dtype=float)[:, numpy.newaxis], channels + 2, axis=1)
+    starts = list(range(0, frames, frames_per_datagram))
+    if shuffle and len(starts) >= 4:
+        starts[1:4] = [starts[1], starts[1], starts[3], starts[2]]
+
+    datagrams = 0
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp_socket:
+        for start in starts:
+            udp_socket.sendto(udppacket.encode(start, time.time(), block[start:start + frames_per_datagram]),
+                              (ip, port))
+            datagrams += 1
+            if interval > 0:
+                time.sleep(interval)
+    return datagrams
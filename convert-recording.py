@@ -0,0 +1,23 @@
+# Python 3.7
+# Encoding: UTF-8
+# Date created: 17.10.2026
+# Author: Robert Simpson (robert_zwilling@web.de)
+# License: MIT
+
+# Convert a binary recording (*.rec, see common/recording.py) into the csv layout written in normal mode.
+# Usage: python3 ./convert-recording.py <recording.rec> [output.csv]
+
+import os
+import sys
+
+from common import recording
+
+if len(sys.argv) < 2:
+    print("Usage: " + sys.argv[0] + " <recording.rec> [output.csv]")
+    exit(1)
+
+source = sys.argv[1]
+target = sys.argv[2] if len(sys.argv) >= 3 else os.path.splitext(source)[0] + ".csv"
+
+frames = recording.convert_to_csv(source, target)
+print("Converted " + str(frames) + " frames to " + target)
@@ -1,4 +1,4 @@
-# Python 3.6
+# Python 3.7
 # Encoding: UTF-8
 # Date created: 26.06.2018
 # Author: Robert Simpson (robert_zwilling@web.de)
@@ -7,49 +7,115 @@
 
 import datetime
 import numpy
-import collections
 import threading
+import time
+import multiprocessing
 import os
 import ipaddress
 import json
+import types
 from PyQt5 import QtGui
 
 from Phidget22.Devices.Manager import *
 from Phidget22.Phidget import *
+from Phidget22.PhidgetSupport import PhidgetSupport
+from Phidget22.PhidgetSimulator import PhidgetSimulator
 
 import PhidgetBridge4Input
 
 from threads import filewriter, udpwriter, datasampler
 from sampledisplay import sample_display
-from common import boarddictionary
+from common import boarddictionary, recording
+from common.ringbuffer import RingBuffer
+from common.decimation import MinMaxPyramid
+from common.scheduler import DeadlineScheduler
+from common.calibration import OffsetCalibration, ChannelCalibration
+from common.reference import ReferenceTrajectory
+from common.timebase import TimeBase
+from common.filters import FilterChain, BiquadCascade, FirDecimator, butterworth_lowpass, lowpass_taps
+from common.trigger import TriggerCondition, TriggeredCapture
+from common.replay import Replay, replay_boards
+from common.backpressure import Backpressure
+from common import metrics
 
 ########### USER CONFIGURABLE VALUES ###########
 
 seconds_before_measurement = 15                 # how many seconds between measurement and appearance of desired value
 seconds_after_measurement = 5                   # how much time to be displayed after moment of measurement
+reference_interpolation = False                 # interpolate linearly between desired forces instead of holding them
 
 load_cell_gains = numpy.array([1.0, 1.0, 1.0, 1.0])   # calibrated gains for the four connected load cells (mV/V -> N)
-load_cell_gains *= 1000 * 490.5
+load_cell_gains *= 1000 * 490.5                 # (defaults for channels not listed in the calibration file)
+calibration_file = 'calibration.json'           # gain/offset/polynomial per board serial and channel, reloaded on change
+
+zeroing_seconds = 1.0                           # duration of automatic zeroing at start (load cells must be unloaded)
+zeroing_noise_limit = 1.0                       # warn if a channel's standard deviation while zeroing exceeds this (N)
 
 display_interval = 0.02                         # update display at 50 Hz
+display_channels = False                        # plot every channel instead of the sum of all channels of a board
 file_interval = 1.0                             # write results to file at 1 Hz
+fsync_interval = 10.0                           # force written results onto the disk every 10 s (None: leave to OS)
 udp_interval = 0.1                              # push data to udp-target at 10 Hz
+udp_mtu = 1500                                  # size datagrams to fit this MTU (up to 65535 to allow fragmentation)
+timestamp_format = 'excel'                      # csv timestamps: 'excel' (serial date), 'epoch' (s) or 'iso' (UTC)
+result_cache_seconds = 60.0                     # how long the writers may fall behind before results are lost
+backpressure_policy = 'drop'                    # writer behind: 'drop' oldest results, 'spill' to disk, 'block' sampler
+backpressure_high_water = 0.5                   # spill/block once a writer is behind by this fraction of the cache
+spill_directory = None                          # directory of the spill file (None: system temp directory)
+filter_cutoff = None                            # low-pass written/sent results at this frequency (Hz, None: no filter)
+filter_order = 4                                # order of the Butterworth low-pass
+decimation_factor = 1                           # write/send only every n-th frame (anti-alias filtered), 1: all frames
+trigger_conditions = []                         # record only around events, e.g. [('sum', 500.0, 'rising', False)]
+trigger_pre_seconds = 2.0                       # recorded history before each trigger event
+trigger_post_seconds = 5.0                      # recorded time after each trigger event
+simulated_serials = [1001, 1002]                # boards emulated in simulation-mode ('-simulate')
+replay_speed = 1.0                              # pace of '-replay <file>' relative to the recording, 0: max. speed
+replay_max_gap = None                           # shorten longer pauses of replayed recordings to this (s, None: keep)
+replay_loops = 1                                # number of times a recording is replayed (None: forever)
+metrics_port = 9188                             # serve metrics at http://127.0.0.1:<port>/metrics (None: no server)
+metrics_interval = 10.0                         # print a metrics summary line every 10 s (None: never)
+headless_boards = None                          # serials headless-mode waits for (None: all in board_dictionary.json)
+headless_attach_timeout = 60.0                  # exit if the expected boards are not attached within this time (s)
+headless_duration = None                        # stop headless-mode after this many seconds (None: at Ctrl+C)
+headless_udp_target = '192.168.1.98:25098'      # udp-target of headless-mode ('ip:port')
+headless_file_prefix = ''                       # prefix for filenames in headless-mode
 
 ################################################
 
+# values a run configuration file ('-config <file.json>') may set
+CONFIGURABLE_VALUES = (
+    'seconds_before_measurement', 'seconds_after_measurement', 'reference_interpolation', 'load_cell_gains',
+    'calibration_file', 'zeroing_seconds', 'zeroing_noise_limit', 'display_interval', 'display_channels',
+    'file_interval', 'fsync_interval', 'udp_interval', 'udp_mtu', 'timestamp_format', 'result_cache_seconds',
+    'backpressure_policy', 'backpressure_high_water', 'spill_directory', 'filter_cutoff', 'filter_order',
+    'decimation_factor', 'trigger_conditions', 'trigger_pre_seconds', 'trigger_post_seconds', 'simulated_serials',
+    'replay_speed', 'replay_max_gap', 'replay_loops', 'metrics_port', 'metrics_interval', 'headless_boards',
+    'headless_attach_timeout', 'headless_duration', 'headless_udp_target', 'headless_file_prefix')
+
 file_prefix = ""                                # prefix for filename
 
 udp_mode = False                                # set based on input argument '-udp'
 test_mode = False                               # set based on input argument '-test'
+event_mode = False                              # set based on input argument '-events'
+binary_mode = False                             # set based on input argument '-binary'
+process_mode = False                            # set based on input argument '-processes'
+headless_mode = False                           # set based on input argument '-headless'
 udp_ip = None                                   # address of udp-target in case udp-mode is active
 udp_port = 0                                    # port @ udp-target in case udp-mode is active
 
 sampling_interval = 0.008                       # sample at 125 Hz
-displayed_measurements = round(seconds_after_measurement / sampling_interval)
-result_cache = collections.deque()              # stores results before they are written to a file
-display_cache = None                            # shared store for displayed measurements
+displayed_measurements = None                   # length of the display caches, set when sampling starts
+result_cache = None                             # ring buffer storing results before they are written to a file
+preview_cache = None                            # bus carrying the current reference to the display process
+display_cache = None                            # shared stores for displayed measurements, one per board
 reference_cache = None                          # shared queue for reference values
 connected_boards = {}                           # dictionary of all connected PhidgetBridge4Input devices
+sampling_scheduler = DeadlineScheduler(sampling_interval)   # paces the sampler, its statistics are printed at exit
+calibration = None                              # offset calibration of all channels, can re-zero while sampling
+channel_calibration = None                      # conversion of voltage ratios into forces per channel
+backpressure = None                             # policy for writers falling behind, shared by writer and sampler
+writer = None                                   # writer thread (or process in process-mode)
+writer_stop = None                              # event telling the writer to write what is left and return
 
 STATE = "INIT"                       # INIT | WAITING | PREPARE-FOR-SAMPLING | SAMPLING | SHUTDOWN | ERROR
 
@@ -72,7 +138,7 @@ def AttachHandler(self, channel):
         (board_dict, separator) = boarddictionary.read_or_create()
 
         if str(serialNumber) in board_dict.keys():
-            new_board = PhidgetBridge4Input.PhidgetBridge4Input(serialNumber, board_dict[serialNumber], separator)
+            new_board = PhidgetBridge4Input.PhidgetBridge4Input(serialNumber, board_dict[str(serialNumber)], separator)
         else:
             new_board = PhidgetBridge4Input.PhidgetBridge4Input(serialNumber)
 
@@ -107,17 +173,144 @@ def LocalErrorCatcher(e):
 
 def __initialize_display_cache():
     global display_cache, displayed_measurements
-    display_cache = collections.deque(maxlen=displayed_measurements)
-    for i in range(0, displayed_measurements):
-        display_cache.append(0)
+    # computed here, a run configuration may have changed seconds_after_measurement
+    displayed_measurements = round(seconds_after_measurement / sampling_interval)
+    display_cache = [MinMaxPyramid(displayed_measurements, 4, with_sum=True) for board in connected_boards.values()]
+
+
+def __initialize_result_cache():
+    global result_cache
+    capacity = round(result_cache_seconds / sampling_interval)
+    if process_mode:
+        from common.sharedbus import SharedRingBuffer          # needs Python 3.8
+        result_cache = SharedRingBuffer.create(capacity, 4 * len(connected_boards))
+    else:
+        result_cache = RingBuffer(capacity, 4 * len(connected_boards))
+
+
+def __initialize_backpressure():
+    global backpressure
+    policy = backpressure_policy
+    if policy == 'block' and process_mode:
+        print("Backpressure policy 'block' needs the writer in the sampling process, spilling instead.")
+        policy = 'spill'
+    backpressure = Backpressure(policy, backpressure_high_water, spill_directory)
+
+
+def __initialize_preview_cache():
+    global preview_cache
+    from common.sharedbus import SharedRingBuffer
+    preview_cache = SharedRingBuffer.create(round(result_cache_seconds / sampling_interval), 1)
+
+
+def __initialize_calibration():
+    global calibration, channel_calibration
+    channel_calibration = ChannelCalibration(calibration_file, list(connected_boards.keys()), load_cell_gains)
+    calibration = OffsetCalibration(4 * len(connected_boards), zeroing_seconds, zeroing_noise_limit)
+
+
+def __start_replay(replay):
+    global calibration
+    # replayed values are already calibrated, re-zeroing from the display has no effect on them
+    calibration = OffsetCalibration(4 * len(connected_boards))
+    caches = [] if process_mode or headless_mode else display_cache
+    args = (backpressure.cache(result_cache), caches, reference_cache, preview_cache, replay_loops)
+    replay_thread = threading.Thread(target=replay.run, daemon=True, args=args)
+    replay_thread.start()
+
+
+def __start_metrics():
+    # in process-mode the writer and display processes count in registries of their own, which are not served
+    if metrics_port is not None:
+        try:
+            metrics.serve(metrics_port)
+        except OSError as e:
+            print("Cannot serve metrics on port " + str(metrics_port) + ": " + str(e))
+    if metrics_interval is not None:
+        metrics.start_reporter(metrics_interval, output=lambda line: print("Metrics: " + line))
+
+
+def __create_filters():
+    sample_rate = 1 / sampling_interval
+    stages = []
+    if filter_cutoff is not None:
+        stages.append(BiquadCascade(butterworth_lowpass(filter_order, filter_cutoff, sample_rate)))
+    if decimation_factor > 1:
+        taps = lowpass_taps(8 * decimation_factor + 1, 0.4 * sample_rate / decimation_factor, sample_rate)
+        stages.append(FirDecimator(taps, decimation_factor))
+    return FilterChain(stages) if len(stages) > 0 else None
+
+
+def __create_capture():
+    if len(trigger_conditions) == 0:
+        return None
+    frame_interval = sampling_interval * decimation_factor
+    conditions = [TriggerCondition(*condition) for condition in trigger_conditions]
+    return TriggeredCapture(conditions, int(round(trigger_pre_seconds / frame_interval)),
+                            int(round(trigger_post_seconds / frame_interval)))
 
 
 def __initialize_reference_cache():
     global reference_cache, seconds_after_measurement, seconds_before_measurement
-    reference_cache = collections.deque(maxlen=
-                                        round((seconds_before_measurement+seconds_after_measurement)/sampling_interval))
-    for i in range(0, reference_cache.maxlen):
-        reference_cache.append(0)
+    reference_cache = MinMaxPyramid(round((seconds_before_measurement+seconds_after_measurement)/sampling_interval))
+
+
+def __read_run_config(filename):
+    # settings of a run configuration file override the user configurable values, its 'arguments' are added to the
+    # command line arguments
+    try:
+        with open(filename) as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        print("Cannot read run configuration '" + filename + "': " + str(e) + ". Aborting.")
+        exit(1)
+
+    sys.argv.extend(config.pop('arguments', []))
+    for name, value in config.items():
+        if name not in CONFIGURABLE_VALUES:
+            print("Unknown setting '" + name + "' in " + filename + ". Aborting.")
+            exit(1)
+        globals()[name] = numpy.array(value) if name == 'load_cell_gains' else value
+
+
+def __wait_for_boards():
+    # wait until every expected board is attached, by default all boards listed in the board dictionary
+    expected = headless_boards
+    if expected is None:
+        (board_dict, _) = boarddictionary.read_or_create()
+        expected = [serial for serial in board_dict.keys() if serial.isdigit()]
+    expected = {str(serial) for serial in expected}
+    if len(expected) == 0:
+        print("No boards to wait for. List them in board_dictionary.json or with '-boards'. Exiting...")
+        exit(1)
+
+    print("Waiting for board(s) " + ", ".join(sorted(expected)) + ".")
+    deadline = time.monotonic() + headless_attach_timeout
+    while True:
+        missing = expected.difference(str(serial) for serial in connected_boards)
+        if len(missing) == 0:
+            return
+        if time.monotonic() > deadline:
+            print("Board(s) " + ", ".join(sorted(missing)) + " not attached within " + str(headless_attach_timeout)
+                  + " s. Exiting...")
+            exit(1)
+        time.sleep(0.1)
+
+
+def __run_headless():
+    # sample for the configured duration (or until Ctrl+C), then let the writer write what is left
+    try:
+        if headless_duration is not None:
+            print("Sampling for " + str(headless_duration) + " s. Press Ctrl+C to stop earlier.")
+            time.sleep(headless_duration)
+        else:
+            print("Sampling. Press Ctrl+C to stop.")
+            while True:
+                time.sleep(1.0)
+    except KeyboardInterrupt:
+        print("Interrupt caught. Finishing the run.")
+    writer_stop.set()
+    writer.join()
 
 
 def __read_desired_force():
@@ -136,28 +329,61 @@ def __read_desired_force():
 # Cleanup function
 def cleanup():
     print("Closing...")
+    if sampling_scheduler.ticks > 0:
+        print("Sampling: " + sampling_scheduler.summary())
     try:
         manager.close()
     except PhidgetException as e:
         LocalErrorCatcher(e)
 
+    # remove the shared memory of the sample buses
+    global result_cache, preview_cache
+    if process_mode:
+        for bus in (result_cache, preview_cache):
+            if bus is not None:
+                bus.close()
+    result_cache = preview_cache = None
+
 
 # ========= Main Code ==========
 def main(STATE, udp_mode, test_mode):
+    global process_mode, writer, writer_stop
 
     while True:
         if STATE == "INIT":
 
             # Check if operating in UDP-mode
-            if len(sys.argv) >= 2 and sys.argv[1] == '-udp':
+            if '-udp' in sys.argv:
                 udp_mode = True
 
             # Check if operating in TEST-mode
-            if len(sys.argv) >= 2 and sys.argv[1] == '-test':
+            if '-test' in sys.argv:
                 test_mode = True
 
-            # Change user queries based on mode (udp vs normal)
-            if udp_mode:
+            # Check if sampling should be driven by hardware events instead of polling
+            event_mode = '-events' in sys.argv
+
+            # Check if results should be recorded in the binary format instead of csv
+            binary_mode = '-binary' in sys.argv
+
+            # Check if writer and display should run in processes of their own
+            process_mode = '-processes' in sys.argv
+            if process_mode and sys.version_info < (3, 8):
+                print("'-processes' needs Python 3.8 or newer (shared memory). Exiting...")
+                exit(1)
+
+            # Check if a recording should be replayed instead of sampling boards
+            replay_file = sys.argv[sys.argv.index('-replay') + 1] if '-replay' in sys.argv else None
+            replay = None
+
+            # Change user queries based on mode (udp vs normal). Headless-mode asks nothing.
+            if udp_mode and headless_mode:
+                (ip_string, _, port_string) = headless_udp_target.rpartition(':')
+                udp_ip = ipaddress.IPv4Address(ip_string)
+                udp_port = int(port_string)
+                print("Sending to " + udp_ip.exploded + ":" + str(udp_port))
+
+            elif udp_mode:
 
                 # Query user for target ip
                 default_ip = "192.168.1.98"
@@ -184,7 +410,9 @@ def main(STATE, udp_mode, test_mode):
             else:
 
                 # Query user for file prefix
-                if not test_mode:
+                if headless_mode:
+                    file_prefix = headless_file_prefix
+                elif not test_mode:
                     file_prefix = input("Specify prefix for filename or press ENTER for no prefix:")
                 else:
                     file_prefix = ''
@@ -200,8 +428,18 @@ def main(STATE, udp_mode, test_mode):
 
         elif STATE == "WAITING":
 
+            # In replay-mode the recording takes the place of the boards
+            if replay_file is not None:
+                lead_frames = round(seconds_before_measurement / sampling_interval)
+                replay = Replay(replay_file, replay_speed, lead_frames=lead_frames, max_gap=replay_max_gap)
+                connected_boards.update(replay_boards(replay.columns))
+                print("Replaying " + str(len(connected_boards)) + " board(s) from '" + replay_file + "'")
+                STATE = "PREPARE-FOR-SAMPLING"
+                continue
+
             print("Ready. Waiting for PhidgetBridge 4-Input devices to be connected.")
-            print("Press ENTER to start sampling.")
+            if not headless_mode:
+                print("Press ENTER to start sampling.")
             print("")
 
             # Open the manager. From now on it will call the attach and detach callback functions if Phidgets are
@@ -222,8 +460,12 @@ def main(STATE, udp_mode, test_mode):
                 print("Device 'FAKE' attached, Serial Number: 1337")
                 connected_boards['1337'] = PhidgetBridge4Input.PhidgetBridge4Input(1337, name='Fake', virtual=True)
 
+            # In headless-mode sampling starts as soon as the expected boards are attached
+            if headless_mode and not test_mode:
+                __wait_for_boards()
+
             # Wait for user to press ENTER to start sampling
-            while True and not test_mode:
+            while True and not test_mode and not headless_mode:
                 input("")
                 if len(connected_boards) == 0:
                     print("Cannot start sampling: No boards are connected!")
@@ -236,54 +478,86 @@ def main(STATE, udp_mode, test_mode):
 
         elif STATE == "PREPARE-FOR-SAMPLING":
 
-            # prepare display-cache
+            # prepare caches. In process-mode the display process keeps its own display caches, headless-mode has no
+            # display at all.
             __initialize_display_cache()
             __initialize_reference_cache()
+            __initialize_result_cache()
+            __initialize_backpressure()
+            if process_mode:
+                __initialize_preview_cache()
 
-            # read desired force
-            desired_force_vector = __read_desired_force()
+            # read desired force (replayed recordings bring their own reference)
+            if replay is None:
+                desired_force_vector = ReferenceTrajectory(__read_desired_force(), reference_interpolation)
 
-            # open and prepare file if not in udp mode
-            if not udp_mode:
+            # Compute column headers (time, all channels, reference). Binary recordings always hold excel serial dates.
+            timebase = TimeBase(timestamp_format)
+            columns = recording.column_names(connected_boards, None if binary_mode else timebase)
 
-                # Compute name for csv output file
-                filename = file_prefix + datetime.datetime.now().strftime("%Y-%m-%d %H_%M_%S") + ".csv"
-
-                # Compute header for csv output file (column headers)
-                header = "time (excel-format)"
-                for serial_nr, board in connected_boards.items():
-                    for i in range(0, 4):
-                        header = header + ", " + board.name + board.name_separator + str(board.channel_names[i]) + " (mV/V)"
+            # open and prepare file if not in udp mode. Binary recordings are created by their writer.
+            if not udp_mode:
 
-                # add reference header
-                header = header + ", Reference data"
+                # Compute name for output file
+                filename = file_prefix + datetime.datetime.now().strftime("%Y-%m-%d %H_%M_%S")
+                filename += ".rec" if binary_mode else ".csv"
 
-                # Create file and write header
-                with open(filename, 'w+') as file:
-                    file.write(header + "\n")
+                # Create csv file and write header
+                if not binary_mode:
+                    with open(filename, 'w+') as file:
+                        file.write(", ".join(columns) + "\n")
 
             # Set up separate worker-thread that executes the writer function. It will write sampled data from the
             # cache to the file created above in regular intervals to reduce file operations. In normal mode, the
             # thread will execute the file_writer method. In udp-mode, it will execute the udp_writer method.
+            # In process-mode the writer runs in a process of its own and attaches to the result cache by name.
             if udp_mode:
                 target = udpwriter.thread_method
-                args = (udp_ip, udp_port, result_cache, udp_interval)
+                kwargs = dict(ip=udp_ip, port=udp_port, interval=udp_interval, mtu=udp_mtu)
+            elif binary_mode:
+                target = filewriter.binary_thread_method
+                kwargs = dict(filename=filename, columns=columns, interval=file_interval, fsync_interval=fsync_interval,
+                              capture=__create_capture())
             else:
                 target = filewriter.thread_method
-                args = (filename, result_cache, file_interval)
-            writer_thread = threading.Thread(target=target, daemon=True, args=args)
-            writer_thread.start()
-
-            # Set up thread to do the actual sampling
-            target = datasampler.thread_method
-            args = (connected_boards, desired_force_vector, display_cache,
-                    result_cache, reference_cache, load_cell_gains, seconds_before_measurement, sampling_interval)
-            sampler_thread = threading.Thread(target=target, daemon=True, args=args)
-            sampler_thread.start()
+                kwargs = dict(filename=filename, interval=file_interval, fsync_interval=fsync_interval,
+                              capture=__create_capture())
+            kwargs['filters'] = __create_filters()
+            kwargs['timebase'] = timebase
+            kwargs['backpressure'] = backpressure
+            writer_stop = kwargs['stop'] = multiprocessing.Event() if process_mode else threading.Event()
+            if process_mode:
+                from common import sharedbus
+                writer = multiprocessing.Process(target=sharedbus.process_method, daemon=True,
+                                                 args=(target, {'result_cache': result_cache.name}, kwargs))
+            else:
+                writer = threading.Thread(target=target, daemon=True, kwargs=dict(kwargs, result_cache=result_cache))
+            writer.start()
+
+            # Set up the actual sampling. In event-mode the channels' change events drive sampling and no thread is
+            # needed. Virtual boards have no events, so test-mode always polls. In replay-mode a thread pushes the
+            # recorded frames instead.
+            if replay is not None:
+                __start_replay(replay)
+                STATE = "SAMPLING"
+                continue
+            __initialize_calibration()
+            args = (connected_boards, desired_force_vector, [] if process_mode or headless_mode else display_cache,
+                    backpressure.cache(result_cache), reference_cache, channel_calibration, seconds_before_measurement,
+                    sampling_interval)
+            kwargs = dict(preview_cache=preview_cache, calibration=calibration)
+            if event_mode and not test_mode:
+                datasampler.event_method(*args, **kwargs)
+            else:
+                target = datasampler.thread_method
+                kwargs['scheduler'] = sampling_scheduler
+                sampler_thread = threading.Thread(target=target, daemon=True, args=args, kwargs=kwargs)
+                sampler_thread.start()
 
             STATE = "SAMPLING"
 
         elif STATE == "SAMPLING":
+            __start_metrics()
             return
             pass
 
@@ -295,6 +569,21 @@ def main(STATE, udp_mode, test_mode):
 
 
 if __name__ == '__main__':
+    # A run configuration file may set any of the user configurable values and add command line arguments
+    if '-config' in sys.argv:
+        __read_run_config(sys.argv[sys.argv.index('-config') + 1])
+
+    # Check if running without display and user input, and for the settings of headless-mode on the command line
+    headless_mode = '-headless' in sys.argv
+    if '-duration' in sys.argv:
+        headless_duration = float(sys.argv[sys.argv.index('-duration') + 1])
+    if '-boards' in sys.argv:
+        headless_boards = sys.argv[sys.argv.index('-boards') + 1].split(',')
+
+    # In simulation-mode the Phidget22 bindings talk to emulated boards instead of libphidget22
+    if '-simulate' in sys.argv:
+        PhidgetSupport.useLibrary(PhidgetSimulator(simulated_serials))
+
     # Create manager
     try:
         manager = Manager()
@@ -304,7 +593,7 @@ if __name__ == '__main__':
 
     # Dick-swinging and license stuff
     os.system('cls')
-    print("Python 3.6 Phidget Bridge Interface with multi-board capability")
+    print("Python 3.7 Phidget Bridge Interface with multi-board capability")
     print("")
     print("Author: Robert Simpson (robert_zwilling@web.de)")
     print("Copyright: (c) 2018, Robert Simpson")
@@ -314,12 +603,30 @@ if __name__ == '__main__':
     # Main loop with keyboard-interrupt (Ctrl+C) handling
     try:
         main(STATE, udp_mode, test_mode)
-        app = QtGui.QApplication(sys.argv)
-        form = sample_display.SampleDisplay(display_cache, reference_cache, connected_boards, sampling_interval,
-                                            seconds_before_measurement, seconds_after_measurement)
-        form.show()
-        form.update()  # start with something
-        app.exec_()
+        if headless_mode:
+            __run_headless()
+            cleanup()
+        elif process_mode:
+            # The display runs in its own process, fed from the sample buses. Boards cannot be shared across processes,
+            # only their names are passed on.
+            boards = {serial: types.SimpleNamespace(name=board.name) for serial, board in connected_boards.items()}
+            kwargs = dict(boards=boards, sampling_interval=sampling_interval,
+                          seconds_before=seconds_before_measurement, seconds_after=seconds_after_measurement,
+                          display_interval=display_interval, show_channels=display_channels)
+            from common import sharedbus
+            display_process = multiprocessing.Process(target=sharedbus.process_method, args=(
+                sample_display.process_method,
+                {'result_cache': result_cache.name, 'preview_cache': preview_cache.name}, kwargs))
+            display_process.start()
+            display_process.join()
+            cleanup()
+        else:
+            app = QtGui.QApplication(sys.argv)
+            form = sample_display.SampleDisplay(display_cache, reference_cache, connected_boards, sampling_interval,
+                                                seconds_before_measurement, seconds_after_measurement, display_interval,
+                                                display_channels, calibration.rezero)
+            form.show()
+            app.exec_()
     except KeyboardInterrupt:
         print("Interrupt caught. Shutting down.")
         cleanup()
@@ -328,5 +635,5 @@ if __name__ == '__main__':
         cleanup()
         sys.exit(e)
 
-    print("Window closed. Shutting down.")
+    print("Run finished. Shutting down." if headless_mode else "Window closed. Shutting down.")
     exit(0)
@@ -1,4 +1,4 @@
-# Python 3.6
+# Python 3.7
 # Encoding: UTF-8
 # Date created: 31.07.2018
 # Author: Robert Simpson (robert_zwilling@web.de)
@@ -10,6 +10,9 @@ from PyQt5 import QtGui, QtCore, QtWidgets
 import sampledisplay.ui_main as ui_main
 import numpy
 import pyqtgraph
+import time
+from common.decimation import MinMaxPyramid
+from common import metrics
 
 
 class SampleDisplay(QtGui.QMainWindow, ui_main.Ui_MainWindow):
@@ -22,27 +25,27 @@ class SampleDisplay(QtGui.QMainWindow, ui_main.Ui_MainWindow):
                    pyqtgraph.mkColor(107,  76, 154)]        # purple
     # colors taken from: http://ksrowell.com/blog-visualizing-data/2012/02/02/optimal-colors-for-graphs/
 
-    measurement_pens = [pyqtgraph.mkPen(color=plot_colors[0], width=3),
-                        pyqtgraph.mkPen(color=plot_colors[1], width=3),
-                        pyqtgraph.mkPen(color=plot_colors[2], width=3),
-                        pyqtgraph.mkPen(color=plot_colors[5], width=3)]
-    reference_pen = pyqtgraph.mkPen(color=plot_colors[3], width=3)
+    line_width = 3                                          # width of all curves with few boards
+    line_width_many_boards = 1                              # Qt draws wide lines much slower, so thin them out
+    many_boards = 4                                         # more boards than this use the thin lines
+
+    y_range = (-20, 500)                                    # <<< adjust YLIM here
 
     def __init__(self, display_cache, reference_cache, connected_boards, sampling_interval, seconds_before,
-                 seconds_after):
+                 seconds_after, display_interval=0.02, show_channels=False, rezero=None, registry=None):
         """
-        Create a Qt window with a number of PlotWidgets. The position where the sampled data starts
+        Create a Qt window with one plot per connected board. The position where the sampled data starts
         at can be controlled with the seconds_before and seconds_after parameters. Data to be displayed must be provided
-        through the display_cache deque. Every entry in this queue consists of a multiple of 4 values, belonging to the
-        4 channels of the connected boards.
-        NOTE: The plot titles can be adjusted by supplying different names for the connected boards via board_names.
-        There must be a name for each connected board though, and the ordering of names must match the ordering of
-        values in the display_cache.
-
-        :param display_cache: Shared cache of data to be displayed.
-        :type display_cache: collections.deque
+        through the display_cache, which holds one history of all 4 channels per board. Every plot shows the sum of the
+        4 channels of its board (or every channel if show_channels is set) together with the reference. The plots are
+        redrawn every display_interval.
+        NOTE: The plot titles are the names of the connected boards. The ordering of the boards in connected_boards
+        must match the ordering of the histories in the display_cache.
+
+        :param display_cache: Shared caches of data to be displayed, one per board, with a sum column.
+        :type display_cache: list of MinMaxPyramid
         :param reference_cache: Shared cache of reference data to be displayed.
-        :type reference_cache: collections.deque
+        :type reference_cache: MinMaxPyramid
         :param connected_boards: Dict of connected boards
         :type connected_boards: dict
         :param sampling_interval: Time between samples (in seconds)
@@ -51,6 +54,14 @@ class SampleDisplay(QtGui.QMainWindow, ui_main.Ui_MainWindow):
         :type seconds_before: float
         :param seconds_after: Distance of the sampling data to the left border of its PlotWidget (in seconds)
         :type seconds_after: float
+        :param display_interval: Time between redraws (in seconds)
+        :type display_interval: float
+        :param show_channels: Plot every channel instead of the sum of all channels of a board
+        :type show_channels: bool
+        :param rezero: Called when the user presses 'Z' to zero all channels again (None: no re-zeroing)
+        :type rezero: function
+        :param registry: Metrics registry the display counts its frames in (default: metrics.REGISTRY)
+        :type registry: MetricsRegistry
         """
         # initialization of instance variables
         self.display_cache = display_cache
@@ -60,43 +71,113 @@ class SampleDisplay(QtGui.QMainWindow, ui_main.Ui_MainWindow):
         self.seconds_before = seconds_before
         self.seconds_after = seconds_after
         self.sampling_interval = sampling_interval
-        self.timerange_measurements = numpy.arange(0, self.seconds_after, self.sampling_interval)[::-1]
-        self.timerange_reference = numpy.arange(-self.seconds_before, self.seconds_after, self.sampling_interval)[::-1]
+        self.show_channels = show_channels
+        self.displayed_measurements = len(numpy.arange(0, self.seconds_after, self.sampling_interval))
+        self.displayed_reference = len(numpy.arange(-self.seconds_before, self.seconds_after, self.sampling_interval))
+        self.frame_time = 0.0                   # smoothed time needed to draw one frame (in seconds)
+        self.frame_time_max = 0.0
+        if registry is None:
+            registry = metrics.REGISTRY
+        self.frames_drawn = registry.counter('display_frames_total', "Frames drawn by the display", short='drawn')
+        self.frame_times = registry.histogram('display_frame_seconds', "Time to draw one frame", short='frame')
 
         # initializing
         pyqtgraph.setConfigOption('background', 'w')
         super(SampleDisplay, self).__init__(None)
         self.setupUi(self)
 
-        # dynamically create plots based on the number of sources
+        width = self.line_width if self.num_boards <= self.many_boards else self.line_width_many_boards
+        measurement_pens = [pyqtgraph.mkPen(color=self.plot_colors[i], width=width) for i in (0, 1, 2, 5)]
+        reference_pen = pyqtgraph.mkPen(color=self.plot_colors[3], width=width)
+
+        # All plots live in one GraphicsLayoutWidget, arranged in a grid, which is much cheaper to repaint than one
+        # PlotWidget per board. Curves are created once, update() only replaces their data.
+        self.layout_widget = pyqtgraph.GraphicsLayoutWidget(self.centralwidget)
+        self.horizontalLayout.addWidget(self.layout_widget)
+        columns = int(numpy.ceil(numpy.sqrt(self.num_boards)))
+
         self.plots = []
+        self.measurement_curves = []
+        self.reference_curves = []
         for source_index, (source_name, source) in enumerate(connected_boards.items()):
-            self.plots.append(pyqtgraph.PlotWidget(self.centralwidget))
-            plot = self.plots[source_index]
-            self.horizontalLayout.addWidget(plot)
-            plot.plotItem.showGrid(True, True, 0.7)
-            plot.plotItem.invertX()
-            plot.plotItem.setXRange(-seconds_before, seconds_after, padding=0)
-            plot.plotItem.setTitle(source_name)
+            plot = self.layout_widget.addPlot(row=source_index // columns, col=source_index % columns)
+            self.plots.append(plot)
+            plot.showGrid(True, True, 0.7)
+            plot.invertX()
+            plot.setXRange(-seconds_before, seconds_after, padding=0)
+            plot.setYRange(*self.y_range, padding=0)
+            plot.disableAutoRange()
+            plot.setTitle(source.name)
+            plot.setClipToView(True)
+
+            curves = 4 if show_channels else 1
+            self.measurement_curves.append([plot.plot(pen=measurement_pens[i]) for i in range(curves)])
+            self.reference_curves.append(plot.plot(pen=reference_pen))
+
+        if rezero is not None:
+            self.rezero_shortcut = QtWidgets.QShortcut(QtGui.QKeySequence('Z'), self)
+            self.rezero_shortcut.activated.connect(rezero)
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.update)
+        self.timer.start(round(display_interval * 1000))
 
     def update(self):
         """
-        Displays data currently stored in data_queues once
+        Displays data currently stored in the display and reference caches once
         :return: nothing
         :rtype: None
         """
-
-        data = numpy.array(self.display_cache)
-
-        # plot measurement data (currently sum of all 4 inputs of first connected board)
-        self.plots[0].plot(self.timerange_measurements, data,
-                           pen=self.measurement_pens[0], clear=True)
-
-        # plot reference data
-        self.plots[0].plot(self.timerange_reference, numpy.array(self.reference_cache),
-                           pen=self.reference_pen, clear=False)
-
-        self.plots[0].setYRange(-20, 500, padding=0)        # <<< adjust YLIM here
-        self.plots[0].setXRange(-self.seconds_before, self.seconds_after, padding=0)
-
-        QtCore.QTimer.singleShot(2, self.update)  # QUICKLY redraw (2ms intervals)
+        start = time.perf_counter()
+
+        # Get the windows from the min/max pyramids, reduced to about one point pair per pixel of the plot width. This
+        # also copies the data, the sampler keeps appending while the plots are drawn.
+        for board_cache, plot, curves, reference_curve in zip(self.display_cache, self.plots, self.measurement_curves,
+                                                              self.reference_curves):
+            pixels = max(1, int(plot.getViewBox().width()))
+            if self.show_channels:
+                for channel, curve in enumerate(curves):
+                    (ages, data) = board_cache.window(self.displayed_measurements, pixels, channel)
+                    curve.setData(ages * self.sampling_interval, data)
+            else:
+                (ages, data) = board_cache.window(self.displayed_measurements, pixels, -1)     # sum of all channels
+                curves[0].setData(ages * self.sampling_interval, data)
+
+            (ages, reference) = self.reference_cache.window(self.displayed_reference, pixels)
+            reference_curve.setData((ages * self.sampling_interval) - self.seconds_before, reference)
+
+        frame_time = time.perf_counter() - start
+        self.frame_time += 0.05 * (frame_time - self.frame_time)
+        self.frame_time_max = max(self.frame_time_max, frame_time)
+        self.frames_drawn.inc()
+        self.frame_times.observe(frame_time)
+        self.statusbar.showMessage("frame time: %.2f ms (max %.2f ms)"
+                                   % (self.frame_time * 1000, self.frame_time_max * 1000))
+
+
+def process_method(result_cache, preview_cache, boards, sampling_interval, seconds_before, seconds_after,
+                   display_interval=0.02, show_channels=False):
+    """
+    Run the display in its own process. The display caches are filled from the sample buses by a feeder thread of
+    this process, so repainting never delays sampling.
+
+    :param result_cache: Bus carrying the results of all channels
+    :type result_cache: SharedRingBuffer
+    :param preview_cache: Bus carrying the current reference as its only channel
+    :type preview_cache: SharedRingBuffer
+    :param boards: Boards to display, with a 'name' attribute each, in the ordering of the channels on the bus
+    :type boards: dict
+    :return: Nothing
+    :rtype: None
+    """
+    from common import sharedbus                # needs Python 3.8, only imported in process-mode
+    display_cache = [MinMaxPyramid(round(seconds_after / sampling_interval), 4, with_sum=True) for board in boards]
+    reference_cache = MinMaxPyramid(round((seconds_before + seconds_after) / sampling_interval))
+    sharedbus.start_feed_thread(result_cache, display_cache, display_interval)
+    sharedbus.start_feed_thread(preview_cache, [reference_cache], display_interval, columns=[0])
+
+    app = QtGui.QApplication([])
+    form = SampleDisplay(display_cache, reference_cache, boards, sampling_interval, seconds_before, seconds_after,
+                         display_interval, show_channels)
+    form.show()
+    app.exec_()
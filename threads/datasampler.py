@@ -1,14 +1,18 @@
-# Python 3.6
+# Python 3.7
 # Encoding: UTF-8
 # Date created: 31.07.2018
 # Author: Robert Simpson (robert_zwilling@web.de)
 # License: MIT
 
 import time
-import datetime
 import numpy
-import collections
+import threading
 from Phidget22.Phidget import *
+from Phidget22.Devices.VoltageRatioInputGroup import VoltageRatioInputGroup
+from common.scheduler import DeadlineScheduler
+from common.calibration import OffsetCalibration, ChannelCalibration
+from common.reference import ReferenceTrajectory
+from common import metrics
 
 
 def LocalErrorCatcher(e):
@@ -16,65 +20,244 @@ def LocalErrorCatcher(e):
     exit(1)
 
 
-# Convert datetime to excel-compatible serial time
-# source: https://stackoverflow.com/a/9574948
-def __excel_date(date1):
-    temp = datetime.datetime(1899, 12, 30)    # Note, not 31st Dec but 30th!
-    delta = date1 - temp
-    return float(delta.days) + (float(delta.seconds) / 86400) + (float(delta.microseconds) / (86400 * 1000 * 1000))
+def __channel_reader(connected_boards):
+    """
+    Build a function that reads all channels of all boards at once, ordered board by board.
+    Hardware boards are read through a single VoltageRatioInputGroup; virtual boards fall back to reading their
+    simulated channels one by one.
+
+    :param connected_boards: Dict of connected boards
+    :type connected_boards: dict
+    :return: Function without arguments returning the current voltage ratios as a NumPy array
+    :rtype: function
+    """
+    channels = [channel for board in connected_boards.values() for channel in board.channels]
+
+    if any(board.virtual for board in connected_boards.values()):
+        return lambda: numpy.array([channel.getVoltageRatio() for channel in channels])
+
+    return VoltageRatioInputGroup(channels).getVoltageRatios
+
+
+class SampleProcessor(object):
+    """
+    Turns raw voltage ratios of all channels into calibrated measurements and distributes them to the shared caches.
+    Used by both sampling engines, so polled and event-driven sampling produce identical output.
+    """
+
+    def __init__(self, connected_boards, desired_force_vector, display_cache, result_cache, reference_cache, gains,
+                 seconds_before_measurement, interval, preview_cache=None, calibration=None, registry=None):
+        if not isinstance(desired_force_vector, ReferenceTrajectory):
+            desired_force_vector = ReferenceTrajectory(desired_force_vector)
+        self.trajectory = desired_force_vector
+
+        if not isinstance(gains, ChannelCalibration):
+            # fixed gains per channel number, the same for every board
+            gains = ChannelCalibration(None, list(connected_boards.keys()), gains)
+        self.gains = gains
+        if calibration is None:
+            calibration = OffsetCalibration(4 * len(connected_boards))
+        self.calibration = calibration
+        self.display_cache = display_cache
+        self.result_cache = result_cache
+        self.reference_cache = reference_cache
+        self.reference_index = reference_cache.maxlen - round(seconds_before_measurement / interval)
+        self.preview_cache = preview_cache          # receives the current (not delayed) reference for the display
+        self.preview = numpy.zeros(1)
+
+        if registry is None:
+            registry = metrics.REGISTRY
+        self.frames = registry.counter('sampler_frames_total', "Frames processed by the sampler", short='frames')
+        self.process_time = registry.histogram('sampler_process_seconds', "Time to convert and distribute one frame",
+                                               short='process')
+
+    def process(self, ratios, timestamp, time_elapsed):
+        """
+        Process one frame of voltage ratios.
+
+        :param ratios: Voltage ratios of all channels, ordered board by board
+        :type ratios: numpy.ndarray
+        :param timestamp: Timestamp of the frame (time.monotonic_ns(), converted by the writers)
+        :type timestamp: int
+        :param time_elapsed: Seconds since the start of sampling
+        :type time_elapsed: float
+        :return: Nothing
+        :rtype: None
+        """
+        start = time.perf_counter()
+
+        # convert all channels with their own calibration, picking up edits of the calibration file while sampling
+        self.gains.check_for_changes(time_elapsed)
+        measurements = self.gains.apply(ratios)
+
+        # automatically calibrate offsets during the warm-up after start of sampling (and whenever re-zeroing)
+        self.calibration.apply(measurements, time_elapsed)
+
+        for board_index, board_cache in enumerate(self.display_cache):
+            board_cache.append(measurements[4 * board_index:4 * board_index + 4])
+
+        # look up the desired force for the current time
+        desired_force = self.trajectory.value(time_elapsed)
+        self.reference_cache.append(desired_force)
+
+        # store measurements also in the result-cache (take time offset of the reference into account)
+        reference = self.reference_cache[self.reference_index]
+        self.result_cache.write(timestamp, measurements, reference)
+
+        if self.preview_cache is not None:
+            self.preview[0] = desired_force
+            self.preview_cache.write(timestamp, self.preview, reference)
+
+        self.frames.inc()
+        self.process_time.observe(time.perf_counter() - start)
 
 
 def thread_method(connected_boards, desired_force_vector, display_cache, result_cache,
-                  reference_cache, gains, seconds_before_measurement, interval):
-    start_time = time.time()
+                  reference_cache, gains, seconds_before_measurement, interval, preview_cache=None, scheduler=None,
+                  calibration=None, registry=None):
+    """
+    Polling sampling engine, to be executed by the sampler thread. Reads all channels every interval. Ticks are paced
+    by a DeadlineScheduler, whose statistics can be read from other threads while sampling and are published in the
+    metrics registry (default: metrics.REGISTRY).
+    """
+    if scheduler is None:
+        scheduler = DeadlineScheduler(interval)
+    if registry is None:
+        registry = metrics.REGISTRY
 
-    array = numpy.array(desired_force_vector)
-    desired_force_t = collections.deque(array[:, 1])
-    desired_force_f = collections.deque(array[:, 0])
-    last_desired_force_output = 0
+    processor = SampleProcessor(connected_boards, desired_force_vector, display_cache, result_cache,
+                                reference_cache, gains, seconds_before_measurement, interval, preview_cache,
+                                calibration, registry)
+    read_channels = __channel_reader(connected_boards)
 
-    offset_cache = []
-    calibrated = False
-    static_offsets = [0, 0, 0, 0]
+    registry.counter('sampler_ticks_total', "Ticks of the polling sampler", function=lambda: scheduler.ticks)
+    registry.counter('sampler_overruns_total', "Ticks that started after their deadline", short='overruns',
+                     function=lambda: scheduler.overruns)
+    registry.counter('sampler_skipped_ticks_total', "Ticks dropped to catch up after overruns",
+                     function=lambda: scheduler.skipped)
+    registry.histogram('sampler_lateness_seconds', "Time between deadline and start of a tick",
+                       edges=scheduler.histogram_edges, short='late',
+                       source=lambda: (scheduler.histogram.tolist(), scheduler.lateness_sum, scheduler.lateness_max))
+    read_time = registry.histogram('sampler_read_seconds', "Time to read all channels once", short='read')
 
     while True:
         # write measurements only at selected frequency
-        time_elapsed = time.time() - start_time
-        time.sleep(interval - (time_elapsed % interval))
-
-        timestamp = __excel_date(datetime.datetime.now())
-        measurements = []
-
-        # Obtain measurements and store them in the display-chache
-        for board_index, (serial_no, board) in enumerate(connected_boards.items()):
-            for i in range(0, 4):
-                ratio = 0
-                try:
-                    ratio = board.channels[i].getVoltageRatio()
-                except PhidgetException as ex:
-                    LocalErrorCatcher(ex)
-                measurements.append(ratio * gains[i])
-
-        # automatically calibrate initial offset during first second after start of thread
-        if not calibrated:
-            offset_cache.append(measurements)
-            if time_elapsed >= 1:
-                data = numpy.array(offset_cache)
-                sums = numpy.sum(axis=0, a=data)
-                static_offsets = sums / len(offset_cache)
-                calibrated = True
-        else:
-            measurements -= static_offsets
-
-        display_cache.append(sum(measurements))
-
-        # See if a new desired force value is available for the current time. If not, keep adding the last value to the
-        # reference cache
-        if time_elapsed > desired_force_t[0]:
-            desired_force_t.popleft()
-            last_desired_force_output = desired_force_f.popleft()
-        reference_cache.append(last_desired_force_output)
-
-        # store measurements also in the result-cache
-        reference_index = reference_cache.maxlen - round(seconds_before_measurement / interval)  # take time offset into account
-        result_cache.appendleft((timestamp, measurements, reference_cache[reference_index]))  # writer pops from right
+        time_elapsed = scheduler.wait()
+
+        timestamp = time.monotonic_ns()
+        start = time.perf_counter()
+
+        # Obtain measurements of all channels at once
+        try:
+            ratios = read_channels()
+        except PhidgetException as ex:
+            LocalErrorCatcher(ex)
+        read_time.observe(time.perf_counter() - start)
+
+        processor.process(ratios, timestamp, time_elapsed)
+
+
+class FrameAssembler(object):
+    """
+    Collects voltage ratio change events of many channels into time-aligned frames.
+
+    A frame is complete as soon as every channel has reported a new value since the previous frame. Channels of a
+    board report together, but boards are not synchronized with each other, so a channel that reports twice before
+    the frame is complete only keeps its latest value (counted in 'merged'). If a channel stays silent for longer than
+    the timeout, the frame is emitted with that channel's previous value (counted in 'incomplete') so a stalled board
+    cannot stop the others.
+    """
+
+    def __init__(self, channel_count, on_frame, timeout):
+        """
+        :param channel_count: Number of channels per frame
+        :type channel_count: int
+        :param on_frame: Called with (ratios, time_elapsed) for every complete frame. Ratios are only valid during the
+        call.
+        :type on_frame: function
+        :param timeout: Maximum age of a pending frame before it is emitted incomplete (in seconds)
+        :type timeout: float
+        """
+        self.ratios = numpy.zeros(channel_count)
+        self.fresh = numpy.zeros(channel_count, dtype=bool)
+        self.pending = 0
+        self.frame_start = None
+        self.on_frame = on_frame
+        self.timeout = timeout
+        self.start_time = time.monotonic()
+        self.lock = threading.Lock()
+
+        self.frames = 0
+        self.merged = 0
+        self.incomplete = 0
+
+    def update(self, index, ratio):
+        """
+        Store a new value for one channel and emit the frame if it is complete.
+
+        :param index: Position of the channel in the frame
+        :type index: int
+        :param ratio: New voltage ratio of the channel
+        :type ratio: float
+        :return: Nothing
+        :rtype: None
+        """
+        with self.lock:
+            now = time.monotonic()
+            if self.pending == 0:
+                self.frame_start = now
+
+            self.ratios[index] = ratio
+            if self.fresh[index]:
+                self.merged += 1
+            else:
+                self.fresh[index] = True
+                self.pending += 1
+
+            if self.pending == len(self.fresh):
+                self.__emit(now)
+            elif now - self.frame_start > self.timeout:
+                self.incomplete += 1
+                self.__emit(now)
+
+    def __emit(self, now):
+        self.frames += 1
+        self.fresh[:] = False
+        self.pending = 0
+        self.on_frame(self.ratios, now - self.start_time)
+
+
+def event_method(connected_boards, desired_force_vector, display_cache, result_cache,
+                 reference_cache, gains, seconds_before_measurement, interval, preview_cache=None, calibration=None,
+                 registry=None):
+    """
+    Event-driven sampling engine. Subscribes to the voltage ratio change events of every channel and processes a frame
+    whenever all channels have delivered a new sample, so sampling follows the hardware data interval instead of a
+    polling thread. Returns immediately; frames are processed on the Phidget22 event threads.
+
+    :return: The frame assembler, whose counters can be inspected at runtime (and in the metrics registry)
+    :rtype: FrameAssembler
+    """
+    if registry is None:
+        registry = metrics.REGISTRY
+    processor = SampleProcessor(connected_boards, desired_force_vector, display_cache, result_cache,
+                                reference_cache, gains, seconds_before_measurement, interval, preview_cache,
+                                calibration, registry)
+
+    def on_frame(ratios, time_elapsed):
+        processor.process(ratios, time.monotonic_ns(), time_elapsed)
+
+    channels = [channel for board in connected_boards.values() for channel in board.channels]
+    assembler = FrameAssembler(len(channels), on_frame, timeout=2 * interval)
+    registry.counter('sampler_merged_samples_total', "Samples overwritten before their frame was complete",
+                     short='merged', function=lambda: assembler.merged)
+    registry.counter('sampler_incomplete_frames_total', "Frames emitted after a channel timed out",
+                     short='incomplete', function=lambda: assembler.incomplete)
+
+    for index, channel in enumerate(channels):
+        try:
+            channel.setOnVoltageRatioChangeHandler(lambda ch, ratio, index=index: assembler.update(index, ratio))
+        except PhidgetException as ex:
+            LocalErrorCatcher(ex)
+
+    return assembler
@@ -1,37 +1,178 @@
-# Python 3.6
+# Python 3.7
 # Encoding: UTF-8
 # Date created: 31.07.2018
 # Author: Robert Simpson (robert_zwilling@web.de)
 # License: MIT
 
+import os
 import time
+import numpy
+from common.recording import RecordingWriter, frame_block, format_csv_rows
+from common.filters import FilteredReader
+from common.trigger import TriggeredReader
+from common.timebase import TimeBase
+from common.backpressure import Backpressure
+from common import metrics
 
+WRITE_BUFFER_SIZE = 1 << 20         # bytes buffered by the open output file between flushes
 
-def thread_method(filename, result_cache, interval):
+
+def __writer_metrics(reader, registry):
+    """
+    Metrics of the file writer: the backlog of its reader and what it wrote.
+
+    :return: Counters of rows, bytes and fsyncs, and the histogram of the time spent per block
+    :rtype: tuple
+    """
+    if registry is None:
+        registry = metrics.REGISTRY
+    metrics.watch_reader(reader, 'filewriter', 'file', registry)
+    return (registry.counter('filewriter_rows_total', "Frames written to the output file", short='rows'),
+            registry.counter('filewriter_bytes_total', "Bytes written to the output file", short='bytes'),
+            registry.counter('filewriter_fsyncs_total', "Times the output file was forced onto the disk"),
+            registry.histogram('filewriter_write_seconds', "Time to convert, write and flush one block",
+                               short='write'))
+
+
+def thread_method(filename, result_cache, interval, fsync_interval=10.0, filters=None, timebase=None, capture=None,
+                  stop=None, registry=None, backpressure=None):
+    """
+    Method to be executed by writer_thread in normal mode. Periodically appends all new results to the csv file.
+    The file is opened once and kept open; every drained block is formatted in one go.
+    :param filename: Path of the csv file, already containing the column headers
+    :type filename: str
+    :param result_cache: Inter-thread buffer for measurement results
+    :type result_cache: RingBuffer
+    :param interval: Time between executions of this method
+    :type interval: float
+    :param fsync_interval: Minimum time between forcing written data onto the disk (None: never)
+    :type fsync_interval: float
+    :param filters: Filter chain applied to the results before writing (None: write them unfiltered)
+    :type filters: FilterChain
+    :param timebase: Conversion of the sampled (monotonic) timestamps, computed once per run (default: start now)
+    :type timebase: TimeBase
+    :param capture: Triggered capture; only frames inside its capture windows are written (None: write all frames)
+    :type capture: TriggeredCapture
+    :param stop: Once set, the results still in the cache and spill file are written and the method returns (None:
+    run forever)
+    :type stop: threading.Event
+    :param registry: Metrics registry the writer counts in (default: metrics.REGISTRY)
+    :type registry: MetricsRegistry
+    :param backpressure: Policy if the writer falls behind (default: drop the oldest results)
+    :type backpressure: Backpressure
+    :return: Nothing
+    :rtype: none
+    """
+    if timebase is None:
+        timebase = TimeBase()
+    if backpressure is None:
+        backpressure = Backpressure()
     start_time = time.time()
+    last_sync = start_time
+    reader = result_cache.reader()
+    (rows, written, fsyncs, write_time) = __writer_metrics(reader, registry)
+    reader = spool = backpressure.reader(reader, registry)
+    if filters is not None:
+        reader = FilteredReader(reader, filters)
+    if capture is not None:
+        reader = TriggeredReader(reader, capture)
+
+    with open(filename, 'a', buffering=WRITE_BUFFER_SIZE) as file:
+        while True:
+            # write measurements only at selected frequency, but catch up on spilled results without waiting
+            if spool.backlog == 0:
+                time.sleep(interval - ((time.time() - start_time) % interval))
+            stopping = stop is not None and stop.is_set()
+
+            # take all results not written yet from the shared cache
+            (timestamps, values, reference) = reader.read()
+            block_start = time.perf_counter()
+            if len(timestamps) > 0:
+                # timestamps are converted for the whole block; ISO timestamps are text and formatted separately
+                timestamps = timebase.convert(timestamps)
+                if timebase.timestamp_format == 'iso':
+                    text = format_csv_rows(numpy.column_stack((values, reference)), labels=timestamps)
+                else:
+                    text = format_csv_rows(frame_block(timestamps, values, reference))
+                written.inc(file.write(text))
+                rows.inc(len(timestamps))
+            file.flush()
+
+            if fsync_interval is not None and time.time() - last_sync >= fsync_interval:
+                os.fsync(file.fileno())
+                fsyncs.inc()
+                last_sync = time.time()
+            write_time.observe(time.perf_counter() - block_start)
+            if stopping and spool.caught_up:
+                spool.close()
+                return
+
+
+def binary_thread_method(filename, columns, result_cache, interval, fsync_interval=10.0, filters=None,
+                         timebase=None, capture=None, stop=None, registry=None, backpressure=None):
+    """
+    Method to be executed by writer_thread in binary mode. Periodically appends all new results to a binary recording
+    as one block of float64 frames. The recording is created by this method and kept open.
+    :param filename: Path of the recording to be created
+    :type filename: str
+    :param columns: Column names stored in the header of the recording
+    :type columns: list
+    :param result_cache: Inter-thread buffer for measurement results
+    :type result_cache: RingBuffer
+    :param interval: Time between executions of this method
+    :type interval: float
+    :param fsync_interval: Minimum time between forcing written data onto the disk (None: never)
+    :type fsync_interval: float
+    :param filters: Filter chain applied to the results before writing (None: write them unfiltered)
+    :type filters: FilterChain
+    :param timebase: Conversion of the sampled (monotonic) timestamps, computed once per run (default: start now)
+    :type timebase: TimeBase
+    :param capture: Triggered capture; only frames inside its capture windows are written (None: write all frames)
+    :type capture: TriggeredCapture
+    :param stop: Once set, the results still in the cache and spill file are written and the method returns (None:
+    run forever)
+    :type stop: threading.Event
+    :param registry: Metrics registry the writer counts in (default: metrics.REGISTRY)
+    :type registry: MetricsRegistry
+    :param backpressure: Policy if the writer falls behind (default: drop the oldest results)
+    :type backpressure: Backpressure
+    :return: Nothing
+    :rtype: none
+    """
+    if timebase is None:
+        timebase = TimeBase()
+    if backpressure is None:
+        backpressure = Backpressure()
+    start_time = time.time()
+    last_sync = start_time
+    reader = result_cache.reader()
+    (rows, written, fsyncs, write_time) = __writer_metrics(reader, registry)
+    reader = spool = backpressure.reader(reader, registry)
+    if filters is not None:
+        reader = FilteredReader(reader, filters)
+    if capture is not None:
+        reader = TriggeredReader(reader, capture)
+    recording = RecordingWriter(filename, columns)
 
     while True:
-        # write measurements only at selected frequency
-        time.sleep(interval - ((time.time() - start_time) % interval))
+        # write measurements only at selected frequency, but catch up on spilled results without waiting
+        if spool.backlog == 0:
+            time.sleep(interval - ((time.time() - start_time) % interval))
+        stopping = stop is not None and stop.is_set()
 
-        # pop as many results as possible from shared cache into local cache
-        samples = []
-        while True:
-            try:
-                samples.append(result_cache.pop())
-            except IndexError as e:
-                break
-
-        # prepare one long line to be written to the output-file
-        output = ""
-        for sample in samples:
-            output += str(sample[0])
-            for value in sample[1]:
-                output += ", " + str(value)
-            output += ", " + str(sample[2])     # reference data
-            output += "\n"
-
-        # write to file
-        with open(filename, 'a') as file:
-            file.write(output)
-            file.flush()
\ No newline at end of file
+        (timestamps, values, reference) = reader.read()
+        block_start = time.perf_counter()
+        if len(timestamps) > 0:
+            written.inc(recording.append(timebase.to_excel(timestamps), values, reference))
+            rows.inc(len(timestamps))
+
+        sync = fsync_interval is not None and time.time() - last_sync >= fsync_interval
+        recording.flush(sync)
+        if sync:
+            fsyncs.inc()
+            last_sync = time.time()
+        write_time.observe(time.perf_counter() - block_start)
+        if stopping and spool.caught_up:
+            spool.close()
+            recording.close()
+            return
@@ -1,83 +1,86 @@
-# Python 3.6
+# Python 3.7
 # Encoding: UTF-8
 # Date created: 31.07.2018
 # Author: Robert Simpson (robert_zwilling@web.de)
 # License: MIT
 
 import socket
-import struct
-import sys
 import time
+from common import udppacket
+from common.recording import frame_block
+from common.filters import FilteredReader
+from common.timebase import TimeBase
+from common.backpressure import Backpressure
+from common import metrics
 
 
-def __double_to_bytes(value, target_endianness=sys.byteorder):
+def thread_method(ip, port, result_cache, interval, mtu=1500, filters=None, timebase=None, stop=None, registry=None,
+                  backpressure=None):
     """
-    Convert a single floating point variable to a byte array. If necessary swap endianness for target system.
-    :param value: Value to be converted
-    :type value: float
-    :param target_endianness: Endianness of the target system. Defaults to the endianness of the executing machine.
-    Possible values are: 'big' or 'little'.
-    :type target_endianness: str
-    :return: Bytearray representing the input value in the target endian format
-    :rtype: bytearray
-    """
-    # get byte array in system endianness
-    byte_array = bytearray(struct.pack("d", value))
-
-    # swap endianness if necessary
-    self_endianness = sys.byteorder
-    if self_endianness != target_endianness:
-        byte_array = bytes[::-1]
-
-    return byte_array
-
-
-def __doubles_to_bytes(data, target_endianness=sys.byteorder):
-    """
-    Convert a single floating point number or a list of floating point numbers to a byte array in the target endianness.
-    :param data: Value(s) to be converted
-    :type data: float or list
-    :param target_endianness: Endianness of the target system. Defaults to the endianness of the executing machine.
-    Possible values are: 'big' or 'little'.
-    :type target_endianness: str
-    :return:
-    :rtype:
-    """
-    byte_array = bytearray()
-
-    if isinstance(data, list):
-        for value in data:
-            byte_array += __double_to_bytes(value, target_endianness)
-    else:
-        byte_array += __double_to_bytes(data, target_endianness)
-
-    return byte_array
-
-
-def thread_method(ip, port, result_cache, interval):
-    """
-    Method to be executed by writer_thread. Periodically push sampling-results to UDP-target.
+    Method to be executed by writer_thread. Periodically push sampling-results to UDP-target. All frames sampled
+    since the last push are packed into as few datagrams as the MTU allows (see common/udppacket.py).
     :param ip: IP-address of target computer
     :type ip: IPv4Address
     :param port: Port-number at target computer
     :type port: int
     :param result_cache: Inter-thread buffer for measurement results
-    :type result_cache: collections.deque
+    :type result_cache: RingBuffer
     :param interval: Time between executions of this method
     :type interval: float
+    :param mtu: Maximum transmission unit of the path to the target (in bytes)
+    :type mtu: int
+    :param filters: Filter chain applied to the results before sending (None: send them unfiltered)
+    :type filters: FilterChain
+    :param timebase: Conversion of the sampled (monotonic) timestamps, computed once per run (default: start now)
+    :type timebase: TimeBase
+    :param stop: Once set, the results still in the cache and spill file are sent and the method returns (None: run
+    forever)
+    :type stop: threading.Event
+    :param registry: Metrics registry the writer counts in (default: metrics.REGISTRY)
+    :type registry: MetricsRegistry
+    :param backpressure: Policy if the writer falls behind (default: drop the oldest results)
+    :type backpressure: Backpressure
     :return: Nothing
     :rtype: none
     """
+    if timebase is None:
+        timebase = TimeBase()
+    if backpressure is None:
+        backpressure = Backpressure()
     start_time = time.time()
+    if registry is None:
+        registry = metrics.REGISTRY
+    reader = result_cache.reader()
+    metrics.watch_reader(reader, 'udpwriter', 'udp', registry)
+    sent_frames = registry.counter('udpwriter_frames_total', "Frames sent to the UDP target")
+    datagrams = registry.counter('udpwriter_datagrams_total', "Datagrams sent to the UDP target", short='datagrams')
+    sent_bytes = registry.counter('udpwriter_bytes_total', "Bytes (UDP payload) sent to the UDP target")
+    send_time = registry.histogram('udpwriter_send_seconds', "Time to convert and send one block", short='send')
+    reader = spool = backpressure.reader(reader, registry)
+    if filters is not None:
+        reader = FilteredReader(reader, filters)
+    frames_per_datagram = udppacket.frames_per_datagram(result_cache.channels, mtu)
+    target = (ip.exploded, port)
+
     with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp_socket:
         while True:
-            # write measurements only at selected frequency
-            time.sleep(interval - ((time.time() - start_time) % interval))
+            # write measurements only at selected frequency, but catch up on spilled results without waiting
+            if spool.backlog == 0:
+                time.sleep(interval - ((time.time() - start_time) % interval))
+            stopping = stop is not None and stop.is_set()
 
-            # for as long as possible: pop a sample and send it over udp. if the cache is exhausted wait again.
-            while True:
-                try:
-                    (_, data) = result_cache.pop()  # ignore timestamp, only push results over udp
-                    udp_socket.sendto(__doubles_to_bytes(data, 'little'), (ip.exploded, port))
-                except IndexError as e:
-                    break
+            # send every frame not sent yet over udp. if the cache is exhausted wait again.
+            (timestamps, values, reference) = reader.read()
+            block = frame_block(timebase.to_excel(timestamps), values, reference)
+            sequence = reader.position - len(block)     # frames lost in the cache show up as a sequence gap
+            sent_at = time.time()
+            block_start = time.perf_counter()
+            for start in range(0, len(block), frames_per_datagram):
+                frames = block[start:start + frames_per_datagram]
+                sent_bytes.inc(udp_socket.sendto(udppacket.encode(sequence + start, sent_at, frames), target))
+                datagrams.inc()
+            sent_frames.inc(len(block))
+            send_time.observe(time.perf_counter() - block_start)
+            if stopping and spool.caught_up:
+                spool.close()
+                return
@@ -1,23 +1,84 @@
-# Python 3.6
+# Python 3.7
 # Encoding: UTF-8
 # Date created: 26.06.2018
 # Author: Robert Simpson (robert_zwilling@web.de)
 # License: MIT
 
-import socket
-import struct
+# Receive results pushed by main.py in udp-mode, report loss and latency statistics and optionally record them.
+# Run with -h for all options. With --loopback N the listener sends itself N synthetic frames over the loopback
+# interface, which checks the receive path without a sampling computer. One of its datagrams is sent twice and two are
+# swapped, and the loss, reordering and duplicate counts are checked at the end.
 
-UDP_IP = "192.168.0.4"
-UDP_PORT = 5005
-DOUBLES_TO_RECEIVE = 4      # number of double values to expect from one transmission
+import argparse
+import sys
+import threading
+import time
 
-sock = socket.socket(socket.AF_INET,        # Internet
-                     socket.SOCK_DGRAM)     # UDP
-sock.bind((UDP_IP, UDP_PORT))
+from common import udpreceiver, udppacket
 
-while True:
-    floats = []
-    data, addr = sock.recvfrom(1024)        # buffer size is 1024 bytes
-    for i in range(0, DOUBLES_TO_RECEIVE):
-        floats.append(struct.unpack('d', data[(8*i):(i*8)+8])[0])
-    print("received message: ", floats)
\ No newline at end of file
+UDP_IP = "0.0.0.0"
+UDP_PORT = 25098
+
+parser = argparse.ArgumentParser(description="Receive results pushed by main.py in udp-mode.")
+parser.add_argument('--ip', default=UDP_IP, help="local address to listen on (default: all interfaces)")
+parser.add_argument('--port', type=int, default=UDP_PORT, help="local port to listen on")
+parser.add_argument('--record', metavar='FILE', help="write all received frames to this binary recording")
+parser.add_argument('--duration', type=float, help="stop after this many seconds")
+parser.add_argument('--report', type=float, default=1.0, help="seconds between statistics lines")
+parser.add_argument('--print', action='store_true', dest='print_frames', help="print every received frame")
+parser.add_argument('--loopback', type=int, metavar='N', help="send N synthetic frames to the listener itself")
+args = parser.parse_args()
+
+receiver = udpreceiver.Receiver(args.ip, 0 if args.loopback else args.port, timeout=0.1)
+print("Listening on " + args.ip + ":" + str(receiver.port))
+
+duration = args.duration
+if args.loopback:
+    target_ip = "127.0.0.1" if args.ip in ("", "0.0.0.0") else args.ip
+    sender = threading.Thread(target=udpreceiver.send_test_stream, args=(target_ip, receiver.port, args.loopback),
+                              kwargs=dict(shuffle=True), daemon=True)
+    sender.start()
+    if duration is None:
+        duration = 2.0
+
+last_report = [time.time()]
+
+
+def on_datagram(header, frames):
+    if args.print_frames:
+        for frame in frames:
+            print("received frame: ", frame.tolist())
+    if time.time() - last_report[0] >= args.report:
+        last_report[0] = time.time()
+        print(receiver.statistics.summary())
+
+
+try:
+    if args.record is not None:
+        udpreceiver.receive_to_recording(receiver, args.record, duration, on_datagram)
+    else:
+        end_time = None if duration is None else time.time() + duration
+        while end_time is None or time.time() < end_time:
+            result = receiver.receive()
+            if result is not None:
+                (header, frames, _) = result
+                on_datagram(header, frames)
+except KeyboardInterrupt:
+    pass
+finally:
+    receiver.close()
+
+print(receiver.statistics.summary())
+
+# The loopback stream duplicates its second datagram and swaps the third and fourth
+if args.loopback:
+    statistics = receiver.statistics
+    per_datagram = udppacket.frames_per_datagram(4)
+    duplicated = per_datagram if args.loopback > 3 * per_datagram else 0
+    expected = dict(frames=args.loopback + duplicated, lost=0, reordered=1 if duplicated > 0 else 0,
+                    duplicates=duplicated, untracked=0, malformed=0)
+    found = {name: getattr(statistics, name) for name in expected}
+    if found != expected:
+        print("Self-test FAILED: expected " + str(expected) + ", found " + str(found))
+        sys.exit(1)
+    print("Self-test passed.")